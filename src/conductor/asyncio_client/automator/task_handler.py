@@ -4,21 +4,31 @@ import asyncio
 import importlib
 import logging
 import os
+import time
 from multiprocessing import Process, Queue, freeze_support, set_start_method
 from sys import platform
 from typing import List, Optional
 
 from conductor.asyncio_client.automator.task_runner import AsyncTaskRunner
+from conductor.asyncio_client.automator.task_runner_group import \
+    AsyncTaskRunnerGroup
 from conductor.asyncio_client.configuration.configuration import Configuration
 from conductor.asyncio_client.telemetry.metrics_collector import \
     AsyncMetricsCollector
 from conductor.asyncio_client.worker.worker import Worker
 from conductor.asyncio_client.worker.worker_interface import WorkerInterface
+from conductor.shared.automator.shutdown import on_shutdown_signal
 from conductor.shared.configuration.settings.metrics_settings import \
     MetricsSettings
+from conductor.shared.configuration.settings.shutdown_settings import \
+    ShutdownSettings
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
+# one process per worker, or workers sharing an event loop per process
+PROCESS_MODE = "process"
+LOOP_MODE = "loop"
+
 _decorated_functions = {}
 _mp_fork_set = False
 if not _mp_fork_set:
@@ -38,7 +48,15 @@ if not _mp_fork_set:
 
 
 def register_decorated_fn(
-    name: str, poll_interval: int, domain: str, worker_id: str, func
+    name: str,
+    poll_interval: int,
+    domain: str,
+    worker_id: str,
+    func,
+    concurrency: int = 1,
+    executor_type: str = "thread",
+    adaptive_polling: bool = False,
+    max_poll_interval: int = 5000,
 ):
     logger.info("decorated %s", name)
     _decorated_functions[(name, domain)] = {
@@ -46,6 +64,10 @@ def register_decorated_fn(
         "poll_interval": poll_interval,
         "domain": domain,
         "worker_id": worker_id,
+        "concurrency": concurrency,
+        "executor_type": executor_type,
+        "adaptive_polling": adaptive_polling,
+        "max_poll_interval": max_poll_interval,
     }
 
 
@@ -57,8 +79,14 @@ class TaskHandler:
         metrics_settings: Optional[MetricsSettings] = None,
         scan_for_annotated_workers: bool = True,
         import_modules: Optional[List[str]] = None,
+        worker_mode: str = PROCESS_MODE,
+        process_count: int = 1,
+        shutdown_settings: Optional[ShutdownSettings] = None,
     ):
+        if worker_mode not in (PROCESS_MODE, LOOP_MODE):
+            raise Exception(f"Invalid worker mode: {worker_mode}")
         workers = workers or []
+        self.shutdown_settings = shutdown_settings
         self.logger_process, self.queue = _setup_logging_queue(configuration)
 
         # imports
@@ -83,13 +111,24 @@ class TaskHandler:
                     worker_id=worker_id,
                     domain=domain,
                     poll_interval=poll_interval,
+                    concurrency=record.get("concurrency"),
+                    executor_type=record.get("executor_type"),
+                    adaptive_polling=record.get("adaptive_polling", False),
+                    max_poll_interval=record.get("max_poll_interval"),
                 )
                 logger.info(
                     "created worker with name=%s and domain=%s", task_def_name, domain
                 )
                 workers.append(worker)
 
-        self.__create_task_runner_processes(workers, configuration, metrics_settings)
+        if worker_mode == LOOP_MODE:
+            self.__create_task_runner_group_processes(
+                workers, configuration, metrics_settings, process_count, shutdown_settings
+            )
+        else:
+            self.__create_task_runner_processes(
+                workers, configuration, metrics_settings, shutdown_settings
+            )
         self.__create_metrics_provider_process(metrics_settings)
         logger.info("TaskHandler initialized")
 
@@ -105,7 +144,10 @@ class TaskHandler:
         asyncio.run(coroutine)
 
     def stop_processes(self) -> None:
-        self.__stop_task_runner_processes()
+        if self.shutdown_settings is not None:
+            self.__drain_task_runner_processes()
+        else:
+            self.__stop_task_runner_processes()
         self.__stop_metrics_provider_process()
         logger.info("Stopped worker processes...")
         self.queue.put(None)
@@ -119,6 +161,9 @@ class TaskHandler:
         logger.info("Started all processes")
 
     def join_processes(self) -> None:
+        if self.shutdown_settings is not None:
+            # containers are stopped with SIGTERM to the main process only
+            on_shutdown_signal(self.stop_processes)
         try:
             self.__join_task_runner_processes()
             self.__join_metrics_provider_process()
@@ -144,18 +189,47 @@ class TaskHandler:
         workers: List[WorkerInterface],
         configuration: Configuration,
         metrics_settings: MetricsSettings,
+        shutdown_settings: Optional[ShutdownSettings] = None,
     ) -> None:
         self.task_runner_processes = []
         for worker in workers:
-            self.__create_task_runner_process(worker, configuration, metrics_settings)
+            self.__create_task_runner_process(
+                worker, configuration, metrics_settings, shutdown_settings
+            )
+
+    def __create_task_runner_group_processes(
+        self,
+        workers: List[WorkerInterface],
+        configuration: Configuration,
+        metrics_settings: MetricsSettings,
+        process_count: int,
+        shutdown_settings: Optional[ShutdownSettings] = None,
+    ) -> None:
+        self.task_runner_processes = []
+        process_count = min(max(process_count, 1), len(workers))
+        # deal the workers round robin so that every process gets a similar share
+        for shard in range(process_count):
+            task_runner_group = AsyncTaskRunnerGroup(
+                workers[shard::process_count],
+                configuration,
+                metrics_settings,
+                shutdown_settings,
+            )
+            process = Process(
+                target=self.coroutine_as_process_target, args=(task_runner_group.run,)
+            )
+            self.task_runner_processes.append(process)
 
     def __create_task_runner_process(
         self,
         worker: WorkerInterface,
         configuration: Configuration,
         metrics_settings: MetricsSettings,
+        shutdown_settings: Optional[ShutdownSettings] = None,
     ) -> None:
-        task_runner = AsyncTaskRunner(worker, configuration, metrics_settings)
+        task_runner = AsyncTaskRunner(
+            worker, configuration, metrics_settings, shutdown_settings=shutdown_settings
+        )
         process = Process(
             target=self.coroutine_as_process_target, args=(task_runner.run,)
         )
@@ -192,6 +266,28 @@ class TaskHandler:
         for task_runner_process in self.task_runner_processes:
             self.__stop_process(task_runner_process)
 
+    def __drain_task_runner_processes(self):
+        # SIGTERM makes the runners stop polling and drain, the ones outliving the deadline are killed
+        for task_runner_process in self.task_runner_processes:
+            if task_runner_process.is_alive():
+                self.__stop_process(task_runner_process)
+        deadline = (
+            time.monotonic()
+            + self.shutdown_settings.drain_timeout
+            + self.shutdown_settings.kill_grace_period
+        )
+        for task_runner_process in self.task_runner_processes:
+            if task_runner_process.pid is None:
+                continue
+            task_runner_process.join(max(deadline - time.monotonic(), 0))
+            if task_runner_process.is_alive():
+                logger.warning(
+                    "TaskRunner process %s did not drain in time, killing it",
+                    task_runner_process.pid,
+                )
+                task_runner_process.kill()
+        logger.info("Drained TaskRunner processes")
+
     def __stop_process(self, process: Process):
         if process is None:
             return
@@ -3,10 +3,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import signal
 import sys
 import time
 import traceback
-from typing import Optional
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
 from conductor.asyncio_client.adapters.models.task_adapter import TaskAdapter
 from conductor.asyncio_client.adapters.models.task_exec_log_adapter import \
@@ -19,12 +21,32 @@ from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.http.exceptions import UnauthorizedException
 from conductor.asyncio_client.telemetry.metrics_collector import \
     AsyncMetricsCollector
-from conductor.asyncio_client.worker.worker_interface import WorkerInterface
+from conductor.asyncio_client.worker.worker_interface import (
+    PROCESS_EXECUTOR, WorkerInterface)
+from conductor.shared.automator.polling import AdaptivePollingInterval
+from conductor.shared.automator.shutdown import on_shutdown_signal
 from conductor.shared.configuration.settings.metrics_settings import \
     MetricsSettings
+from conductor.shared.configuration.settings.shutdown_settings import \
+    ShutdownSettings
+from conductor.shared.configuration.settings.task_update_settings import \
+    TaskUpdateSettings
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
+_process_worker: Optional[WorkerInterface] = None
+
+
+def _initialize_process(worker: WorkerInterface) -> None:
+    global _process_worker
+    _process_worker = worker
+    # forked pool processes would otherwise inherit the drain handler of the runner
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _execute_in_process(task: TaskAdapter) -> TaskResultAdapter:
+    return _process_worker.execute(task)
+
 
 class AsyncTaskRunner:
     def __init__(
@@ -32,6 +54,9 @@ class AsyncTaskRunner:
         worker: WorkerInterface,
         configuration: Configuration = None,
         metrics_settings: MetricsSettings = None,
+        api_client: ApiClient = None,
+        shutdown_settings: ShutdownSettings = None,
+        task_update_settings: TaskUpdateSettings = None,
     ):
         if not isinstance(worker, WorkerInterface):
             raise Exception("Invalid worker")
@@ -43,7 +68,25 @@ class AsyncTaskRunner:
         self.metrics_collector = None
         if metrics_settings is not None:
             self.metrics_collector = AsyncMetricsCollector(metrics_settings)
-        self.task_client = TaskResourceApiAdapter(ApiClient(configuration=self.configuration))
+        if api_client is None:
+            api_client = ApiClient(configuration=self.configuration)
+        self.task_client = TaskResourceApiAdapter(api_client)
+        # results are sent inline, only the retry policy of failed updates is used
+        self.task_update_settings = task_update_settings or TaskUpdateSettings()
+        # created lazily so that pool workers belong to the runner process
+        self._executor: Optional[Executor] = None
+        self._running_tasks: Set[asyncio.Task] = set()
+        self._running_tasks_by_name: Dict[str, Set[asyncio.Task]] = {}
+        self._adaptive_polling_interval = AdaptivePollingInterval(
+            max_interval=self.worker.max_poll_interval / 1000
+        )
+        # without shutdown settings SIGTERM keeps its default behaviour
+        self.shutdown_settings = shutdown_settings
+        self._stop_requested = False
+        self._drain_deadline = None
+        self._release_handle: Optional[asyncio.TimerHandle] = None
+        self._in_flight_tasks: Dict[str, Tuple[TaskAdapter, str]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def run(self) -> None:
         if self.configuration is not None:
@@ -59,22 +102,201 @@ class AsyncTaskRunner:
             self.worker.get_polling_interval_in_seconds(),
         )
 
-        while True:
-            await self.run_once()
+        self._loop = asyncio.get_running_loop()
+        if self.shutdown_settings is not None:
+            on_shutdown_signal(lambda: self._loop.call_soon_threadsafe(self.stop))
+        try:
+            while not self._stop_requested:
+                await self.run_once()
+        finally:
+            await self.__drain()
+
+    def stop(self) -> None:
+        """
+        Stops polling. Tasks in flight get until the drain deadline to finish,
+        after which they are released back to the server.
+        """
+        if self._stop_requested:
+            return
+        shutdown_settings = self.shutdown_settings or ShutdownSettings()
+        logger.info(
+            "Stopping task runner for %s, draining tasks in flight for up to %s seconds",
+            ",".join(self.worker.task_definition_names),
+            shutdown_settings.drain_timeout,
+        )
+        self._drain_deadline = time.monotonic() + shutdown_settings.drain_timeout
+        self._stop_requested = True
+        if self._loop is not None:
+            # sequential workers execute inline, so their task is released from a timer
+            self._release_handle = self._loop.call_later(
+                shutdown_settings.drain_timeout,
+                lambda: asyncio.ensure_future(self.__release_in_flight_tasks()),
+            )
+
+    async def __drain(self) -> None:
+        if self._stop_requested:
+            running_tasks = {
+                t
+                for t in set(self._running_tasks).union(*self._running_tasks_by_name.values())
+                if not t.done()
+            }
+            if len(running_tasks) > 0:
+                await asyncio.wait(
+                    running_tasks,
+                    timeout=max(self._drain_deadline - time.monotonic(), 0),
+                )
+            if self._release_handle is not None:
+                self._release_handle.cancel()
+            await self.__release_in_flight_tasks()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def __untrack_in_flight_task(self, task: TaskAdapter) -> bool:
+        """Returns False when the task was released while it executed, and its result must be dropped."""
+        return self._in_flight_tasks.pop(task.task_id, None) is not None
+
+    async def __release_in_flight_tasks(self) -> None:
+        in_flight_tasks: List[Tuple[TaskAdapter, str]] = list(self._in_flight_tasks.values())
+        self._in_flight_tasks.clear()
+        for task, task_definition_name in in_flight_tasks:
+            logger.warning(
+                "Releasing task still running at the drain deadline, id: %s, workflow_instance_id: %s, "
+                "task_definition_name: %s",
+                task.task_id,
+                task.workflow_instance_id,
+                task_definition_name,
+            )
+            # an IN_PROGRESS update puts the task back in the queue after callback_after_seconds
+            task_result = TaskResultAdapter(
+                task_id=task.task_id,
+                workflow_instance_id=task.workflow_instance_id,
+                worker_id=self.worker.get_identity(),
+            )
+            task_result.status = "IN_PROGRESS"
+            task_result.callback_after_seconds = 0
+            task_result.logs = [
+                TaskExecLogAdapter(
+                    log="Released by a worker shutting down",
+                    task_id=task_result.task_id,
+                    created_time=(time.time()),
+                )
+            ]
+            await self.__update_task(task_result, task_definition_name)
 
     async def run_once(self) -> None:
+        if self.worker.poll_all_task_types and len(self.worker.task_definition_names) > 1:
+            await self.__run_once_for_all_task_types()
+            return
+        if self.worker.concurrency > 1:
+            await self.__run_once_concurrently()
+            return
         try:
             task = await self.__poll_task()
             if task is not None and task.task_id is not None:
                 task_result = await self.__execute_task(task)
                 await self.__update_task(task_result)
-            await self.__wait_for_polling_interval()
+            if self.worker.adaptive_polling:
+                await self.__wait_for_adaptive_polling_interval(task is not None)
+            else:
+                await self.__wait_for_polling_interval()
             self.worker.clear_task_definition_name_cache()
         except Exception:
             pass
 
-    async def __poll_task(self) -> Optional[TaskAdapter]:
-        task_definition_name = self.worker.get_task_definition_name()
+    async def __run_once_concurrently(self) -> None:
+        try:
+            self._running_tasks = {t for t in self._running_tasks if not t.done()}
+            task_definition_name = self.worker.get_task_definition_name()
+            if len(self._running_tasks) >= self.worker.concurrency:
+                if self.metrics_collector is not None:
+                    await self.metrics_collector.increment_task_execution_queue_full(
+                        task_definition_name
+                    )
+                await asyncio.wait(
+                    self._running_tasks,
+                    timeout=self.worker.get_polling_interval_in_seconds(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                return
+            task = await self.__poll_task()
+            if task is not None and task.task_id is not None:
+                self._running_tasks.add(
+                    asyncio.create_task(
+                        self.__execute_and_update_task(task, task_definition_name)
+                    )
+                )
+            if self.worker.adaptive_polling:
+                await self.__wait_for_adaptive_polling_interval(task is not None)
+            elif task is None:
+                await self.__wait_for_polling_interval()
+            self.worker.clear_task_definition_name_cache()
+        except Exception:
+            pass
+
+    async def __run_once_for_all_task_types(self) -> None:
+        try:
+            # every task definition gets concurrency slots, as it would with a worker of its own
+            task_definition_names = []
+            for task_definition_name in self.worker.task_definition_names:
+                running_tasks = {
+                    t
+                    for t in self._running_tasks_by_name.get(task_definition_name, ())
+                    if not t.done()
+                }
+                self._running_tasks_by_name[task_definition_name] = running_tasks
+                if len(running_tasks) >= self.worker.concurrency:
+                    if self.metrics_collector is not None:
+                        await self.metrics_collector.increment_task_execution_queue_full(
+                            task_definition_name
+                        )
+                    continue
+                task_definition_names.append(task_definition_name)
+            if len(task_definition_names) == 0:
+                await asyncio.wait(
+                    set().union(*self._running_tasks_by_name.values()),
+                    timeout=self.worker.get_polling_interval_in_seconds(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                return
+            tasks = await asyncio.gather(
+                *(self.__poll_task(name) for name in task_definition_names)
+            )
+            tasks_received = False
+            for task_definition_name, task in zip(task_definition_names, tasks):
+                if task is not None and task.task_id is not None:
+                    tasks_received = True
+                    self._running_tasks_by_name[task_definition_name].add(
+                        asyncio.create_task(
+                            self.__execute_and_update_task(task, task_definition_name)
+                        )
+                    )
+            if self.worker.adaptive_polling:
+                await self.__wait_for_adaptive_polling_interval(tasks_received)
+            elif not tasks_received:
+                await self.__wait_for_polling_interval()
+        except Exception:
+            pass
+
+    async def __execute_and_update_task(
+        self, task: TaskAdapter, task_definition_name: str
+    ) -> None:
+        try:
+            task_result = await self.__execute_task(task, task_definition_name)
+            await self.__update_task(task_result, task_definition_name)
+        except Exception:
+            if self.metrics_collector is not None:
+                await self.metrics_collector.increment_uncaught_exception()
+            logger.error(
+                "Uncaught exception while handling task, id: %s, reason: %s",
+                task.task_id,
+                traceback.format_exc(),
+            )
+
+    async def __poll_task(
+        self, task_definition_name: Optional[str] = None
+    ) -> Optional[TaskAdapter]:
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         if self.worker.paused():
             logger.debug("Stop polling task for: %s", task_definition_name)
             return None
@@ -123,19 +345,23 @@ class AsyncTaskRunner:
             )
         return task
 
-    async def __execute_task(self, task: TaskAdapter) -> Optional[TaskResultAdapter]:
+    async def __execute_task(
+        self, task: TaskAdapter, task_definition_name: Optional[str] = None
+    ) -> Optional[TaskResultAdapter]:
         if not isinstance(task, TaskAdapter):
             return None
-        task_definition_name = self.worker.get_task_definition_name()
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         logger.debug(
             "Executing task, id: %s, workflow_instance_id: %s, task_definition_name: %s",
             task.task_id,
             task.workflow_instance_id,
             task_definition_name,
         )
+        self._in_flight_tasks[task.task_id] = (task, task_definition_name)
         try:
             start_time = time.time()
-            task_result = self.worker.execute(task)
+            task_result = await self.__run_worker(task)
             finish_time = time.time()
             time_spent = finish_time - start_time
             if self.metrics_collector is not None:
@@ -145,6 +371,11 @@ class AsyncTaskRunner:
                 await self.metrics_collector.record_task_result_payload_size(
                     task_definition_name, sys.getsizeof(task_result)
                 )
+                # queue wait is measured by the server, so it is free of clock skew
+                await self.metrics_collector.record_task_end_to_end_time(
+                    task_definition_name,
+                    (task.queue_wait_time or 0) / 1000 + time_spent,
+                )
             logger.debug(
                 "Executed task, id: %s, workflow_instance_id: %s, task_definition_name: %s",
                 task.task_id,
@@ -178,24 +409,65 @@ class AsyncTaskRunner:
                 task_definition_name,
                 traceback.format_exc(),
             )
+        if not self.__untrack_in_flight_task(task):
+            return None
         return task_result
 
-    async def __update_task(self, task_result: TaskResultAdapter):
+    async def __run_worker(self, task: TaskAdapter) -> TaskResultAdapter:
+        if self.worker.is_async():
+            return await self.worker.execute(task)
+        # keep blocking or CPU bound execute functions off the event loop
+        loop = asyncio.get_running_loop()
+        if self.worker.executor_type == PROCESS_EXECUTOR:
+            # the pool processes already hold the worker, only the task is pickled
+            return await loop.run_in_executor(
+                self.__get_executor(), _execute_in_process, task
+            )
+        return await loop.run_in_executor(
+            self.__get_executor(), self.worker.execute, task
+        )
+
+    def __get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.worker.executor_type == PROCESS_EXECUTOR:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.worker.concurrency,
+                    initializer=_initialize_process,
+                    initargs=(self.worker,),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.worker.concurrency,
+                    thread_name_prefix="conductor-worker",
+                )
+        return self._executor
+
+    async def __update_task(
+        self,
+        task_result: TaskResultAdapter,
+        task_definition_name: Optional[str] = None,
+    ):
         if not isinstance(task_result, TaskResultAdapter):
             return None
-        task_definition_name = self.worker.get_task_definition_name()
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         logger.debug(
             "Updating task, id: %s, workflow_instance_id: %s, task_definition_name: %s",
             task_result.task_id,
             task_result.workflow_instance_id,
             task_definition_name,
         )
-        for attempt in range(4):
+        for attempt in range(self.task_update_settings.max_attempts):
             if attempt > 0:
-                # Wait for [10s, 20s, 30s] before next attempt
-                await asyncio.sleep(attempt * 10)
+                await asyncio.sleep(self.task_update_settings.backoff(attempt))
             try:
+                start_time = time.time()
                 response = await self.task_client.update_task(task_result=task_result)
+                time_spent = time.time() - start_time
+                if self.metrics_collector is not None:
+                    await self.metrics_collector.record_task_update_time(
+                        task_definition_name, time_spent
+                    )
                 logger.debug(
                     "Updated task, id: %s, workflow_instance_id: %s, task_definition_name: %s, response: %s",
                     task_result.task_id,
@@ -222,6 +494,17 @@ class AsyncTaskRunner:
         polling_interval = self.worker.get_polling_interval_in_seconds()
         await asyncio.sleep(polling_interval)
 
+    async def __wait_for_adaptive_polling_interval(self, tasks_received: bool) -> None:
+        polling_interval = self._adaptive_polling_interval.next_interval(
+            self.worker.get_polling_interval_in_seconds(), tasks_received
+        )
+        if self.metrics_collector is not None:
+            await self.metrics_collector.record_task_poll_interval(
+                self.worker.get_task_definition_name(), polling_interval
+            )
+        if polling_interval > 0:
+            await asyncio.sleep(polling_interval)
+
     def __set_worker_properties(self) -> None:
         # If multiple tasks are supplied to the same worker, then only first
         # task will be considered for setting worker properties
@@ -257,6 +540,43 @@ class AsyncTaskRunner:
                     e,
                 )
 
+        concurrency = self.__get_property_value_from_env("concurrency", task_type)
+        if concurrency:
+            try:
+                self.worker.concurrency = int(concurrency)
+            except Exception:
+                logger.error(
+                    "error reading and parsing the concurrency value %s", concurrency
+                )
+
+        adaptive_polling = self.__get_property_value_from_env(
+            "adaptive_polling", task_type
+        )
+        if adaptive_polling:
+            self.worker.adaptive_polling = adaptive_polling.lower() in ("true", "1", "yes")
+
+        poll_all_task_types = self.__get_property_value_from_env(
+            "poll_all_task_types", task_type
+        )
+        if poll_all_task_types:
+            self.worker.poll_all_task_types = poll_all_task_types.lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+
+        max_poll_interval = self.__get_property_value_from_env(
+            "max_poll_interval", task_type
+        )
+        if max_poll_interval:
+            try:
+                self.worker.max_poll_interval = float(max_poll_interval)
+            except Exception:
+                logger.error(
+                    "error reading and parsing the max poll interval value %s",
+                    max_poll_interval,
+                )
+
     def __get_property_value_from_env(self, prop, task_type):
         """
         get the property from the env variable
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import List
+
+from conductor.asyncio_client.adapters import ApiClient
+from conductor.asyncio_client.automator.task_runner import AsyncTaskRunner
+from conductor.asyncio_client.configuration import Configuration
+from conductor.asyncio_client.worker.worker_interface import WorkerInterface
+from conductor.shared.configuration.settings.metrics_settings import \
+    MetricsSettings
+from conductor.shared.configuration.settings.shutdown_settings import \
+    ShutdownSettings
+
+logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
+
+
+class AsyncTaskRunnerGroup:
+    """
+    Runs several async workers as tasks on a single event loop.
+
+    All of them share one API client, and so one aiohttp connection pool.
+    """
+
+    def __init__(
+        self,
+        workers: List[WorkerInterface],
+        configuration: Configuration = None,
+        metrics_settings: MetricsSettings = None,
+        shutdown_settings: ShutdownSettings = None,
+    ):
+        for worker in workers:
+            if not isinstance(worker, WorkerInterface):
+                raise Exception("Invalid worker")
+        if not isinstance(configuration, Configuration):
+            configuration = Configuration()
+        self.workers = workers
+        self.configuration = configuration
+        self.metrics_settings = metrics_settings
+        self.shutdown_settings = shutdown_settings
+
+    async def run(self) -> None:
+        # created on the running loop, in the process the group runs in
+        api_client = ApiClient(configuration=self.configuration)
+        task_runners = [
+            AsyncTaskRunner(
+                worker,
+                self.configuration,
+                self.metrics_settings,
+                api_client=api_client,
+                shutdown_settings=self.shutdown_settings,
+            )
+            for worker in self.workers
+        ]
+        logger.info("Starting %s AsyncTaskRunner tasks", len(task_runners))
+        try:
+            await asyncio.gather(*(task_runner.run() for task_runner in task_runners))
+        finally:
+            await api_client.close()
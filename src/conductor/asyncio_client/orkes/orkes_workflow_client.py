@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
 
 from conductor.asyncio_client.adapters.models.correlation_ids_search_request_adapter import \
     CorrelationIdsSearchRequestAdapter
@@ -26,6 +26,9 @@ from conductor.asyncio_client.adapters.models.workflow_test_request_adapter impo
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.http.configuration import Configuration
 from conductor.asyncio_client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.shared.workflow.bulk_start import (
+    DEFAULT_BULK_START_CONCURRENCY, WorkflowStartResult,
+    async_start_workflows_concurrently)
 
 
 class OrkesWorkflowClient(OrkesBaseClient):
@@ -60,6 +63,19 @@ class OrkesWorkflowClient(OrkesBaseClient):
         """Start a workflow with StartWorkflowRequest"""
         return await self.workflow_api.start_workflow(start_workflow_request)
 
+    def bulk_start_workflows(
+        self,
+        start_workflow_requests: Union[
+            Iterable[StartWorkflowRequestAdapter], AsyncIterable[StartWorkflowRequestAdapter]
+        ],
+        concurrency: int = DEFAULT_BULK_START_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+    ) -> AsyncIterator[WorkflowStartResult]:
+        """Start workflows with up to concurrency requests in flight, yielding a result per request as it completes"""
+        return async_start_workflows_concurrently(
+            self.start_workflow, start_workflow_requests, concurrency, rate_limit
+        )
+
     async def execute_workflow(
         self,
         start_workflow_request: StartWorkflowRequestAdapter,
@@ -4,12 +4,15 @@ import os
 from typing import Any, ClassVar, Dict, List
 
 from prometheus_client import (CollectorRegistry, Counter, Gauge,
-                               write_to_textfile)
+                               Histogram, write_to_textfile)
 from prometheus_client.multiprocess import MultiProcessCollector
 
-from conductor.shared.telemetry.configuration.metrics import MetricsSettings
+from conductor.shared.telemetry.configuration.metrics import (
+    DEFAULT_LATENCY_BUCKETS, MetricsSettings)
 from conductor.shared.telemetry.enums import (MetricDocumentation, MetricLabel,
                                               MetricName)
+from conductor.shared.telemetry.exception_labels import ExceptionLabels
+from conductor.shared.telemetry.metrics_server import serve_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +27,11 @@ class AsyncMetricsCollector:
 
     counters: ClassVar[Dict[str, Counter]] = {}
     gauges: ClassVar[Dict[str, Gauge]] = {}
+    histograms: ClassVar[Dict[str, Histogram]] = {}
     registry = CollectorRegistry()
     must_collect_metrics = False
+    latency_buckets = DEFAULT_LATENCY_BUCKETS
+    exception_labels = ExceptionLabels()
 
     def __init__(self, settings: MetricsSettings):
         """
@@ -41,6 +47,10 @@ class AsyncMetricsCollector:
             MultiProcessCollector(self.registry)
             self.must_collect_metrics = True
             self.settings = settings
+            self.latency_buckets = settings.latency_buckets
+            self.exception_labels = ExceptionLabels(
+                settings.max_exception_labels, settings.exception_sample_interval
+            )
 
     @staticmethod
     async def provide_metrics(settings: MetricsSettings) -> None:
@@ -48,7 +58,8 @@ class AsyncMetricsCollector:
         Async method to provide metrics collection.
 
         This method runs continuously in the background, writing metrics
-        to a file at regular intervals.
+        to a file at regular intervals, or serving them over HTTP when
+        settings.http_port is set.
 
         Parameters:
         -----------
@@ -58,6 +69,12 @@ class AsyncMetricsCollector:
         if settings is None:
             return
 
+        if settings.http_port is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, serve_metrics, settings
+            )
+            return
+
         OUTPUT_FILE_PATH: str = os.path.join(settings.directory, settings.file_name)
         registry = CollectorRegistry()
         MultiProcessCollector(registry)
@@ -103,7 +120,7 @@ class AsyncMetricsCollector:
             documentation=MetricDocumentation.TASK_POLL_ERROR,
             labels={
                 MetricLabel.TASK_TYPE: task_type,
-                MetricLabel.EXCEPTION: str(exception),
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception),
             },
         )
 
@@ -124,7 +141,7 @@ class AsyncMetricsCollector:
             documentation=MetricDocumentation.TASK_EXECUTE_ERROR,
             labels={
                 MetricLabel.TASK_TYPE: task_type,
-                MetricLabel.EXCEPTION: str(exception),
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception),
             },
         )
 
@@ -145,7 +162,7 @@ class AsyncMetricsCollector:
             documentation=MetricDocumentation.TASK_ACK_ERROR,
             labels={
                 MetricLabel.TASK_TYPE: task_type,
-                MetricLabel.EXCEPTION: str(exception),
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception),
             },
         )
 
@@ -158,7 +175,7 @@ class AsyncMetricsCollector:
             documentation=MetricDocumentation.TASK_UPDATE_ERROR,
             labels={
                 MetricLabel.TASK_TYPE: task_type,
-                MetricLabel.EXCEPTION: str(exception),
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception),
             },
         )
 
@@ -185,7 +202,7 @@ class AsyncMetricsCollector:
             documentation=MetricDocumentation.WORKFLOW_START_ERROR,
             labels={
                 MetricLabel.WORKFLOW_TYPE: workflow_type,
-                MetricLabel.EXCEPTION: str(exception),
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception),
             },
         )
 
@@ -222,6 +239,21 @@ class AsyncMetricsCollector:
             labels={MetricLabel.TASK_TYPE: task_type},
             value=time_spent,
         )
+        await self.__observe_histogram(
+            name=MetricName.TASK_POLL_LATENCY,
+            documentation=MetricDocumentation.TASK_POLL_LATENCY,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=time_spent,
+        )
+
+    async def record_task_poll_interval(self, task_type: str, interval: float) -> None:
+        """Record the current effective delay between polls."""
+        await self.__record_gauge(
+            name=MetricName.TASK_POLL_INTERVAL,
+            documentation=MetricDocumentation.TASK_POLL_INTERVAL,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=interval,
+        )
 
     async def record_task_execute_time(self, task_type: str, time_spent: float) -> None:
         """Record task execute time."""
@@ -231,6 +263,38 @@ class AsyncMetricsCollector:
             labels={MetricLabel.TASK_TYPE: task_type},
             value=time_spent,
         )
+        await self.__observe_histogram(
+            name=MetricName.TASK_EXECUTE_LATENCY,
+            documentation=MetricDocumentation.TASK_EXECUTE_LATENCY,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=time_spent,
+        )
+
+    async def record_task_update_time(self, task_type: str, time_spent: float) -> None:
+        """Record task update time."""
+        await self.__record_gauge(
+            name=MetricName.TASK_UPDATE_TIME,
+            documentation=MetricDocumentation.TASK_UPDATE_TIME,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=time_spent,
+        )
+        await self.__observe_histogram(
+            name=MetricName.TASK_UPDATE_LATENCY,
+            documentation=MetricDocumentation.TASK_UPDATE_LATENCY,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=time_spent,
+        )
+
+    async def record_task_end_to_end_time(
+        self, task_type: str, time_spent: float
+    ) -> None:
+        """Record time from a task being scheduled to its result being ready."""
+        await self.__observe_histogram(
+            name=MetricName.TASK_END_TO_END_LATENCY,
+            documentation=MetricDocumentation.TASK_END_TO_END_LATENCY,
+            labels={MetricLabel.TASK_TYPE: task_type},
+            value=time_spent,
+        )
 
     async def __increment_counter(
         self,
@@ -261,6 +325,21 @@ class AsyncMetricsCollector:
         )
         gauge.labels(*labels.values()).set(value)
 
+    async def __observe_histogram(
+        self,
+        name: MetricName,
+        documentation: MetricDocumentation,
+        labels: Dict[MetricLabel, str],
+        value: float,
+    ) -> None:
+        """Async method to observe a value in a histogram metric."""
+        if not self.must_collect_metrics:
+            return
+        histogram = await self.__get_histogram(
+            name=name, documentation=documentation, labelnames=labels.keys()
+        )
+        histogram.labels(*labels.values()).observe(value)
+
     async def __get_counter(
         self,
         name: MetricName,
@@ -287,6 +366,19 @@ class AsyncMetricsCollector:
             )
         return self.gauges[name]
 
+    async def __get_histogram(
+        self,
+        name: MetricName,
+        documentation: MetricDocumentation,
+        labelnames: List[MetricLabel],
+    ) -> Histogram:
+        """Async method to get or create a histogram metric."""
+        if name not in self.histograms:
+            self.histograms[name] = await self.__generate_histogram(
+                name, documentation, labelnames
+            )
+        return self.histograms[name]
+
     async def __generate_counter(
         self,
         name: MetricName,
@@ -314,3 +406,18 @@ class AsyncMetricsCollector:
             labelnames=labelnames,
             registry=self.registry,
         )
+
+    async def __generate_histogram(
+        self,
+        name: MetricName,
+        documentation: MetricDocumentation,
+        labelnames: List[MetricLabel],
+    ) -> Histogram:
+        """Async method to generate a new histogram metric."""
+        return Histogram(
+            name=name,
+            documentation=documentation,
+            labelnames=labelnames,
+            buckets=self.latency_buckets,
+            registry=self.registry,
+        )
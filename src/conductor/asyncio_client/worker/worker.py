@@ -16,9 +16,9 @@ from conductor.asyncio_client.adapters.models.task_result_adapter import \
 from conductor.asyncio_client.configuration import Configuration
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.worker.worker_interface import (
-    DEFAULT_POLLING_INTERVAL, WorkerInterface)
+    DEFAULT_CONCURRENCY, DEFAULT_POLLING_INTERVAL, THREAD_EXECUTOR,
+    WorkerInterface)
 from conductor.shared.automator import utils
-from conductor.shared.automator.utils import convert_from_dict_or_list
 from conductor.shared.http.enums import TaskResultStatus
 from conductor.shared.worker.exception import NonRetryableException
 
@@ -57,6 +57,11 @@ class Worker(WorkerInterface):
         poll_interval: Optional[float] = None,
         domain: Optional[str] = None,
         worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        executor_type: Optional[str] = None,
+        adaptive_polling: bool = False,
+        max_poll_interval: Optional[int] = None,
+        poll_all_task_types: bool = False,
     ):
         super().__init__(task_definition_name)
         self.api_client = ApiClient()
@@ -65,6 +70,12 @@ class Worker(WorkerInterface):
         else:
             self.poll_interval = deepcopy(poll_interval)
         self.domain = deepcopy(domain)
+        self.concurrency = DEFAULT_CONCURRENCY if concurrency is None else concurrency
+        self.executor_type = THREAD_EXECUTOR if executor_type is None else executor_type
+        self.adaptive_polling = adaptive_polling
+        self.poll_all_task_types = poll_all_task_types
+        if max_poll_interval is not None:
+            self.max_poll_interval = max_poll_interval
         if worker_id is None:
             self.worker_id = deepcopy(super().get_identity())
         else:
@@ -72,64 +83,75 @@ class Worker(WorkerInterface):
         self.execute_function = deepcopy(execute_function)
 
     def execute(self, task: TaskAdapter) -> TaskResultAdapter:
-        task_input = {}
-        task_output = None
+        if self._is_execute_function_coroutine:
+            return self.execute_async(task)
         task_result: TaskResultAdapter = self.get_task_result_from_task(task)
-
         try:
+            task_output = self.__call_execute_function(task)
+        except Exception as e:
+            self.__fail_task_result(task, task_result, e)
+            return self.__serialize_output_data(task_result)
+        return self.__to_task_result(task, task_result, task_output)
 
-            if self._is_execute_function_input_parameter_a_task:
-                task_output = self.execute_function(task)
-            else:
-                params = inspect.signature(self.execute_function).parameters
-                for input_name in params:
-                    typ = params[input_name].annotation
-                    default_value = params[input_name].default
-                    if input_name in task.input_data:
-                        if typ in utils.simple_types:
-                            task_input[input_name] = task.input_data[input_name]
-                        else:
-                            task_input[input_name] = convert_from_dict_or_list(
-                                typ, task.input_data[input_name]
-                            )
-                    elif default_value is not inspect.Parameter.empty:
-                        task_input[input_name] = default_value
-                    else:
-                        task_input[input_name] = None
-                task_output = self.execute_function(**task_input)
-
-            if isinstance(task_output, TaskResultAdapter):
-                task_output.task_id = task.task_id
-                task_output.workflow_instance_id = task.workflow_instance_id
-                return task_output
-            else:
-                task_result.status = TaskResultStatus.COMPLETED
-                task_result.output_data = {"result": task_output}
-
-        except NonRetryableException as ne:
+    async def execute_async(self, task: TaskAdapter) -> TaskResultAdapter:
+        task_result: TaskResultAdapter = self.get_task_result_from_task(task)
+        try:
+            task_output = await self.__call_execute_function(task)
+        except Exception as e:
+            self.__fail_task_result(task, task_result, e)
+            return self.__serialize_output_data(task_result)
+        return self.__to_task_result(task, task_result, task_output)
+
+    def is_async(self) -> bool:
+        return self._is_execute_function_coroutine
+
+    def __call_execute_function(self, task: TaskAdapter) -> Any:
+        if self._is_execute_function_input_parameter_a_task:
+            return self.execute_function(task)
+        task_input = utils.bind_parameters(
+            self._execute_function_parameter_plan, task.input_data
+        )
+        return self.execute_function(**task_input)
+
+    def __to_task_result(
+        self, task: TaskAdapter, task_result: TaskResultAdapter, task_output: Any
+    ) -> TaskResultAdapter:
+        if isinstance(task_output, TaskResultAdapter):
+            task_output.task_id = task.task_id
+            task_output.workflow_instance_id = task.workflow_instance_id
+            return task_output
+        task_result.status = TaskResultStatus.COMPLETED
+        task_result.output_data = {"result": task_output}
+        return self.__serialize_output_data(task_result)
+
+    def __fail_task_result(
+        self, task: TaskAdapter, task_result: TaskResultAdapter, error: Exception
+    ) -> None:
+        if isinstance(error, NonRetryableException):
             task_result.status = TaskResultStatus.FAILED_WITH_TERMINAL_ERROR
-            if len(ne.args) > 0:
-                task_result.reason_for_incompletion = ne.args[0]
-
-        except Exception as ne:
-            logger.error(
-                "Error executing task %s with id %s. error = %s",
-                task.task_def_name,
-                task.task_id,
-                traceback.format_exc(),
-            )
+            if len(error.args) > 0:
+                task_result.reason_for_incompletion = error.args[0]
+            return
+
+        logger.error(
+            "Error executing task %s with id %s. error = %s",
+            task.task_def_name,
+            task.task_id,
+            traceback.format_exc(),
+        )
 
-            task_result.logs = [
-                TaskExecLogAdapter(
-                    log=traceback.format_exc(),
-                    task_id=task_result.task_id,
-                    created_time=int(time.time()),
-                )
-            ]
-            task_result.status = TaskResultStatus.FAILED
-            if len(ne.args) > 0:
-                task_result.reason_for_incompletion = ne.args[0]
+        task_result.logs = [
+            TaskExecLogAdapter(
+                log=traceback.format_exc(),
+                task_id=task_result.task_id,
+                created_time=int(time.time()),
+            )
+        ]
+        task_result.status = TaskResultStatus.FAILED
+        if len(error.args) > 0:
+            task_result.reason_for_incompletion = error.args[0]
 
+    def __serialize_output_data(self, task_result: TaskResultAdapter) -> TaskResultAdapter:
         if dataclasses.is_dataclass(type(task_result.output_data)):
             task_output = dataclasses.asdict(task_result.output_data)
             task_result.output_data = task_output
@@ -154,6 +176,9 @@ class Worker(WorkerInterface):
     @execute_function.setter
     def execute_function(self, execute_function: ExecuteTaskFunction) -> None:
         self._execute_function = execute_function
+        self._is_execute_function_coroutine = inspect.iscoroutinefunction(
+            execute_function
+        )
         self._is_execute_function_input_parameter_a_task = (
             is_callable_input_parameter_a_task(
                 callable_exec_task_function=execute_function,
@@ -166,3 +191,19 @@ class Worker(WorkerInterface):
                 object_type=TaskResultAdapter,
             )
         )
+        self._execute_function_parameter_plan = utils.get_parameter_plan(
+            execute_function
+        )
+
+    def __getstate__(self):
+        # the api client holds an SSL context and an aiohttp session, neither of
+        # which can be pickled when the worker is shipped to a process pool
+        state = self.__dict__.copy()
+        del state["api_client"]
+        state["_execute_function"] = utils.to_picklable_function(self._execute_function)
+        return state
+
+    def __setstate__(self, state):
+        state["_execute_function"] = utils.from_picklable_function(state["_execute_function"])
+        self.__dict__.update(state)
+        self.api_client = ApiClient()
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import abc
+import inspect
 import socket
 from typing import Union
 
 from conductor.asyncio_client.adapters.models.task_adapter import TaskAdapter
 from conductor.asyncio_client.adapters.models.task_result_adapter import \
     TaskResultAdapter
+from conductor.shared.automator.polling import DEFAULT_MAX_POLL_INTERVAL
 
 DEFAULT_POLLING_INTERVAL = 100  # ms
+DEFAULT_CONCURRENCY = 1
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
 
 
 class WorkerInterface(abc.ABC):
@@ -18,6 +23,11 @@ class WorkerInterface(abc.ABC):
         self._task_definition_name_cache = None
         self._domain = None
         self._poll_interval = DEFAULT_POLLING_INTERVAL
+        self._concurrency = DEFAULT_CONCURRENCY
+        self._executor_type = THREAD_EXECUTOR
+        self._adaptive_polling = False
+        self._poll_all_task_types = False
+        self._max_poll_interval = DEFAULT_MAX_POLL_INTERVAL
 
     @abc.abstractmethod
     def execute(self, task: TaskAdapter) -> TaskResultAdapter:
@@ -30,6 +40,15 @@ class WorkerInterface(abc.ABC):
         """
         ...
 
+    def is_async(self) -> bool:
+        """
+        Whether execute returns an awaitable. Awaitable executions run on the event
+        loop, anything else is offloaded to the worker's executor.
+
+        :return: bool
+        """
+        return inspect.iscoroutinefunction(self.execute)
+
     def get_identity(self) -> str:
         """
         Retrieve the hostname of the instance that the worker is running.
@@ -124,3 +143,61 @@ class WorkerInterface(abc.ABC):
     @poll_interval.setter
     def poll_interval(self, value):
         self._poll_interval = value
+
+    @property
+    def concurrency(self):
+        """
+        Maximum number of tasks the task runner executes at the same time.
+        """
+        return self._concurrency
+
+    @concurrency.setter
+    def concurrency(self, value):
+        self._concurrency = value
+
+    @property
+    def executor_type(self):
+        """
+        Executor used for synchronous execute functions, either "thread" or "process".
+        """
+        return self._executor_type
+
+    @executor_type.setter
+    def executor_type(self, value):
+        self._executor_type = value
+
+    @property
+    def adaptive_polling(self):
+        """
+        When enabled the task runner re-polls immediately after receiving work and
+        backs off exponentially, up to max_poll_interval, after consecutive empty polls.
+        """
+        return self._adaptive_polling
+
+    @adaptive_polling.setter
+    def adaptive_polling(self, value):
+        self._adaptive_polling = value
+
+    @property
+    def poll_all_task_types(self):
+        """
+        When enabled a worker with several task definitions polls every one of them
+        in each cycle instead of one per cycle in round robin, with concurrency
+        execution slots per task definition.
+        """
+        return self._poll_all_task_types
+
+    @poll_all_task_types.setter
+    def poll_all_task_types(self, value):
+        self._poll_all_task_types = value
+
+    @property
+    def max_poll_interval(self):
+        """
+        Upper bound in milliseconds for the adaptive polling interval.
+        """
+        return self._max_poll_interval
+
+    @max_poll_interval.setter
+    def max_poll_interval(self, value):
+        self._max_poll_interval = value
@@ -14,6 +14,10 @@ def WorkerTask(
     domain: Optional[str] = None,
     worker_id: Optional[str] = None,
     poll_interval_seconds: int = 0,
+    concurrency: int = 1,
+    executor_type: str = "thread",
+    adaptive_polling: bool = False,
+    max_poll_interval: int = 5000,
 ):
     poll_interval_millis = poll_interval
     if poll_interval_seconds > 0:
@@ -27,6 +31,10 @@ def WorkerTask(
             domain=domain,
             worker_id=worker_id,
             func=func,
+            concurrency=concurrency,
+            executor_type=executor_type,
+            adaptive_polling=adaptive_polling,
+            max_poll_interval=max_poll_interval,
         )
 
         @functools.wraps(func)
@@ -51,6 +59,10 @@ def worker_task(
     poll_interval_millis: int = 100,
     domain: Optional[str] = None,
     worker_id: Optional[str] = None,
+    concurrency: int = 1,
+    executor_type: str = "thread",
+    adaptive_polling: bool = False,
+    max_poll_interval: int = 5000,
 ):
     def worker_task_func(func):
         register_decorated_fn(
@@ -59,6 +71,10 @@ def worker_task(
             domain=domain,
             worker_id=worker_id,
             func=func,
+            concurrency=concurrency,
+            executor_type=executor_type,
+            adaptive_polling=adaptive_polling,
+            max_poll_interval=max_poll_interval,
         )
 
         @functools.wraps(func)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import weakref
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
@@ -32,9 +35,18 @@ from conductor.asyncio_client.workflow.task.task import TaskInterface
 from conductor.shared.http.enums import IdempotencyStrategy
 from conductor.shared.workflow.enums import TaskType, TimeoutPolicy
 
+# content hashes of the definitions registered through each executor, by workflow name and version,
+# shared by every AsyncConductorWorkflow so that variants with the same name and version do not shadow each other
+_registered_definition_hashes = weakref.WeakKeyDictionary()
+
 
 class AsyncConductorWorkflow:
     SCHEMA_VERSION = 2
+    # attributes that do not change the workflow definition
+    _DEFINITION_CACHE_ATTRIBUTES = (
+        "_workflow_def_cache",
+        "_workflow_def_hash",
+    )
 
     def __init__(
         self,
@@ -59,6 +71,17 @@ class AsyncConductorWorkflow:
         self._restartable = True
         self._workflow_status_listener_enabled = False
         self._workflow_status_listener_sink = None
+        self._inline_definition = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # any change to the workflow invalidates the cached definition
+        if name not in AsyncConductorWorkflow._DEFINITION_CACHE_ATTRIBUTES:
+            self.__definition_changed()
+        super().__setattr__(name, value)
+
+    def __definition_changed(self) -> None:
+        self.__dict__["_workflow_def_cache"] = None
+        self.__dict__["_workflow_def_hash"] = None
 
     @property
     def name(self) -> str:
@@ -151,6 +174,7 @@ class AsyncConductorWorkflow:
             self._output_parameters = {}
 
         self._output_parameters[key] = value
+        self.__definition_changed()
         return self
 
     # InputTemplate template input to the workflow.  Can have combination of variables (e.g. ${workflow.input.abc}) and static values
@@ -197,6 +221,16 @@ class AsyncConductorWorkflow:
         self.input_template(input)
         return self
 
+    # When disabled, starting the workflow registers its definition with the server the first time and after every
+    # change, and later starts only reference it by name and version instead of sending the whole definition.
+    # Registration is skipped only while the definition last registered under that name and version through the
+    # same executor has the same content, so definitions registered from other processes are not detected.
+    def inline_definition(self, inline_definition: bool):
+        if not isinstance(inline_definition, bool):
+            raise Exception("Invalid type")
+        self._inline_definition = inline_definition
+        return self
+
     # Register the workflow definition with the server. If overwrite is set, the definition on the server will be
     # overwritten. When not set, the call fails if there is any change in the workflow definition between the server
     # and what is being registered.
@@ -219,9 +253,7 @@ class AsyncConductorWorkflow:
         -------
         Workflow Execution Id
         """
-        start_workflow_request.workflow_def = self.to_workflow_def()
-        start_workflow_request.name = self.name
-        start_workflow_request.version = self.version
+        await self.__set_workflow_definition(start_workflow_request)
         return await self._executor.start_workflow(start_workflow_request)
 
     async def start_workflow_with_input(
@@ -238,9 +270,7 @@ class AsyncConductorWorkflow:
         """
         workflow_input = workflow_input or {}
         start_workflow_request = StartWorkflowRequestAdapter(
-            workflow_def=self.to_workflow_def(),
             name=self.name,
-            version=self.version,
             input=workflow_input,
             correlation_id=correlation_id,
             task_to_domain=task_to_domain,
@@ -248,6 +278,7 @@ class AsyncConductorWorkflow:
             idempotency_key=idempotency_key,
             idempotency_strategy=idempotency_strategy,
         )
+        await self.__set_workflow_definition(start_workflow_request)
 
         return await self._executor.start_workflow(start_workflow_request)
 
@@ -275,14 +306,16 @@ class AsyncConductorWorkflow:
         when the call completed.
         """
         workflow_input = workflow_input or {}
-        workflow_def = self.to_workflow_def()
         request = StartWorkflowRequestAdapter(
-            workflow_def=workflow_def,
             input=workflow_input,
-            name=workflow_def.name,
-            version=1,
+            name=self.name,
             timeout_seconds=self._timeout_seconds,
         )
+        if self._inline_definition:
+            request.workflow_def = self.__get_workflow_def()
+            request.version = 1
+        else:
+            await self.__set_workflow_definition(request)
         if idempotency_key is not None:
             request.idempotency_key = idempotency_key
             request.idempotency_strategy = idempotency_strategy
@@ -335,6 +368,38 @@ class AsyncConductorWorkflow:
             workflow_status_listener_sink=self._workflow_status_listener_sink,
         )
 
+    def __get_workflow_def(self) -> WorkflowDefAdapter:
+        # built once and reused until the workflow changes
+        if self.__dict__.get("_workflow_def_cache") is None:
+            self._workflow_def_cache = self.to_workflow_def()
+        return self._workflow_def_cache
+
+    async def __set_workflow_definition(
+        self, start_workflow_request: StartWorkflowRequestAdapter
+    ) -> None:
+        start_workflow_request.name = self.name
+        start_workflow_request.version = self.version
+        if self._inline_definition:
+            start_workflow_request.workflow_def = self.__get_workflow_def()
+            return
+        if self.__dict__.get("_workflow_def_hash") is None:
+            # content hash, so a change that is later undone does not register again
+            workflow_def = self.__get_workflow_def().model_dump(
+                by_alias=True, exclude_none=True, mode="json"
+            )
+            self._workflow_def_hash = hashlib.sha256(
+                json.dumps(workflow_def, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        registered_hashes = _registered_definition_hashes.setdefault(self._executor, {})
+        key = (self.name, self.version)
+        if registered_hashes.get(key) != self._workflow_def_hash:
+            # cleared first, so a variant started while this one registers registers again
+            registered_hashes.pop(key, None)
+            await self._executor.register_workflow(
+                self.to_extended_workflow_def(), overwrite=True
+            )
+            registered_hashes[key] = self._workflow_def_hash
+
     def to_workflow_task(self):
         sub_workflow_task = InlineSubWorkflowTask(
             task_ref_name=self.name + "_" + str(uuid()), workflow=self
@@ -412,6 +477,7 @@ class AsyncConductorWorkflow:
                 f"argument.  task is {type(task)}"
             )
         self._tasks.append(deepcopy(task))
+        self.__definition_changed()
         return self
 
     def __add_fork_join_tasks(self, forked_tasks: List[List[TaskInterface]]):
@@ -429,6 +495,7 @@ class AsyncConductorWorkflow:
             task_ref_name="forked_" + suffix, forked_tasks=forked_tasks
         )
         self._tasks.append(fork_task)
+        self.__definition_changed()
         return self
 
     async def __call__(self, **kwargs) -> WorkflowRunAdapter:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
 
 from conductor.asyncio_client.adapters.api.metadata_resource_api import \
     MetadataResourceApiAdapter
@@ -31,6 +31,8 @@ from conductor.asyncio_client.configuration.configuration import Configuration
 from conductor.asyncio_client.adapters import ApiClient
 from conductor.asyncio_client.orkes.orkes_workflow_client import \
     OrkesWorkflowClient
+from conductor.shared.workflow.bulk_start import (
+    DEFAULT_BULK_START_CONCURRENCY, WorkflowStartResult)
 
 
 class AsyncWorkflowExecutor:
@@ -61,13 +63,31 @@ class AsyncWorkflowExecutor:
         """Start multiple workflow instances sequentially.
 
         Note: There is no parallelism implemented here, so providing a very large
-        number of workflows can impact latency and performance.
+        number of workflows can impact latency and performance, use
+        bulk_start_workflows for that.
         """
         return [
             await self.start_workflow(start_workflow_request=request)
             for request in start_workflow_requests
         ]
 
+    def bulk_start_workflows(
+        self,
+        start_workflow_requests: Union[
+            Iterable[StartWorkflowRequestAdapter], AsyncIterable[StartWorkflowRequestAdapter]
+        ],
+        concurrency: int = DEFAULT_BULK_START_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+    ) -> AsyncIterator[WorkflowStartResult]:
+        """Start workflows concurrently from an iterable or async iterable of requests.
+
+        Yields a WorkflowStartResult with the workflow id or the error of each
+        request as soon as it completes.
+        """
+        return self.workflow_client.bulk_start_workflows(
+            start_workflow_requests, concurrency=concurrency, rate_limit=rate_limit
+        )
+
     async def execute_workflow(
         self,
         request: StartWorkflowRequestAdapter,
@@ -0,0 +1,85 @@
+from __future__ import annotations
+import os
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import requests
+
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.external_storage_location import ExternalStorageLocation
+from conductor.shared.http.enums import ExternalPayloadOperation, ExternalPayloadType
+
+
+class ExternalPayloadStorage(ABC):
+    """Stores payloads too large to be sent inline, as json bytes."""
+
+    @abstractmethod
+    def get_location(self, operation: ExternalPayloadOperation, payload_type: ExternalPayloadType,
+                     path: str = "") -> ExternalStorageLocation:
+        """Returns the uri to read or write the payload from, and the path the server knows it by"""
+        pass
+
+    @abstractmethod
+    def upload(self, uri: str, payload: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def download(self, uri: str) -> bytes:
+        pass
+
+
+class ConductorExternalPayloadStorage(ExternalPayloadStorage):
+    """Uses the storage configured on the Conductor server, through the uris it hands out."""
+
+    def __init__(self, task_client: TaskResourceApi):
+        self.task_client = task_client
+        self.__session = None
+
+    def get_location(self, operation: ExternalPayloadOperation, payload_type: ExternalPayloadType,
+                     path: str = "") -> ExternalStorageLocation:
+        return self.task_client.get_external_storage_location1(path, operation.value, payload_type.value)
+
+    def upload(self, uri: str, payload: bytes) -> None:
+        response = self.__get_session().put(uri, data=payload, headers={"Content-Type": "application/json"})
+        response.raise_for_status()
+
+    def download(self, uri: str) -> bytes:
+        response = self.__get_session().get(uri)
+        response.raise_for_status()
+        return response.content
+
+    def __get_session(self) -> requests.Session:
+        # the uris are pre-signed, so the session carries none of the api client headers
+        if self.__session is None:
+            self.__session = requests.Session()
+        return self.__session
+
+
+class LocalExternalPayloadStorage(ExternalPayloadStorage):
+    """Keeps payloads as files under directory, for tests and local development."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def get_location(self, operation: ExternalPayloadOperation, payload_type: ExternalPayloadType,
+                     path: str = "") -> ExternalStorageLocation:
+        if not path:
+            path = f"{payload_type.value.lower()}/{uuid.uuid4()}.json"
+        uri = Path(self.directory, path).absolute().as_uri()
+        return ExternalStorageLocation(uri=uri, path=path)
+
+    def upload(self, uri: str, payload: bytes) -> None:
+        file_path = self.__get_file_path(uri)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as file:
+            file.write(payload)
+
+    def download(self, uri: str) -> bytes:
+        with open(self.__get_file_path(uri), "rb") as file:
+            return file.read()
+
+    def __get_file_path(self, uri: str) -> str:
+        return url2pathname(urlparse(uri).path)
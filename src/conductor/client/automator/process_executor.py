@@ -0,0 +1,138 @@
+from __future__ import annotations
+import json
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple, Optional, Union
+
+from conductor.client.http import json_encoder
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_view import TaskView
+from conductor.client.worker.worker import _offline_api_client
+from conductor.client.worker.worker_interface import WorkerInterface
+
+# smaller payloads are cheaper to copy through the pool's pipe than to map
+SHARED_MEMORY_THRESHOLD = 64 * 1024
+
+
+class SharedPayload(NamedTuple):
+    """A json payload left in a shared memory block for another process to read."""
+
+    name: str
+    size: int
+
+
+Payload = Union[bytes, SharedPayload]
+
+
+def put_payload(data: bytes, threshold: int = SHARED_MEMORY_THRESHOLD) -> Payload:
+    if len(data) < threshold:
+        return data
+    shared_memory = SharedMemory(create=True, size=len(data))
+    try:
+        shared_memory.buf[:len(data)] = data
+    except BaseException:
+        shared_memory.close()
+        shared_memory.unlink()
+        raise
+    shared_memory.close()
+    # the reading process unlinks the block, which unregisters it from its own resource
+    # tracker. Forked pool processes may run a tracker of their own, which would report
+    # the block as leaked at exit if it stayed registered in the tracker of the writer.
+    resource_tracker.unregister(shared_memory._name, "shared_memory")
+    return SharedPayload(shared_memory.name, len(data))
+
+
+def take_payload(payload: Payload) -> bytes:
+    """Reads a payload and frees its shared memory block, which can only be taken once."""
+    if not isinstance(payload, SharedPayload):
+        return payload
+    shared_memory = SharedMemory(name=payload.name)
+    try:
+        return bytes(shared_memory.buf[:payload.size])
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+def release_payload(payload: Payload) -> None:
+    """Frees the shared memory block of a payload that may not have been taken."""
+    if not isinstance(payload, SharedPayload):
+        return
+    try:
+        take_payload(payload)
+    except FileNotFoundError:
+        pass
+
+
+_process_worker: Optional[WorkerInterface] = None
+_process_api_client: Optional[ApiClient] = None
+
+
+def _initialize_process(worker: WorkerInterface) -> None:
+    global _process_worker, _process_api_client
+    _process_worker = worker
+    # forked pool processes would otherwise inherit the drain handler of the runner
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    # only used to convert models, it never authenticates nor opens a connection
+    _process_api_client = _offline_api_client()
+
+
+def _execute_in_process(task_payload: Payload) -> Payload:
+    task = TaskView(json.loads(take_payload(task_payload)), _process_api_client)
+    task_result = _process_worker.execute(task)
+    return put_payload(json_encoder.dumps(task_result, _process_api_client.sanitize_for_serialization, use_orjson=True))
+
+
+class ProcessTaskExecutor:
+    """
+    Executes tasks of a worker in a pool of processes while the calling process
+    keeps polling and updating. Tasks and results cross as json, through shared
+    memory blocks when larger than SHARED_MEMORY_THRESHOLD. The pool is replaced
+    when one of its processes dies, failing only the tasks it was running.
+    """
+
+    def __init__(self, worker: WorkerInterface, process_count: int, api_client: ApiClient):
+        self.api_client = api_client
+        self.__worker = worker
+        self.__process_count = max(process_count, 1)
+        self.__pool_lock = threading.Lock()
+        self.__pool = self.__create_pool()
+
+    def __create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.__process_count,
+            initializer=_initialize_process,
+            initargs=(self.__worker,)
+        )
+
+    def __replace_broken_pool(self, broken_pool: ProcessPoolExecutor) -> None:
+        with self.__pool_lock:
+            # other tasks of the same pool fail together, only the first one replaces it
+            if self.__pool is not broken_pool:
+                return
+            self.__pool = self.__create_pool()
+        broken_pool.shutdown(wait=False, cancel_futures=True)
+
+    def execute(self, task: Task) -> TaskResult:
+        # payloads never leave the runner, so orjson is used whenever it is installed
+        task_payload = put_payload(json_encoder.dumps(task, self.api_client.sanitize_for_serialization, use_orjson=True))
+        pool = self.__pool
+        try:
+            result_payload = pool.submit(_execute_in_process, task_payload).result()
+        except BaseException as e:
+            # the task never reached the worker, or the process died before freeing it
+            release_payload(task_payload)
+            if isinstance(e, BrokenProcessPool):
+                self.__replace_broken_pool(pool)
+            raise
+        return self.api_client.deserialize_class(json.loads(take_payload(result_payload)), "TaskResult")
+
+    def shutdown(self) -> None:
+        with self.__pool_lock:
+            self.__pool.shutdown(wait=False, cancel_futures=True)
@@ -2,13 +2,20 @@ from __future__ import annotations
 import importlib
 import logging
 import os
+import time
 from multiprocessing import Process, freeze_support, Queue, set_start_method
 from sys import platform
 from typing import List, Optional
 
 from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.automator.task_runner_group import TaskRunnerGroup
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.token_manager import SharedToken
+from conductor.shared.configuration.settings.external_payload_settings import ExternalPayloadSettings
+from conductor.shared.automator.shutdown import on_shutdown_signal
 from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.shutdown_settings import ShutdownSettings
+from conductor.shared.configuration.settings.task_update_settings import TaskUpdateSettings
 from conductor.client.telemetry.metrics_collector import MetricsCollector
 from conductor.client.worker.worker import Worker
 from conductor.client.worker.worker_interface import WorkerInterface
@@ -19,6 +26,10 @@ logger = logging.getLogger(
     )
 )
 
+# one process per worker, or workers sharing processes as threads
+PROCESS_MODE = "process"
+THREAD_MODE = "thread"
+
 _decorated_functions = {}
 _mp_fork_set = False
 if not _mp_fork_set:
@@ -33,13 +44,28 @@ if not _mp_fork_set:
     if platform == "darwin":
         os.environ["no_proxy"] = "*"
 
-def register_decorated_fn(name: str, poll_interval: int, domain: str, worker_id: str, func):
+def register_decorated_fn(name: str, poll_interval: int, domain: str, worker_id: str, func,
+                          batch_size: int = 1, poll_timeout: int = 100, thread_count: int = 1,
+                          adaptive_polling: bool = False, max_poll_interval: int = 5000,
+                          max_batch_size: int = 1, max_batch_wait_ms: int = 100,
+                          executor_type: str = "thread", poll_all_task_types: bool = False,
+                          lazy_task: bool = False):
     logger.info("decorated %s", name)
     _decorated_functions[(name, domain)] = {
         "func": func,
         "poll_interval": poll_interval,
         "domain": domain,
-        "worker_id": worker_id
+        "worker_id": worker_id,
+        "batch_size": batch_size,
+        "poll_timeout": poll_timeout,
+        "thread_count": thread_count,
+        "adaptive_polling": adaptive_polling,
+        "max_poll_interval": max_poll_interval,
+        "max_batch_size": max_batch_size,
+        "max_batch_wait_ms": max_batch_wait_ms,
+        "executor_type": executor_type,
+        "poll_all_task_types": poll_all_task_types,
+        "lazy_task": lazy_task
     }
 
 
@@ -50,9 +76,21 @@ class TaskHandler:
             configuration: Optional[Configuration] = None,
             metrics_settings: Optional[MetricsSettings] = None,
             scan_for_annotated_workers: bool = True,
-            import_modules: Optional[List[str]] = None
+            import_modules: Optional[List[str]] = None,
+            task_update_settings: Optional[TaskUpdateSettings] = None,
+            worker_mode: str = PROCESS_MODE,
+            process_count: int = 1,
+            share_auth_token: bool = False,
+            external_payload_settings: Optional[ExternalPayloadSettings] = None,
+            shutdown_settings: Optional[ShutdownSettings] = None
     ):
+        if worker_mode not in (PROCESS_MODE, THREAD_MODE):
+            raise Exception(f"Invalid worker mode: {worker_mode}")
+        if share_auth_token and configuration is not None and configuration.shared_token is None:
+            # the worker processes refresh one token instead of each requesting its own
+            configuration.shared_token = SharedToken()
         workers = workers or []
+        self.shutdown_settings = shutdown_settings
         self.logger_process, self.queue = _setup_logging_queue(configuration)
 
         # imports
@@ -76,11 +114,30 @@ class TaskHandler:
                     execute_function=fn,
                     worker_id=worker_id,
                     domain=domain,
-                    poll_interval=poll_interval)
+                    poll_interval=poll_interval,
+                    batch_size=record.get("batch_size"),
+                    poll_timeout=record.get("poll_timeout"),
+                    thread_count=record.get("thread_count"),
+                    adaptive_polling=record.get("adaptive_polling", False),
+                    max_poll_interval=record.get("max_poll_interval"),
+                    max_batch_size=record.get("max_batch_size"),
+                    max_batch_wait_ms=record.get("max_batch_wait_ms"),
+                    executor_type=record.get("executor_type"),
+                    poll_all_task_types=record.get("poll_all_task_types", False),
+                    lazy_task=record.get("lazy_task", False))
                 logger.info("created worker with name=%s and domain=%s", task_def_name, domain)
                 workers.append(worker)
 
-        self.__create_task_runner_processes(workers, configuration, metrics_settings)
+        if worker_mode == THREAD_MODE:
+            self.__create_task_runner_group_processes(
+                workers, configuration, metrics_settings, task_update_settings, process_count,
+                external_payload_settings, shutdown_settings
+            )
+        else:
+            self.__create_task_runner_processes(
+                workers, configuration, metrics_settings, task_update_settings, external_payload_settings,
+                shutdown_settings
+            )
         self.__create_metrics_provider_process(metrics_settings)
         logger.info("TaskHandler initialized")
 
@@ -91,7 +148,10 @@ class TaskHandler:
         self.stop_processes()
 
     def stop_processes(self) -> None:
-        self.__stop_task_runner_processes()
+        if self.shutdown_settings is not None:
+            self.__drain_task_runner_processes()
+        else:
+            self.__stop_task_runner_processes()
         self.__stop_metrics_provider_process()
         logger.info("Stopped worker processes...")
         self.queue.put(None)
@@ -105,6 +165,9 @@ class TaskHandler:
         logger.info("Started all processes")
 
     def join_processes(self) -> None:
+        if self.shutdown_settings is not None:
+            # containers are stopped with SIGTERM to the main process only
+            on_shutdown_signal(self.stop_processes)
         try:
             self.__join_task_runner_processes()
             self.__join_metrics_provider_process()
@@ -127,21 +190,53 @@ class TaskHandler:
             self,
             workers: List[WorkerInterface],
             configuration: Configuration,
-            metrics_settings: MetricsSettings
+            metrics_settings: MetricsSettings,
+            task_update_settings: Optional[TaskUpdateSettings] = None,
+            external_payload_settings: Optional[ExternalPayloadSettings] = None,
+            shutdown_settings: Optional[ShutdownSettings] = None
     ) -> None:
         self.task_runner_processes = []
         for worker in workers:
             self.__create_task_runner_process(
-                worker, configuration, metrics_settings
+                worker, configuration, metrics_settings, task_update_settings, external_payload_settings,
+                shutdown_settings
+            )
+
+    def __create_task_runner_group_processes(
+            self,
+            workers: List[WorkerInterface],
+            configuration: Configuration,
+            metrics_settings: MetricsSettings,
+            task_update_settings: Optional[TaskUpdateSettings],
+            process_count: int,
+            external_payload_settings: Optional[ExternalPayloadSettings] = None,
+            shutdown_settings: Optional[ShutdownSettings] = None
+    ) -> None:
+        self.task_runner_processes = []
+        process_count = min(max(process_count, 1), len(workers))
+        # deal the workers round robin so that every process gets a similar share
+        for shard in range(process_count):
+            task_runner_group = TaskRunnerGroup(
+                workers[shard::process_count], configuration, metrics_settings, task_update_settings,
+                external_payload_settings, shutdown_settings
             )
+            process = Process(target=task_runner_group.run)
+            self.task_runner_processes.append(process)
 
     def __create_task_runner_process(
             self,
             worker: WorkerInterface,
             configuration: Configuration,
-            metrics_settings: MetricsSettings
+            metrics_settings: MetricsSettings,
+            task_update_settings: Optional[TaskUpdateSettings] = None,
+            external_payload_settings: Optional[ExternalPayloadSettings] = None,
+            shutdown_settings: Optional[ShutdownSettings] = None
     ) -> None:
-        task_runner = TaskRunner(worker, configuration, metrics_settings)
+        task_runner = TaskRunner(
+            worker, configuration, metrics_settings, task_update_settings,
+            external_payload_settings=external_payload_settings,
+            shutdown_settings=shutdown_settings
+        )
         process = Process(target=task_runner.run)
         self.task_runner_processes.append(process)
 
@@ -176,6 +271,21 @@ class TaskHandler:
         for task_runner_process in self.task_runner_processes:
             self.__stop_process(task_runner_process)
 
+    def __drain_task_runner_processes(self):
+        # SIGTERM makes the runners stop polling and drain, the ones outliving the deadline are killed
+        for task_runner_process in self.task_runner_processes:
+            if task_runner_process.is_alive():
+                self.__stop_process(task_runner_process)
+        deadline = time.monotonic() + self.shutdown_settings.drain_timeout + self.shutdown_settings.kill_grace_period
+        for task_runner_process in self.task_runner_processes:
+            if task_runner_process.pid is None:
+                continue
+            task_runner_process.join(max(deadline - time.monotonic(), 0))
+            if task_runner_process.is_alive():
+                logger.warning("TaskRunner process %s did not drain in time, killing it", task_runner_process.pid)
+                task_runner_process.kill()
+        logger.info("Drained TaskRunner processes")
+
     def __stop_process(self, process: Process):
         if process is None:
             return
@@ -1,19 +1,34 @@
+import json
 import logging
 import os
 import sys
+import threading
 import time
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set, Tuple
 
+from conductor.client.automator.external_payload_storage import ConductorExternalPayloadStorage
+from conductor.client.automator.process_executor import ProcessTaskExecutor
+from conductor.client.automator.task_updater import TaskUpdater
 from conductor.client.configuration.configuration import Configuration
+from conductor.shared.configuration.settings.external_payload_settings import ExternalPayloadSettings
 from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.shutdown_settings import ShutdownSettings
+from conductor.shared.configuration.settings.task_update_settings import TaskUpdateSettings
+from conductor.client.http import json_encoder
 from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_view import TaskView
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
 from conductor.client.http.rest import AuthorizationException
 from conductor.client.telemetry.metrics_collector import MetricsCollector
-from conductor.client.worker.worker_interface import WorkerInterface
+from conductor.client.worker.worker_interface import PROCESS_EXECUTOR, WorkerInterface
+from conductor.shared.automator.polling import AdaptivePollingInterval
+from conductor.shared.automator.shutdown import on_shutdown_signal
+from conductor.shared.http.enums import ExternalPayloadOperation, ExternalPayloadType
 
 logger = logging.getLogger(
     Configuration.get_logging_formatted_name(
@@ -27,12 +42,17 @@ class TaskRunner:
             self,
             worker: WorkerInterface,
             configuration: Configuration = None,
-            metrics_settings: MetricsSettings = None
+            metrics_settings: MetricsSettings = None,
+            task_update_settings: TaskUpdateSettings = None,
+            api_client: ApiClient = None,
+            external_payload_settings: ExternalPayloadSettings = None,
+            shutdown_settings: ShutdownSettings = None
     ):
         if not isinstance(worker, WorkerInterface):
             raise Exception("Invalid worker")
         self.worker = worker
         self.__set_worker_properties()
+        self.__validate_worker_properties()
         if not isinstance(configuration, Configuration):
             configuration = Configuration()
         self.configuration = configuration
@@ -41,11 +61,60 @@ class TaskRunner:
             self.metrics_collector = MetricsCollector(
                 metrics_settings
             )
-        self.task_client = TaskResourceApi(
-            ApiClient(
+        if api_client is None:
+            api_client = ApiClient(
                 configuration=self.configuration
             )
+        self.task_client = TaskResourceApi(api_client)
+        # without update settings results are sent inline, before the next poll,
+        # and failed updates are retried with the default backoff
+        self.task_update_settings = task_update_settings or TaskUpdateSettings()
+        self.task_updater = None
+        if task_update_settings is not None:
+            self.task_updater = TaskUpdater(
+                self.task_client, task_update_settings, self.metrics_collector
+            )
+        # externalized inputs are always downloaded, outputs are only uploaded with settings
+        self.external_payload_settings = external_payload_settings
+        if external_payload_settings is not None and external_payload_settings.storage is not None:
+            self.external_payload_storage = external_payload_settings.storage
+        else:
+            self.external_payload_storage = ConductorExternalPayloadStorage(self.task_client)
+        # created lazily so that the pool threads belong to the runner process,
+        # unless a pool shared with other runners is assigned before run()
+        self.executor = None
+        self._running_tasks: Set[Future] = set()
+        self._poll_executor = None
+        self._process_executor = None
+        self._process_executor_lock = threading.Lock()
+        self._running_tasks_by_name: Dict[str, Set[Future]] = {}
+        self._adaptive_polling_interval = AdaptivePollingInterval(
+            max_interval=self.worker.max_poll_interval / 1000
         )
+        # without shutdown settings SIGTERM keeps its default behaviour
+        self.shutdown_settings = shutdown_settings
+        self._stop_requested = threading.Event()
+        self._drain_deadline = None
+        self._release_timer = None
+        self._in_flight_tasks: Dict[str, Tuple[Task, str]] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def __getstate__(self):
+        # TaskHandler pickles the runner when worker processes are spawned
+        state = self.__dict__.copy()
+        del state["_process_executor_lock"]
+        del state["_in_flight_lock"]
+        state["_stop_requested"] = self._stop_requested.is_set()
+        return state
+
+    def __setstate__(self, state):
+        stop_requested = state.pop("_stop_requested")
+        self.__dict__.update(state)
+        self._process_executor_lock = threading.Lock()
+        self._in_flight_lock = threading.Lock()
+        self._stop_requested = threading.Event()
+        if stop_requested:
+            self._stop_requested.set()
 
     def run(self) -> None:
         if self.configuration is not None:
@@ -61,22 +130,252 @@ class TaskRunner:
             self.worker.get_polling_interval_in_seconds()
         )
 
-        while True:
-            self.run_once()
+        if self.shutdown_settings is not None:
+            on_shutdown_signal(self.stop)
+        try:
+            while not self._stop_requested.is_set():
+                self.run_once()
+        finally:
+            self.__drain()
+
+    def stop(self) -> None:
+        """
+        Stops polling. Tasks in flight get until the drain deadline to finish,
+        after which they are released back to the server.
+        """
+        if self._stop_requested.is_set():
+            return
+        shutdown_settings = self.shutdown_settings or ShutdownSettings()
+        logger.info(
+            "Stopping task runner for %s, draining tasks in flight for up to %s seconds",
+            ",".join(self.worker.task_definition_names),
+            shutdown_settings.drain_timeout
+        )
+        self._drain_deadline = time.monotonic() + shutdown_settings.drain_timeout
+        self._stop_requested.set()
+        # sequential workers execute on the polling thread, which cannot release its own task
+        self._release_timer = threading.Timer(shutdown_settings.drain_timeout, self.__release_in_flight_tasks)
+        self._release_timer.daemon = True
+        self._release_timer.start()
+
+    def __drain(self) -> None:
+        if self._stop_requested.is_set():
+            running_tasks = set(self._running_tasks).union(*self._running_tasks_by_name.values())
+            if len(running_tasks) > 0:
+                wait(running_tasks, timeout=max(self._drain_deadline - time.monotonic(), 0))
+            self._release_timer.cancel()
+            self.__release_in_flight_tasks()
+        if self.task_updater is not None:
+            self.task_updater.stop()
+        if self._process_executor is not None:
+            self._process_executor.shutdown()
+
+    def __track_in_flight_tasks(self, tasks: List[Task], task_definition_name: str) -> None:
+        with self._in_flight_lock:
+            for task in tasks:
+                self._in_flight_tasks[task.task_id] = (task, task_definition_name)
+
+    def __untrack_in_flight_task(self, task: Task) -> bool:
+        """Returns False when the task was released while it executed, and its result must be dropped."""
+        with self._in_flight_lock:
+            return self._in_flight_tasks.pop(task.task_id, None) is not None
+
+    def __release_in_flight_tasks(self) -> None:
+        with self._in_flight_lock:
+            in_flight_tasks = list(self._in_flight_tasks.values())
+            self._in_flight_tasks.clear()
+        for task, task_definition_name in in_flight_tasks:
+            logger.warning(
+                "Releasing task still running at the drain deadline, id: %s, workflow_instance_id: %s, "
+                "task_definition_name: %s",
+                task.task_id,
+                task.workflow_instance_id,
+                task_definition_name
+            )
+            # an IN_PROGRESS update puts the task back in the queue after callback_after_seconds
+            task_result = TaskResult(
+                task_id=task.task_id,
+                workflow_instance_id=task.workflow_instance_id,
+                worker_id=self.worker.get_identity()
+            )
+            task_result.status = "IN_PROGRESS"
+            task_result.callback_after_seconds = 0
+            task_result.logs = [TaskExecLog(
+                "Released by a worker shutting down", task_result.task_id, int(time.time()))]
+            self.__submit_task_result(task_result, task_definition_name)
 
     def run_once(self) -> None:
+        if self.worker.poll_all_task_types and len(self.worker.task_definition_names) > 1:
+            self.__run_once_for_all_task_types()
+            return
+        if self.worker.max_batch_size > 1:
+            self.__run_once_in_batches()
+            return
+        if self.worker.thread_count > 1:
+            self.__run_once_concurrently()
+            return
+        try:
+            if self.worker.batch_size > 1:
+                tasks = self.__batch_poll_tasks()
+            else:
+                task = self.__poll_task()
+                tasks = [task] if task is not None else []
+            for task in tasks:
+                if task is not None and task.task_id is not None:
+                    task_result = self.__execute_task(task)
+                    self.__submit_task_result(task_result)
+            if self.worker.adaptive_polling:
+                self.__wait_for_adaptive_polling_interval(len(tasks) > 0)
+            # the server already holds a batch poll open for poll_timeout,
+            # so only back off when it came back empty
+            elif self.worker.batch_size <= 1 or len(tasks) == 0:
+                self.__wait_for_polling_interval()
+            self.worker.clear_task_definition_name_cache()
+        except Exception:
+            pass
+
+    def __run_once_concurrently(self) -> None:
+        try:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.worker.thread_count,
+                    thread_name_prefix="conductor-worker"
+                )
+            self._running_tasks = {f for f in self._running_tasks if not f.done()}
+            task_definition_name = self.worker.get_task_definition_name()
+            available_slots = self.worker.thread_count - len(self._running_tasks)
+            if available_slots <= 0:
+                if self.metrics_collector is not None:
+                    self.metrics_collector.increment_task_execution_queue_full(task_definition_name)
+                wait(
+                    self._running_tasks,
+                    timeout=self.worker.get_polling_interval_in_seconds(),
+                    return_when=FIRST_COMPLETED
+                )
+                return
+            # fill every free slot in a single round trip
+            if available_slots > 1:
+                tasks = self.__batch_poll_tasks(available_slots)
+            else:
+                task = self.__poll_task()
+                tasks = [task] if task is not None else []
+            for task in tasks:
+                if task is not None and task.task_id is not None:
+                    future = self.executor.submit(
+                        self.__execute_and_update_task, task, task_definition_name
+                    )
+                    self._running_tasks.add(future)
+            if self.worker.adaptive_polling:
+                self.__wait_for_adaptive_polling_interval(len(tasks) > 0)
+            elif len(tasks) == 0:
+                self.__wait_for_polling_interval()
+            self.worker.clear_task_definition_name_cache()
+        except Exception:
+            pass
+
+    def __run_once_in_batches(self) -> None:
         try:
-            task = self.__poll_task()
-            if task is not None and task.task_id is not None:
-                task_result = self.__execute_task(task)
-                self.__update_task(task_result)
-            self.__wait_for_polling_interval()
+            task_definition_name = self.worker.get_task_definition_name()
+            tasks = self.__poll_task_batch(task_definition_name)
+            if len(tasks) > 0:
+                for task_result in self.__execute_task_batch(tasks, task_definition_name):
+                    self.__submit_task_result(task_result, task_definition_name)
+            if self.worker.adaptive_polling:
+                self.__wait_for_adaptive_polling_interval(len(tasks) > 0)
+            elif len(tasks) == 0:
+                self.__wait_for_polling_interval()
             self.worker.clear_task_definition_name_cache()
         except Exception:
             pass
 
-    def __poll_task(self) -> Task:
-        task_definition_name = self.worker.get_task_definition_name()
+    def __poll_task_batch(self, task_definition_name: str) -> List[Task]:
+        # keeps polling until the batch is full or max_batch_wait_ms has passed
+        deadline = time.monotonic() + self.worker.max_batch_wait_ms / 1000
+        tasks = []
+        while len(tasks) < self.worker.max_batch_size:
+            polled_tasks = self.__batch_poll_tasks(self.worker.max_batch_size - len(tasks), task_definition_name)
+            tasks.extend(task for task in polled_tasks if task is not None and task.task_id is not None)
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+            if len(polled_tasks) == 0:
+                time.sleep(min(self.worker.get_polling_interval_in_seconds(), remaining_time))
+        return tasks
+
+    def __run_once_for_all_task_types(self) -> None:
+        try:
+            task_definition_names = self.worker.task_definition_names
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.worker.thread_count * len(task_definition_names),
+                    thread_name_prefix="conductor-worker"
+                )
+            if self._poll_executor is None:
+                self._poll_executor = ThreadPoolExecutor(
+                    max_workers=len(task_definition_names),
+                    thread_name_prefix="conductor-poller"
+                )
+            # every task definition gets thread_count slots, as it would with a worker of its own
+            polls = {}
+            for task_definition_name in task_definition_names:
+                running_tasks = {
+                    f for f in self._running_tasks_by_name.get(task_definition_name, ()) if not f.done()
+                }
+                self._running_tasks_by_name[task_definition_name] = running_tasks
+                available_slots = self.worker.thread_count - len(running_tasks)
+                if available_slots <= 0:
+                    if self.metrics_collector is not None:
+                        self.metrics_collector.increment_task_execution_queue_full(task_definition_name)
+                    continue
+                polls[task_definition_name] = self._poll_executor.submit(
+                    self.__poll_tasks, available_slots, task_definition_name
+                )
+            if len(polls) == 0:
+                running_tasks = set().union(*self._running_tasks_by_name.values())
+                wait(
+                    running_tasks,
+                    timeout=self.worker.get_polling_interval_in_seconds(),
+                    return_when=FIRST_COMPLETED
+                )
+                return
+            tasks_received = False
+            for task_definition_name, poll in polls.items():
+                for task in poll.result():
+                    if task is not None and task.task_id is not None:
+                        tasks_received = True
+                        future = self.executor.submit(
+                            self.__execute_and_update_task, task, task_definition_name
+                        )
+                        self._running_tasks_by_name[task_definition_name].add(future)
+            if self.worker.adaptive_polling:
+                self.__wait_for_adaptive_polling_interval(tasks_received)
+            elif not tasks_received:
+                self.__wait_for_polling_interval()
+        except Exception:
+            pass
+
+    def __poll_tasks(self, count: int, task_definition_name: str) -> List[Task]:
+        if count > 1:
+            return self.__batch_poll_tasks(count, task_definition_name)
+        task = self.__poll_task(task_definition_name)
+        return [task] if task is not None else []
+
+    def __execute_and_update_task(self, task: Task, task_definition_name: str) -> None:
+        try:
+            task_result = self.__execute_task(task, task_definition_name)
+            self.__submit_task_result(task_result, task_definition_name)
+        except Exception:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_uncaught_exception()
+            logger.error(
+                "Uncaught exception while handling task, id: %s, reason: %s",
+                task.task_id,
+                traceback.format_exc()
+            )
+
+    def __poll_task(self, task_definition_name: Optional[str] = None) -> Task:
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         if self.worker.paused():
             logger.debug("Stop polling task for: %s", task_definition_name)
             return None
@@ -91,14 +390,19 @@ class TaskRunner:
             params = {"workerid": self.worker.get_identity()}
             if domain is not None:
                 params["domain"] = domain
-            task = self.task_client.poll(tasktype=task_definition_name, **params)
+            if self.worker.lazy_task:
+                task = self.__to_task_view(
+                    self.task_client.poll(tasktype=task_definition_name, _raw_response=True, **params)
+                )
+            else:
+                task = self.task_client.poll(tasktype=task_definition_name, **params)
             finish_time = time.time()
             time_spent = finish_time - start_time
             if self.metrics_collector is not None:
                 self.metrics_collector.record_task_poll_time(task_definition_name, time_spent)
         except AuthorizationException as auth_exception:
             if self.metrics_collector is not None:
-                self.metrics_collector.increment_task_poll_error(task_definition_name, type(auth_exception))
+                self.metrics_collector.increment_task_poll_error(task_definition_name, auth_exception)
             if auth_exception.invalid_token:
                 logger.fatal(f"failed to poll task {task_definition_name} due to invalid auth token")
             else:
@@ -106,7 +410,7 @@ class TaskRunner:
             return None
         except Exception as e:
             if self.metrics_collector is not None:
-                self.metrics_collector.increment_task_poll_error(task_definition_name, type(e))
+                self.metrics_collector.increment_task_poll_error(task_definition_name, e)
             logger.error(
                 "Failed to poll task for: %s, reason: %s",
                 task_definition_name,
@@ -122,19 +426,88 @@ class TaskRunner:
             )
         return task
 
-    def __execute_task(self, task: Task) -> TaskResult:
+    def __batch_poll_tasks(self, count: Optional[int] = None, task_definition_name: Optional[str] = None) -> List[Task]:
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
+        if self.worker.paused():
+            logger.debug("Stop polling task for: %s", task_definition_name)
+            return []
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_task_poll(
+                task_definition_name
+            )
+
+        try:
+            start_time = time.time()
+            domain = self.worker.get_domain()
+            params = {
+                "workerid": self.worker.get_identity(),
+                "count": self.worker.batch_size if count is None else count,
+                "timeout": self.worker.poll_timeout
+            }
+            if domain is not None:
+                params["domain"] = domain
+            if self.worker.lazy_task:
+                tasks = self.task_client.batch_poll(tasktype=task_definition_name, _raw_response=True, **params)
+                if tasks is not None:
+                    tasks = [TaskView(task, self.task_client.api_client) for task in tasks]
+            else:
+                tasks = self.task_client.batch_poll(tasktype=task_definition_name, **params)
+            finish_time = time.time()
+            time_spent = finish_time - start_time
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_poll_time(task_definition_name, time_spent)
+        except AuthorizationException as auth_exception:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(task_definition_name, auth_exception)
+            if auth_exception.invalid_token:
+                logger.fatal(f"failed to batch poll task {task_definition_name} due to invalid auth token")
+            else:
+                logger.fatal(f"failed to batch poll task {task_definition_name} error: {auth_exception.status} - {auth_exception.error_code}")
+            return []
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(task_definition_name, e)
+            logger.error(
+                "Failed to batch poll task for: %s, reason: %s",
+                task_definition_name,
+                traceback.format_exc()
+            )
+            return []
+        if tasks is None:
+            return []
+        logger.debug(
+            "Polled %s tasks: %s, worker_id: %s, domain: %s",
+            len(tasks),
+            task_definition_name,
+            self.worker.get_identity(),
+            self.worker.get_domain()
+        )
+        return tasks
+
+    def __to_task_view(self, data) -> Optional[TaskView]:
+        # polling an empty queue answers without a json body
+        if not isinstance(data, dict):
+            return None
+        return TaskView(data, self.task_client.api_client)
+
+    def __execute_task(self, task: Task, task_definition_name: Optional[str] = None) -> TaskResult:
         if not isinstance(task, Task):
             return None
-        task_definition_name = self.worker.get_task_definition_name()
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         logger.debug(
             "Executing task, id: %s, workflow_instance_id: %s, task_definition_name: %s",
             task.task_id,
             task.workflow_instance_id,
             task_definition_name
         )
+        self.__track_in_flight_tasks([task], task_definition_name)
         try:
+            if task.external_input_payload_storage_path:
+                self.__download_external_input(task, task_definition_name)
             start_time = time.time()
-            task_result = self.worker.execute(task)
+            task_result = self.__run_worker(task)
             finish_time = time.time()
             time_spent = finish_time - start_time
             if self.metrics_collector is not None:
@@ -146,6 +519,13 @@ class TaskRunner:
                     task_definition_name,
                     sys.getsizeof(task_result)
                 )
+                # queue wait is measured by the server, so it is free of clock skew
+                self.metrics_collector.record_task_end_to_end_time(
+                    task_definition_name,
+                    (task.queue_wait_time or 0) / 1000 + time_spent
+                )
+            if self.external_payload_settings is not None:
+                self.__upload_external_output(task_result, task_definition_name)
             logger.debug(
                 "Executed task, id: %s, workflow_instance_id: %s, task_definition_name: %s",
                 task.task_id,
@@ -155,7 +535,7 @@ class TaskRunner:
         except Exception as e:
             if self.metrics_collector is not None:
                 self.metrics_collector.increment_task_execution_error(
-                    task_definition_name, type(e)
+                    task_definition_name, e
                 )
             task_result = TaskResult(
                 task_id=task.task_id,
@@ -174,24 +554,152 @@ class TaskRunner:
                 task_definition_name,
                 traceback.format_exc()
             )
+        if not self.__untrack_in_flight_task(task):
+            return None
         return task_result
 
-    def __update_task(self, task_result: TaskResult):
+    def __run_worker(self, task: Task) -> TaskResult:
+        if self.worker.executor_type != PROCESS_EXECUTOR:
+            return self.worker.execute(task)
+        if self._process_executor is None:
+            with self._process_executor_lock:
+                # created on first use so that the pool belongs to the runner process
+                if self._process_executor is None:
+                    self._process_executor = ProcessTaskExecutor(
+                        self.worker, self.worker.thread_count, self.task_client.api_client
+                    )
+        return self._process_executor.execute(task)
+
+    def __execute_task_batch(self, tasks: List[Task], task_definition_name: str) -> List[TaskResult]:
+        logger.debug(
+            "Executing batch of %s tasks, task_definition_name: %s",
+            len(tasks),
+            task_definition_name
+        )
+        self.__track_in_flight_tasks(tasks, task_definition_name)
+        try:
+            for task in tasks:
+                if task.external_input_payload_storage_path:
+                    self.__download_external_input(task, task_definition_name)
+            start_time = time.time()
+            task_results = self.worker.execute_batch(tasks)
+            time_spent = time.time() - start_time
+            if len(task_results) != len(tasks):
+                raise Exception(f"expected {len(tasks)} results from the batch, got {len(task_results)}")
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_execute_time(task_definition_name, time_spent)
+                for task in tasks:
+                    self.metrics_collector.record_task_end_to_end_time(
+                        task_definition_name,
+                        (task.queue_wait_time or 0) / 1000 + time_spent
+                    )
+            if self.external_payload_settings is not None:
+                for task_result in task_results:
+                    self.__upload_external_output(task_result, task_definition_name)
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_execution_error(task_definition_name, e)
+            logger.error(
+                "Failed to execute batch of %s tasks, task_definition_name: %s, reason: %s",
+                len(tasks),
+                task_definition_name,
+                traceback.format_exc()
+            )
+            task_results = []
+            for task in tasks:
+                task_result = TaskResult(
+                    task_id=task.task_id,
+                    workflow_instance_id=task.workflow_instance_id,
+                    worker_id=self.worker.get_identity()
+                )
+                task_result.status = "FAILED"
+                task_result.reason_for_incompletion = str(e)
+                task_result.logs = [TaskExecLog(
+                    traceback.format_exc(), task_result.task_id, int(time.time()))]
+                task_results.append(task_result)
+        return [
+            task_result for task, task_result in zip(tasks, task_results) if self.__untrack_in_flight_task(task)
+        ]
+
+    def __download_external_input(self, task: Task, task_definition_name: str) -> None:
+        location = self.external_payload_storage.get_location(
+            ExternalPayloadOperation.READ,
+            ExternalPayloadType.TASK_INPUT,
+            task.external_input_payload_storage_path
+        )
+        task.input_data = json.loads(self.external_payload_storage.download(location.uri))
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_external_payload_used(
+                task_definition_name, ExternalPayloadOperation.READ.value, ExternalPayloadType.TASK_INPUT.value
+            )
+
+    def __upload_external_output(self, task_result: TaskResult, task_definition_name: str) -> None:
+        if not isinstance(task_result, TaskResult) or not task_result.output_data:
+            return
+        payload = json_encoder.dumps(
+            task_result.output_data,
+            self.task_client.api_client.sanitize_for_serialization,
+            use_orjson=self.configuration.fast_json
+        )
+        if len(payload) <= self.external_payload_settings.output_threshold:
+            return
+        try:
+            location = self.external_payload_storage.get_location(
+                ExternalPayloadOperation.WRITE, ExternalPayloadType.TASK_OUTPUT
+            )
+            self.external_payload_storage.upload(location.uri, payload)
+        except Exception:
+            # the task itself succeeded, so its output is sent inline rather than lost
+            logger.warning(
+                "Failed to upload output of task, id: %s, size: %s, sending it inline, reason: %s",
+                task_result.task_id,
+                len(payload),
+                traceback.format_exc()
+            )
+            return
+        task_result.external_output_payload_storage_path = location.path
+        task_result.output_data = None
+        logger.debug(
+            "Uploaded output of task, id: %s, size: %s, to external storage path: %s",
+            task_result.task_id,
+            len(payload),
+            location.path
+        )
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_external_payload_used(
+                task_definition_name, ExternalPayloadOperation.WRITE.value, ExternalPayloadType.TASK_OUTPUT.value
+            )
+
+    def __submit_task_result(self, task_result: TaskResult, task_definition_name: Optional[str] = None):
+        if self.task_updater is None:
+            return self.__update_task(task_result, task_definition_name)
+        if not isinstance(task_result, TaskResult):
+            return None
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
+        self.task_updater.submit(task_result, task_definition_name)
+        return None
+
+    def __update_task(self, task_result: TaskResult, task_definition_name: Optional[str] = None):
         if not isinstance(task_result, TaskResult):
             return None
-        task_definition_name = self.worker.get_task_definition_name()
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         logger.debug(
             "Updating task, id: %s, workflow_instance_id: %s, task_definition_name: %s",
             task_result.task_id,
             task_result.workflow_instance_id,
             task_definition_name
         )
-        for attempt in range(4):
+        for attempt in range(self.task_update_settings.max_attempts):
             if attempt > 0:
-                # Wait for [10s, 20s, 30s] before next attempt
-                time.sleep(attempt * 10)
+                time.sleep(self.task_update_settings.backoff(attempt))
             try:
+                start_time = time.time()
                 response = self.task_client.update_task(body=task_result)
+                time_spent = time.time() - start_time
+                if self.metrics_collector is not None:
+                    self.metrics_collector.record_task_update_time(task_definition_name, time_spent)
                 logger.debug(
                     "Updated task, id: %s, workflow_instance_id: %s, task_definition_name: %s, response: %s",
                     task_result.task_id,
@@ -203,7 +711,7 @@ class TaskRunner:
             except Exception as e:
                 if self.metrics_collector is not None:
                     self.metrics_collector.increment_task_update_error(
-                        task_definition_name, type(e)
+                        task_definition_name, e
                     )
                 logger.error(
                     "Failed to update task, id: %s, workflow_instance_id: %s, task_definition_name: %s, reason: %s",
@@ -218,6 +726,19 @@ class TaskRunner:
         polling_interval = self.worker.get_polling_interval_in_seconds()
         time.sleep(polling_interval)
 
+    def __wait_for_adaptive_polling_interval(self, tasks_received: bool) -> None:
+        polling_interval = self._adaptive_polling_interval.next_interval(
+            self.worker.get_polling_interval_in_seconds(),
+            tasks_received
+        )
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_task_poll_interval(
+                self.worker.get_task_definition_name(),
+                polling_interval
+            )
+        if polling_interval > 0:
+            time.sleep(polling_interval)
+
     def __set_worker_properties(self) -> None:
         # If multiple tasks are supplied to the same worker, then only first
         # task will be considered for setting worker properties
@@ -243,6 +764,71 @@ class TaskRunner:
             except Exception as e:
                 logger.error("Exception in reading polling interval from environment variable: %s", e)
 
+        batch_size = self.__get_property_value_from_env("batch_size", task_type)
+        if batch_size:
+            try:
+                self.worker.batch_size = int(batch_size)
+            except Exception:
+                logger.error("error reading and parsing the batch size value %s", batch_size)
+
+        poll_timeout = self.__get_property_value_from_env("poll_timeout", task_type)
+        if poll_timeout:
+            try:
+                self.worker.poll_timeout = int(poll_timeout)
+            except Exception:
+                logger.error("error reading and parsing the poll timeout value %s", poll_timeout)
+
+        thread_count = self.__get_property_value_from_env("thread_count", task_type)
+        if thread_count:
+            try:
+                self.worker.thread_count = int(thread_count)
+            except Exception:
+                logger.error("error reading and parsing the thread count value %s", thread_count)
+
+        adaptive_polling = self.__get_property_value_from_env("adaptive_polling", task_type)
+        if adaptive_polling:
+            self.worker.adaptive_polling = adaptive_polling.lower() in ("true", "1", "yes")
+
+        poll_all_task_types = self.__get_property_value_from_env("poll_all_task_types", task_type)
+        if poll_all_task_types:
+            self.worker.poll_all_task_types = poll_all_task_types.lower() in ("true", "1", "yes")
+
+        lazy_task = self.__get_property_value_from_env("lazy_task", task_type)
+        if lazy_task:
+            self.worker.lazy_task = lazy_task.lower() in ("true", "1", "yes")
+
+        max_batch_size = self.__get_property_value_from_env("max_batch_size", task_type)
+        if max_batch_size:
+            try:
+                self.worker.max_batch_size = int(max_batch_size)
+            except Exception:
+                logger.error("error reading and parsing the max batch size value %s", max_batch_size)
+
+        max_batch_wait_ms = self.__get_property_value_from_env("max_batch_wait_ms", task_type)
+        if max_batch_wait_ms:
+            try:
+                self.worker.max_batch_wait_ms = int(max_batch_wait_ms)
+            except Exception:
+                logger.error("error reading and parsing the max batch wait value %s", max_batch_wait_ms)
+
+        executor_type = self.__get_property_value_from_env("executor_type", task_type)
+        if executor_type:
+            self.worker.executor_type = executor_type.lower()
+
+        max_poll_interval = self.__get_property_value_from_env("max_poll_interval", task_type)
+        if max_poll_interval:
+            try:
+                self.worker.max_poll_interval = float(max_poll_interval)
+            except Exception:
+                logger.error("error reading and parsing the max poll interval value %s", max_poll_interval)
+
+    def __validate_worker_properties(self) -> None:
+        # environment overrides are applied after the worker was created, so they are checked again here
+        if self.worker.lazy_task and self.worker.executor_type == PROCESS_EXECUTOR:
+            raise Exception("lazy_task cannot be used with the process executor")
+        if self.worker.max_batch_size > 1 and self.worker.executor_type == PROCESS_EXECUTOR:
+            raise Exception("max_batch_size cannot be greater than 1 with the process executor")
+
     def __get_property_value_from_env(self, prop, task_type):
         """
         get the property from the env variable
@@ -0,0 +1,104 @@
+from __future__ import annotations
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.configuration.configuration import Configuration
+from conductor.shared.configuration.settings.external_payload_settings import ExternalPayloadSettings
+from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.shutdown_settings import ShutdownSettings
+from conductor.shared.configuration.settings.task_update_settings import TaskUpdateSettings
+from conductor.client.http.api_client import ApiClient
+from conductor.client.worker.worker_interface import WorkerInterface
+from conductor.shared.automator.shutdown import on_shutdown_signal
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+class TaskRunnerGroup:
+    """
+    Runs several workers in a single process.
+
+    Every worker polls from its own thread, while all of them share one API
+    client connection pool and one thread pool for concurrent task execution.
+    """
+
+    def __init__(
+            self,
+            workers: List[WorkerInterface],
+            configuration: Configuration = None,
+            metrics_settings: MetricsSettings = None,
+            task_update_settings: TaskUpdateSettings = None,
+            external_payload_settings: ExternalPayloadSettings = None,
+            shutdown_settings: ShutdownSettings = None
+    ):
+        for worker in workers:
+            if not isinstance(worker, WorkerInterface):
+                raise Exception("Invalid worker")
+        if not isinstance(configuration, Configuration):
+            configuration = Configuration()
+        self.workers = workers
+        self.configuration = configuration
+        self.metrics_settings = metrics_settings
+        self.task_update_settings = task_update_settings
+        self.external_payload_settings = external_payload_settings
+        self.shutdown_settings = shutdown_settings
+
+    def run(self) -> None:
+        # the connection pool and the execution threads are created here so that
+        # they belong to the process the group runs in
+        api_client = ApiClient(configuration=self.configuration)
+        task_runners = [
+            TaskRunner(
+                worker,
+                self.configuration,
+                self.metrics_settings,
+                self.task_update_settings,
+                api_client=api_client,
+                external_payload_settings=self.external_payload_settings,
+                shutdown_settings=self.shutdown_settings
+            )
+            for worker in self.workers
+        ]
+        thread_count = sum(
+            _get_execution_thread_count(task_runner.worker) for task_runner in task_runners
+        )
+        executor = None
+        if thread_count > 0:
+            executor = ThreadPoolExecutor(
+                max_workers=thread_count,
+                thread_name_prefix="conductor-worker"
+            )
+        if self.shutdown_settings is not None:
+            # the runners poll from threads, which cannot handle signals themselves
+            for task_runner in task_runners:
+                on_shutdown_signal(task_runner.stop)
+        threads = []
+        for task_runner in task_runners:
+            task_runner.executor = executor
+            thread = threading.Thread(
+                target=task_runner.run,
+                name=f"conductor-runner-{task_runner.worker.get_task_definition_name()}",
+                daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        logger.info("Started %s TaskRunner threads", len(threads))
+        for thread in threads:
+            thread.join()
+
+
+def _get_execution_thread_count(worker: WorkerInterface) -> int:
+    task_type_count = len(worker.task_definition_names)
+    if worker.poll_all_task_types and task_type_count > 1:
+        return worker.thread_count * task_type_count
+    if worker.thread_count > 1:
+        return worker.thread_count
+    # sequential workers execute tasks on their polling thread
+    return 0
@@ -0,0 +1,187 @@
+from __future__ import annotations
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+import traceback
+from typing import List, Optional, Tuple
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.shared.configuration.settings.task_update_settings import TaskUpdateSettings
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+class _PendingUpdate:
+    __slots__ = ("attempt", "task_definition_name", "task_result")
+
+    def __init__(self, task_result: TaskResult, task_definition_name: str):
+        self.task_result = task_result
+        self.task_definition_name = task_definition_name
+        self.attempt = 0
+
+
+class TaskUpdater:
+    """
+    Sends task results to the server from a background thread.
+
+    Results wait in a bounded queue, so a slow server applies backpressure to the
+    task runner instead of growing memory. Failed updates are parked in a retry
+    heap until their backoff expires, while the results behind them keep flowing.
+    """
+
+    def __init__(
+            self,
+            task_client: TaskResourceApi,
+            settings: TaskUpdateSettings,
+            metrics_collector: Optional[MetricsCollector] = None
+    ):
+        self.task_client = task_client
+        self.settings = settings
+        self.metrics_collector = metrics_collector
+        self._queue = queue.Queue(maxsize=settings.queue_size)
+        self._retries: List[Tuple[float, int, _PendingUpdate]] = []
+        self._sequence = itertools.count()
+        self._unfinished = 0
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+        # runners with a thread pool submit from several threads at once
+        self._start_lock = threading.Lock()
+
+    def submit(self, task_result: TaskResult, task_definition_name: str) -> None:
+        """
+        Queue a task result for update, blocking while the queue is full.
+        """
+        self.__ensure_started()
+        with self._condition:
+            self._unfinished += 1
+        self._queue.put(_PendingUpdate(task_result, task_definition_name))
+        self.__record_queue_depth(task_definition_name)
+
+    def pending(self) -> int:
+        """
+        Number of task results that have not been delivered or given up on yet.
+        """
+        with self._condition:
+            return self._unfinished
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued result has been handled.
+
+        :return: True if the queue drained before the timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._unfinished == 0, timeout=timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush pending results and stop the background thread.
+
+        :return: True if every result was handled before the timeout
+        """
+        if timeout is None:
+            timeout = self.settings.flush_timeout
+        flushed = self.flush(timeout)
+        if not flushed:
+            logger.warning("Stopping task updater with %s undelivered task results", self.pending())
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        return flushed
+
+    def __ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self.__run, name="conductor-task-updater", daemon=True)
+            self._thread.start()
+
+    def __run(self) -> None:
+        while not self._stopped.is_set():
+            pending_update = self.__next_update()
+            if pending_update is not None:
+                self.__update(pending_update)
+
+    def __next_update(self) -> Optional[_PendingUpdate]:
+        wait_time = 0.1
+        if self._retries:
+            due_time = self._retries[0][0]
+            now = time.monotonic()
+            if due_time <= now:
+                return heapq.heappop(self._retries)[2]
+            wait_time = min(wait_time, due_time - now)
+        try:
+            return self._queue.get(timeout=wait_time)
+        except queue.Empty:
+            return None
+
+    def __update(self, pending_update: _PendingUpdate) -> None:
+        task_result = pending_update.task_result
+        task_definition_name = pending_update.task_definition_name
+        try:
+            start_time = time.time()
+            response = self.task_client.update_task(body=task_result)
+            time_spent = time.time() - start_time
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_update_time(task_definition_name, time_spent)
+            logger.debug(
+                "Updated task, id: %s, workflow_instance_id: %s, task_definition_name: %s, response: %s",
+                task_result.task_id,
+                task_result.workflow_instance_id,
+                task_definition_name,
+                response
+            )
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_update_error(task_definition_name, e)
+            pending_update.attempt += 1
+            if pending_update.attempt < self.settings.max_attempts:
+                delay = self.settings.backoff(pending_update.attempt)
+                logger.warning(
+                    "Failed to update task, id: %s, workflow_instance_id: %s, task_definition_name: %s, "
+                    "retrying in %.2fs, reason: %s",
+                    task_result.task_id,
+                    task_result.workflow_instance_id,
+                    task_definition_name,
+                    delay,
+                    e
+                )
+                heapq.heappush(
+                    self._retries,
+                    (time.monotonic() + delay, next(self._sequence), pending_update)
+                )
+                return
+            logger.error(
+                "Failed to update task, id: %s, workflow_instance_id: %s, task_definition_name: %s, "
+                "giving up after %s attempts, reason: %s",
+                task_result.task_id,
+                task_result.workflow_instance_id,
+                task_definition_name,
+                pending_update.attempt,
+                traceback.format_exc()
+            )
+        self.__finish(task_definition_name)
+
+    def __finish(self, task_definition_name: str) -> None:
+        with self._condition:
+            self._unfinished -= 1
+            self._condition.notify_all()
+        self.__record_queue_depth(task_definition_name)
+
+    def __record_queue_depth(self, task_definition_name: str) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_task_update_queue_depth(task_definition_name, self.pending())
@@ -69,10 +69,30 @@ class Configuration:
 
         # Provide an alterative to requests.Session() for HTTP connection.
         self.http_connection = None
+        # Number of hosts to keep connection pools for, and connections kept per host.
+        # Raise pool_maxsize when many threads share one client.
+        self.pool_connections = 10
+        self.pool_maxsize = 10
+        # Wait for a free connection instead of opening one that is discarded after use.
+        self.pool_block = False
+        # Default (connect, read) timeouts in seconds.
+        self.connect_timeout = 120
+        self.read_timeout = 120
+        # Timeouts for individual endpoints, keyed by resource path template
+        # such as "/tasks/poll/batch/{tasktype}".
+        self.request_timeouts = {}
+        # Use an httpx client with HTTP/2 instead of requests. Requires httpx[http2].
+        self.http2 = False
+        # Encode request bodies with orjson instead of json. Requires orjson: pip install 'conductor-python[fast-json]'.
+        self.fast_json = False
 
         # not updated yet
         self.token_update_time = 0
         self.auth_token_ttl_msec = auth_token_ttl_min * 60 * 1000
+        # SharedToken used to share the auth token between worker processes, set by TaskHandler
+        self.shared_token = None
+        # TokenManager shared by the API clients of this configuration, set by the first one
+        self._token_manager = None
 
     @property
     def debug(self):
@@ -157,3 +177,10 @@ class Configuration:
     def update_token(self, token: str) -> None:
         self.AUTH_TOKEN = token
         self.token_update_time = round(time.time() * 1000)
+
+    def __getstate__(self):
+        # the token manager holds a thread and locks, and only belongs to this process,
+        # the clients of an unpickled configuration share a new one
+        state = self.__dict__.copy()
+        state["_token_manager"] = None
+        return state
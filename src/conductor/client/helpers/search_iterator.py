@@ -0,0 +1,55 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional
+
+DEFAULT_SEARCH_PAGE_SIZE = 100
+
+# fetch_page(start, size, query_id) returns a search result with results and optionally query_id and total_hits
+FetchPage = Callable[[int, int, Optional[str]], Any]
+
+
+def iterate_search_results(
+        fetch_page: FetchPage,
+        page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+        prefetch: bool = True
+) -> Iterator[Any]:
+    """
+    Yields every result of a paginated search, requesting one page at a time.
+
+    The scroll query id returned with a page is passed along with the next request.
+    Pages are requested until total_hits results were yielded, or when the search
+    does not report total_hits, until a page comes back shorter than page_size.
+    With prefetch the next page is requested in the background while the results of
+    the current one are being consumed, so only two pages are held at a time.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conductor-search") if prefetch else None
+    next_page = None
+    try:
+        start = 0
+        query_id = None
+        page = fetch_page(start, page_size, query_id)
+        while page is not None:
+            results = page.results or []
+            start += len(results)
+            query_id = getattr(page, "query_id", None) or query_id
+            total_hits = getattr(page, "total_hits", None)
+            # the server may cap the page size below the requested one, so a short page only
+            # marks the end when the total is unknown. An empty page always does.
+            if total_hits is not None:
+                has_next_page = len(results) > 0 and start < total_hits
+            else:
+                has_next_page = len(results) >= page_size > 0
+            if has_next_page and executor is not None:
+                next_page = executor.submit(fetch_page, start, page_size, query_id)
+            yield from results
+            if not has_next_page:
+                return
+            if next_page is not None:
+                page, next_page = next_page.result(), None
+            else:
+                page = fetch_page(start, page_size, query_id)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
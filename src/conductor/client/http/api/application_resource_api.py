@@ -63,6 +63,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -121,6 +122,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def create_access_key(self, id, **kwargs):  # noqa: E501
@@ -164,6 +166,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -214,6 +217,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def create_application(self, body, **kwargs):  # noqa: E501
@@ -257,6 +261,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -311,6 +316,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_access_key(self, application_id, key_id, **kwargs):  # noqa: E501
@@ -356,6 +362,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -413,6 +420,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_application(self, id, **kwargs):  # noqa: E501
@@ -456,6 +464,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -506,6 +515,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_access_keys(self, id, **kwargs):  # noqa: E501
@@ -549,6 +559,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -599,6 +610,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_application(self, id, **kwargs):  # noqa: E501
@@ -642,6 +654,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -692,6 +705,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def list_applications(self, **kwargs):  # noqa: E501
@@ -733,6 +747,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -777,6 +792,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def remove_role_from_application_user(self, application_id, role, **kwargs):  # noqa: E501
@@ -822,6 +838,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -880,6 +897,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def toggle_access_key_status(self, application_id, key_id, **kwargs):  # noqa: E501
@@ -925,6 +943,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -983,6 +1002,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def update_application(self, body, id, **kwargs):  # noqa: E501
@@ -1028,6 +1048,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1088,6 +1109,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def put_tags_for_application(self, body, id, **kwargs):  # noqa: E501
@@ -1133,6 +1155,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1190,6 +1213,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_tags_for_application(self, id, **kwargs):  # noqa: E501
@@ -1233,6 +1257,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1284,6 +1309,7 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_tags_for_application(self, body, id, **kwargs):  # noqa: E501
@@ -1329,6 +1355,7 @@ class ApplicationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1387,4 +1414,5 @@ class ApplicationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
@@ -63,6 +63,7 @@ class AuthorizationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -119,6 +120,7 @@ class AuthorizationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def grant_permissions(self, body, **kwargs):  # noqa: E501
@@ -162,6 +164,7 @@ class AuthorizationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -216,6 +219,7 @@ class AuthorizationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def remove_permissions(self, body, **kwargs):  # noqa: E501
@@ -259,6 +263,7 @@ class AuthorizationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -313,4 +318,5 @@ class AuthorizationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
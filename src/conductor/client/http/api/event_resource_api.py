@@ -61,6 +61,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -111,6 +112,7 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_queue_config(self, queue_type, queue_name, **kwargs):  # noqa: E501
@@ -156,6 +158,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -210,6 +213,7 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_event_handlers(self, **kwargs):  # noqa: E501
@@ -251,6 +255,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -295,6 +300,7 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_event_handlers_for_event(self, event, **kwargs):  # noqa: E501
@@ -340,6 +346,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -393,6 +400,7 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_queue_config(self, queue_type, queue_name, **kwargs):  # noqa: E501
@@ -438,6 +446,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -496,6 +505,7 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_queue_names(self, **kwargs):  # noqa: E501
@@ -537,6 +547,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -581,6 +592,7 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def put_queue_config(self, body, queue_type, queue_name, **kwargs):  # noqa: E501
@@ -628,6 +640,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -692,6 +705,7 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def remove_event_handler_status(self, name, **kwargs):  # noqa: E501
@@ -735,6 +749,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -782,6 +797,7 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def update_event_handler(self, body, **kwargs):  # noqa: E501
@@ -825,6 +841,7 @@ class EventResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -875,4 +892,5 @@ class EventResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
@@ -63,6 +63,7 @@ class GroupResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -119,6 +120,7 @@ class GroupResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_group(self, id, **kwargs):  # noqa: E501
@@ -162,6 +164,7 @@ class GroupResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -212,6 +215,7 @@ class GroupResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_granted_permissions1(self, group_id, **kwargs):  # noqa: E501
@@ -255,6 +259,7 @@ class GroupResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -306,6 +311,7 @@ class GroupResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_group(self, id, **kwargs):  # noqa: E501
@@ -349,6 +355,7 @@ class GroupResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -399,6 +406,7 @@ class GroupResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_users_in_group(self, id, **kwargs):  # noqa: E501
@@ -442,6 +450,7 @@ class GroupResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -492,6 +501,7 @@ class GroupResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def list_groups(self, **kwargs):  # noqa: E501
@@ -533,6 +543,7 @@ class GroupResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -577,6 +588,7 @@ class GroupResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def remove_user_from_group(self, group_id, user_id, **kwargs):  # noqa: E501
@@ -622,6 +634,7 @@ class GroupResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -680,6 +693,7 @@ class GroupResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def upsert_group(self, body, id, **kwargs):  # noqa: E501
@@ -725,6 +739,7 @@ class GroupResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -785,4 +800,5 @@ class GroupResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
@@ -69,6 +69,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -131,6 +132,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_integration_api(self, name, integration_name, **kwargs):  # noqa: E501
@@ -176,6 +178,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -230,6 +233,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_integration_provider(self, name, **kwargs):  # noqa: E501
@@ -273,6 +277,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -320,6 +325,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_tag_for_integration(self, body, name, integration_name, **kwargs):  # noqa: E501
@@ -368,6 +374,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -433,6 +440,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def delete_tag_for_integration_provider(self, body, name, **kwargs):  # noqa: E501
@@ -478,6 +486,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -536,6 +545,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_integration_api(self, name, integration_name, **kwargs):  # noqa: E501
@@ -581,6 +591,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -638,6 +649,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_integration_apis(self, name, **kwargs):  # noqa: E501
@@ -683,6 +695,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -735,6 +748,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_integration_available_apis(self, name, **kwargs):  # noqa: E501
@@ -778,6 +792,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -829,6 +844,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_integration_provider(self, name, **kwargs):  # noqa: E501
@@ -872,6 +888,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -923,6 +940,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_integration_provider_defs(self, **kwargs):  # noqa: E501
@@ -964,6 +982,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1008,6 +1027,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_integration_providers(self, **kwargs):  # noqa: E501
@@ -1053,6 +1073,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1101,6 +1122,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_prompts_with_integration(self, integration_provider, integration_name, **kwargs):  # noqa: E501
@@ -1149,6 +1171,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1207,6 +1230,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_providers_and_integrations(self, **kwargs):  # noqa: E501
@@ -1252,6 +1276,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1300,6 +1325,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_tags_for_integration(self, name, integration_name, **kwargs):  # noqa: E501
@@ -1345,6 +1371,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1403,6 +1430,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_tags_for_integration_provider(self, name, **kwargs):  # noqa: E501
@@ -1446,6 +1474,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1497,6 +1526,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_token_usage_for_integration(self, name, integration_name, **kwargs):  # noqa: E501
@@ -1542,6 +1572,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1600,6 +1631,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def get_token_usage_for_integration_provider(self, name, **kwargs):  # noqa: E501
@@ -1643,6 +1675,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1694,6 +1727,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def put_tag_for_integration(self, body, name, integration_name, **kwargs):  # noqa: E501
@@ -1741,6 +1775,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1806,6 +1841,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def put_tag_for_integration_provider(self, body, name, **kwargs):  # noqa: E501
@@ -1851,6 +1887,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1909,6 +1946,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def register_token_usage(self, body, name, integration_name, **kwargs):  # noqa: E501
@@ -1956,6 +1994,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2019,6 +2058,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def save_integration_api(self, body, name, integration_name, **kwargs):  # noqa: E501
@@ -2066,6 +2106,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2129,6 +2170,7 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
 
     def save_integration_provider(self, body, name, **kwargs):  # noqa: E501
@@ -2174,6 +2216,7 @@ class IntegrationResourceApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2232,4 +2275,5 @@ class IntegrationResourceApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response', False),
             collection_formats=collection_formats)
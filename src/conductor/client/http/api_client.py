@@ -4,7 +4,6 @@ import mimetypes
 import os
 import re
 import tempfile
-import time
 from typing import Dict
 import uuid
 
@@ -15,8 +14,10 @@ from six.moves.urllib.parse import quote
 
 import conductor.client.http.models as http_models
 from conductor.client.configuration.configuration import Configuration
-from conductor.client.http import rest
+from conductor.client.http import json_encoder, rest
+from conductor.client.http.httpx_rest import HttpxRESTClientObject, is_httpx_client
 from conductor.client.http.rest import AuthorizationException
+from conductor.client.http.token_manager import TokenManager
 from conductor.client.http.thread import AwaitableThread
 
 logger = logging.getLogger(
@@ -49,44 +50,80 @@ class ApiClient(object):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
-
-        self.rest_client = rest.RESTClientObject(connection=configuration.http_connection)
+        if configuration.fast_json and json_encoder.orjson is None:
+            raise ImportError("orjson is required for fast_json, install it with: pip install 'conductor-python[fast-json]'")
+
+        timeout = (configuration.connect_timeout, configuration.read_timeout)
+        if configuration.http2 or is_httpx_client(configuration.http_connection):
+            self.rest_client = HttpxRESTClientObject(
+                connection=configuration.http_connection,
+                pool_maxsize=configuration.pool_maxsize,
+                timeout=timeout
+            )
+        else:
+            self.rest_client = rest.RESTClientObject(
+                connection=configuration.http_connection,
+                pool_connections=configuration.pool_connections,
+                pool_maxsize=configuration.pool_maxsize,
+                pool_block=configuration.pool_block,
+                timeout=timeout
+            )
 
         self.default_headers = self.__get_default_headers(
             header_name, header_value
         )
 
         self.cookie = cookie
+        # deserializers by type, built on first use
+        self.__deserializers = {}
+        self.token_manager = TokenManager.for_configuration(configuration, self.__get_new_token)
         self.__refresh_auth_token()
 
+    def close(self) -> None:
+        """Detaches the client from the token manager, which stops refreshing once no client is left."""
+        self.token_manager.remove_token_source(self.__get_new_token)
+
+    def __getstate__(self):
+        # the token manager only belongs to this process, see Configuration.__getstate__
+        state = self.__dict__.copy()
+        del state["token_manager"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.token_manager = TokenManager.for_configuration(self.configuration, self.__get_new_token)
+
     def __call_api(
             self, resource_path, method, path_params=None,
             query_params=None, header_params=None, body=None, post_params=None,
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
-            _preload_content=True, _request_timeout=None):
+            _preload_content=True, _request_timeout=None, _raw_response=False):
+        token_update_time = self.configuration.token_update_time
         try:
             return self.__call_api_no_retry(
                 resource_path=resource_path, method=method, path_params=path_params,
                 query_params=query_params, header_params=header_params, body=body, post_params=post_params,
                 files=files, response_type=response_type, auth_settings=auth_settings,
                 _return_http_data_only=_return_http_data_only, collection_formats=collection_formats,
-                _preload_content=_preload_content, _request_timeout=_request_timeout
+                _preload_content=_preload_content, _request_timeout=_request_timeout,
+                _raw_response=_raw_response
             )
         except AuthorizationException as ae:
-            if ae.token_expired or ae.invalid_token:
+            if (ae.token_expired or ae.invalid_token) and resource_path != '/token':
                 token_status = "expired" if ae.token_expired else "invalid"
                 logger.warning(
                     f'authentication token is {token_status}, refreshing the token.  request= {method} {resource_path}')
                 # if the token has expired or is invalid, lets refresh the token
-                self.__force_refresh_auth_token()
+                self.__force_refresh_auth_token(token_update_time)
                 # and now retry the same request
                 return self.__call_api_no_retry(
                     resource_path=resource_path, method=method, path_params=path_params,
                     query_params=query_params, header_params=header_params, body=body, post_params=post_params,
                     files=files, response_type=response_type, auth_settings=auth_settings,
                     _return_http_data_only=_return_http_data_only, collection_formats=collection_formats,
-                    _preload_content=_preload_content, _request_timeout=_request_timeout
+                    _preload_content=_preload_content, _request_timeout=_request_timeout,
+                    _raw_response=_raw_response
                 )
             raise ae
 
@@ -95,9 +132,11 @@ class ApiClient(object):
             query_params=None, header_params=None, body=None, post_params=None,
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
-            _preload_content=True, _request_timeout=None):
+            _preload_content=True, _request_timeout=None, _raw_response=False):
 
         config = self.configuration
+        if _request_timeout is None:
+            _request_timeout = config.request_timeouts.get(resource_path)
 
         # header parameters
         header_params = header_params or {}
@@ -146,7 +185,12 @@ class ApiClient(object):
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            if self.configuration.fast_json and not isinstance(body, str) and \
+                    re.search('json', header_params.get('Content-Type', 'application/json'), re.IGNORECASE):
+                # encode straight from the models, skipping the intermediate dicts
+                body = json_encoder.dumps(body, self.sanitize_for_serialization, use_orjson=True)
+            else:
+                body = self.sanitize_for_serialization(body)
 
         # request url
         url = self.configuration.host + resource_path
@@ -163,7 +207,10 @@ class ApiClient(object):
         return_data = response_data
         if _preload_content:
             # deserialize response data
-            if response_type:
+            if response_type and _raw_response and response_type != 'file':
+                # plain dicts and lists as decoded from json, without models
+                return_data = self.__get_response_data(response_data)
+            elif response_type:
                 return_data = self.deserialize(response_data, response_type)
             else:
                 return_data = None
@@ -242,10 +289,7 @@ class ApiClient(object):
             return self.__deserialize_file(response)
 
         # fetch data from response object
-        try:
-            data = response.resp.json()
-        except Exception:
-            data = response.resp.text
+        data = self.__get_response_data(response)
 
         try:
             return self.__deserialize(data, response_type)
@@ -253,6 +297,12 @@ class ApiClient(object):
             logger.error(f'failed to deserialize data {data} into class {response_type}, reason: {e}')
             return None
 
+    def __get_response_data(self, response):
+        try:
+            return response.resp.json()
+        except Exception:
+            return response.resp.text
+
     def deserialize_class(self, data, klass):
         return self.__deserialize(data, klass)
 
@@ -266,22 +316,35 @@ class ApiClient(object):
         """
         if data is None:
             return None
+        deserializer = self.__deserializers.get(klass)
+        if deserializer is None:
+            deserializer = self.__get_deserializer(klass)
+            self.__deserializers[klass] = deserializer
+        return deserializer(data)
+
+    def __get_deserializer(self, klass):
+        """Builds the function deserializing non None data into klass, parsing
+        type strings and resolving model classes once per type.
 
+        :param klass: class literal, or string of class name.
+
+        :return: function of data.
+        """
         if isinstance(klass, str):
             if klass.startswith('list['):
                 sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                return lambda data: [self.__deserialize(sub_data, sub_kls)
+                                     for sub_data in data]
 
             if klass.startswith('set['):
                 sub_kls = re.match(r'set\[(.*)\]', klass).group(1)
-                return set(self.__deserialize(sub_data, sub_kls)
-                           for sub_data in data)
+                return lambda data: set(self.__deserialize(sub_data, sub_kls)
+                                        for sub_data in data)
 
             if klass.startswith('dict('):
                 sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
+                return lambda data: {k: self.__deserialize(v, sub_kls)
+                                     for k, v in six.iteritems(data)}
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -290,22 +353,22 @@ class ApiClient(object):
                 klass = getattr(http_models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return lambda data: self.__deserialize_primitive(data, klass)
         elif klass is object:
-            return self.__deserialize_object(data)
+            return self.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return self.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
+            return self.__deserialize_datatime
         else:
-            return self.__deserialize_model(data, klass)
+            return self.__get_model_deserializer(klass)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, async_req=None,
                  _return_http_data_only=None, collection_formats=None,
-                 _preload_content=True, _request_timeout=None):
+                 _preload_content=True, _request_timeout=None, _raw_response=False):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
         To make an async request, set the async_req parameter.
@@ -335,6 +398,8 @@ class ApiClient(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _raw_response: if True, the response is returned as the dicts
+                              and lists decoded from json instead of models.
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
@@ -348,7 +413,7 @@ class ApiClient(object):
                                    body, post_params, files,
                                    response_type, auth_settings,
                                    _return_http_data_only, collection_formats,
-                                   _preload_content, _request_timeout)
+                                   _preload_content, _request_timeout, _raw_response)
         thread = AwaitableThread(
             target=self.__call_api,
             args=(
@@ -357,7 +422,7 @@ class ApiClient(object):
                 body, post_params, files,
                 response_type, auth_settings,
                 _return_http_data_only, collection_formats,
-                _preload_content, _request_timeout
+                _preload_content, _request_timeout, _raw_response
             )
         )
         thread.start()
@@ -628,6 +693,35 @@ class ApiClient(object):
     def __hasattr(self, object, name):
         return name in object.__class__.__dict__
 
+    def __get_model_deserializer(self, klass):
+        """Builds the function deserializing a dict into a model, with the
+        attribute to json key mapping of the model resolved up front.
+
+        :param klass: class literal.
+        :return: function of data.
+        """
+        if not klass.swagger_types and not self.__hasattr(klass, 'get_real_child_model'):
+            return self.__deserialize_object
+        if klass.swagger_types is None or issubclass(klass, dict) or \
+                self.__hasattr(klass, 'get_real_child_model'):
+            return lambda data: self.__deserialize_model(data, klass)
+
+        fields = tuple(
+            (attr, klass.attribute_map[attr], attr_type)
+            for attr, attr_type in six.iteritems(klass.swagger_types)
+        )
+
+        def deserialize_model(data):
+            if not isinstance(data, dict):
+                return self.__deserialize_model(data, klass)
+            kwargs = {}
+            for attr, key, attr_type in fields:
+                if key in data:
+                    kwargs[attr] = self.__deserialize(data[key], attr_type)
+            return klass(**kwargs)
+
+        return deserialize_model
+
     def __deserialize_model(self, data, klass):
         """Deserializes list or dict to model.
 
@@ -665,18 +759,9 @@ class ApiClient(object):
         if self.configuration.AUTH_TOKEN is None:
             return None
 
-        now = round(time.time() * 1000)
-        time_since_last_update = now - self.configuration.token_update_time
-
-        if time_since_last_update > self.configuration.auth_token_ttl_msec:
-            # time to refresh the token
-            logger.debug('refreshing authentication token')
-            token = self.__get_new_token()
-            self.configuration.update_token(token)
-
         return {
             'header': {
-                'X-Authorization': self.configuration.AUTH_TOKEN
+                'X-Authorization': self.token_manager.get_token()
             }
         }
 
@@ -685,17 +770,16 @@ class ApiClient(object):
             return
         if self.configuration.authentication_settings is None:
             return
-        token = self.__get_new_token()
-        self.configuration.update_token(token)
+        self.token_manager.refresh()
 
-    def __force_refresh_auth_token(self) -> None:
+    def __force_refresh_auth_token(self, observed_update_time: int = None) -> None:
         """
-        Forces the token refresh.  Unlike the __refresh_auth_token method above
+        Forces the token refresh.  Unlike the __refresh_auth_token method above, it replaces
+        an existing token, unless another thread already replaced the one the request used
         """
         if self.configuration.authentication_settings is None:
             return
-        token = self.__get_new_token()
-        self.configuration.update_token(token)
+        self.token_manager.refresh(observed_update_time)
 
     def __get_new_token(self) -> str:
         try:
@@ -0,0 +1,48 @@
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from conductor.client.http.rest import RESTClientObject
+
+
+def is_httpx_client(connection) -> bool:
+    return httpx is not None and isinstance(connection, httpx.Client)
+
+
+class HttpxRESTClientObject(RESTClientObject):
+    """
+    REST client backed by an httpx.Client, which multiplexes concurrent requests
+    over HTTP/2 connections when the server supports it.
+
+    Requires the optional httpx dependency: pip install "httpx[http2]"
+    """
+
+    def __init__(self, connection=None, pool_maxsize=10, timeout=(120, 120), http2=True):
+        if httpx is None:
+            raise ImportError("httpx is required for HTTP/2 support, install it with: pip install 'httpx[http2]'")
+        self.connection = connection or httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize
+            )
+        )
+        self.timeout = timeout
+
+    def _send(self, method, url, data=None, params=None, timeout=None, headers=None):
+        return self.connection.request(
+            method, url,
+            content=data,
+            params=params,
+            timeout=_to_httpx_timeout(timeout),
+            headers=headers
+        )
+
+
+def _to_httpx_timeout(timeout):
+    # requests style timeouts are either a total or a (connect, read) pair
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
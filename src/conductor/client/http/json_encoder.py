@@ -0,0 +1,75 @@
+import datetime
+import json
+import uuid
+from functools import lru_cache
+from typing import Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # models are dataclasses and dates are sent in isoformat, both go through _default
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+@lru_cache(maxsize=None)
+def get_model_fields(model_class) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """
+    Returns the (attribute, json key) pairs of a swagger model class, resolved once
+    per class, or None when the class does not declare them as class attributes.
+    """
+    swagger_types = getattr(model_class, "swagger_types", None)
+    attribute_map = getattr(model_class, "attribute_map", None)
+    if not isinstance(swagger_types, dict) or not isinstance(attribute_map, dict):
+        return None
+    return tuple((attr, attribute_map[attr]) for attr in swagger_types)
+
+
+def model_to_dict(obj) -> dict:
+    """
+    Converts one level of a model to a dict keyed by json names, leaving out
+    attributes which value is None. Nested values are not converted.
+    """
+    fields = get_model_fields(type(obj))
+    if fields is None:
+        # models which declare their swagger types per instance
+        fields = tuple((attr, obj.attribute_map[attr]) for attr in obj.swagger_types)
+    return {key: value for attr, key in fields if (value := getattr(obj, attr)) is not None}
+
+
+def _default(obj):
+    # called by orjson for every value it cannot serialize natively,
+    # mirrors ApiClient.sanitize_for_serialization
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, dict):
+        return dict(obj)
+    if hasattr(obj, "attribute_map") and hasattr(obj, "swagger_types"):
+        return model_to_dict(obj)
+    try:
+        return {name: value for name, value in vars(obj).items() if value is not None}
+    except TypeError:
+        return str(obj)
+
+
+def dumps(obj, sanitize, use_orjson: bool = False) -> bytes:
+    """
+    Serializes a request body to JSON bytes with sanitize followed by json.dumps.
+    With use_orjson, orjson is used instead when it is installed, falling back to
+    the former for values orjson rejects.
+    """
+    if use_orjson and orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(sanitize(obj)).encode("utf-8")
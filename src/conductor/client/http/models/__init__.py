@@ -33,6 +33,7 @@ from conductor.client.http.models.tag_string import TagString
 from conductor.client.http.models.target_ref import TargetRef
 from conductor.client.http.models.workflow_task import WorkflowTask
 from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_view import TaskView
 from conductor.client.http.models.task_def import TaskDef
 from conductor.client.http.models.task_details import TaskDetails
 from conductor.client.http.models.task_exec_log import TaskExecLog
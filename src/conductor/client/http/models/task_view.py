@@ -0,0 +1,65 @@
+from typing import Any, Dict
+
+from conductor.client.http.models.task import Task
+
+_MISSING = object()
+
+# swagger types taken from the json as is, anything else is deserialized on access
+_JSON_TYPES = ("str", "int", "bool", "float", "object", "dict(str, object)")
+
+
+class _TaskField:
+    """
+    Reads a Task field from the polled json, deserializing it on first access.
+
+    It replaces the private dataclass field behind the Task property, so the
+    properties, dataclasses.asdict() and repr() all read the same value.
+    """
+
+    __slots__ = ("name", "key", "klass")
+
+    def __init__(self, name: str, key: str, klass: str):
+        self.name = name
+        self.key = key
+        self.klass = None if klass in _JSON_TYPES else klass
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance._values.get(self.name, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = instance._json.get(self.key)
+        if self.klass is not None and value is not None:
+            value = instance._api_client.deserialize_class(value, self.klass)
+            instance._values[self.name] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance._values[self.name] = value
+
+
+class TaskView(Task):
+    """
+    Read-mostly Task backed by the json returned from polling.
+
+    Fields are read from the json when accessed, and nested models such as
+    workflow_task and task_definition are only built if a worker uses them.
+    It is a Task, so worker functions taking a Task receive it unchanged.
+    Task is a dataclass without slots, so instances keep a __dict__ holding the
+    json, the values read so far and the api client.
+    """
+
+    def __init__(self, json: Dict[str, Any], api_client):
+        self._json = json
+        self._values = {}
+        self._api_client = api_client
+
+    def __eq__(self, other):
+        if not isinstance(other, Task):
+            return False
+        return self.to_dict() == other.to_dict()
+
+
+for _name, _klass in Task.swagger_types.items():
+    setattr(TaskView, "_" + _name, _TaskField(_name, Task.attribute_map[_name], _klass))
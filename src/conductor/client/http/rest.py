@@ -12,7 +12,8 @@ class RESTResponse(io.IOBase):
 
     def __init__(self, resp):
         self.status = resp.status_code
-        self.reason = resp.reason
+        # httpx names the reason phrase differently from requests
+        self.reason = resp.reason if hasattr(resp, 'reason') else resp.reason_phrase
         self.resp = resp
         self.headers = resp.headers
 
@@ -21,16 +22,23 @@ class RESTResponse(io.IOBase):
 
 
 class RESTClientObject(object):
-    def __init__(self, connection=None):
+    def __init__(self, connection=None, pool_connections=10, pool_maxsize=10,
+                 pool_block=False, timeout=(120, 120)):
         self.connection = connection or requests.Session()
+        self.timeout = timeout
         retry_strategy = Retry(
             total=3,
             backoff_factor=2,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "DELETE"],  # all the methods that are supposed to be idempotent
         )
-        self.connection.mount("https://", HTTPAdapter(max_retries=retry_strategy))
-        self.connection.mount("http://", HTTPAdapter(max_retries=retry_strategy))
+        for prefix in ("https://", "http://"):
+            self.connection.mount(prefix, HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=retry_strategy
+            ))
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
@@ -65,7 +73,7 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
-        timeout = _request_timeout if _request_timeout is not None else (120, 120)
+        timeout = _request_timeout if _request_timeout is not None else self.timeout
 
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
@@ -77,11 +85,14 @@ class RESTClientObject(object):
                     url += '?' + urlencode(query_params)
                 if re.search('json', headers['Content-Type'], re.IGNORECASE) or isinstance(body, str):
                     request_body = '{}'
-                    if body is not None:
+                    if isinstance(body, bytes):
+                        # already encoded by the api client
+                        request_body = body
+                    elif body is not None:
                         request_body = json.dumps(body)
                         if isinstance(body, str):
                             request_body = request_body.strip('"')
-                    r = self.connection.request(
+                    r = self._send(
                         method, url,
                         data=request_body,
                         timeout=timeout,
@@ -95,7 +106,7 @@ class RESTClientObject(object):
                     raise ApiException(status=0, reason=msg)
             # For `GET`, `HEAD`
             else:
-                r = self.connection.request(
+                r = self._send(
                     method, url,
                     params=query_params,
                     timeout=timeout,
@@ -116,6 +127,15 @@ class RESTClientObject(object):
 
         return r
 
+    def _send(self, method, url, data=None, params=None, timeout=None, headers=None):
+        return self.connection.request(
+            method, url,
+            data=data,
+            params=params,
+            timeout=timeout,
+            headers=headers
+        )
+
     def GET(self, url, headers=None, query_params=None, _preload_content=True,
             _request_timeout=None):
         return self.request("GET", url,
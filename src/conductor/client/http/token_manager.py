@@ -0,0 +1,219 @@
+from __future__ import annotations
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from typing import Callable, List, Optional, Tuple
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+# wait before retrying a failed background refresh
+REFRESH_RETRY_INTERVAL_SECONDS = 10
+
+# guards the creation of the token manager of a configuration
+_token_managers_lock = threading.Lock()
+
+
+class SharedToken:
+    """
+    Auth token kept in shared memory so that the processes started by one
+    TaskHandler reuse a single token instead of each requesting its own.
+    """
+
+    MAX_TOKEN_SIZE = 16384
+
+    def __init__(self):
+        self.lock = multiprocessing.Lock()
+        self.__token = multiprocessing.Array("c", self.MAX_TOKEN_SIZE, lock=False)
+        self.__update_time = multiprocessing.Value("q", 0, lock=False)
+
+    def get(self) -> Tuple[Optional[str], int]:
+        """Returns the token and its update time in epoch millis, callers hold the lock."""
+        if self.__update_time.value == 0:
+            return None, 0
+        return self.__token.value.decode("utf-8"), self.__update_time.value
+
+    def set(self, token: str, update_time: int) -> None:
+        """Stores the token, callers hold the lock. Tokens that do not fit are not shared."""
+        encoded = token.encode("utf-8")
+        if len(encoded) >= self.MAX_TOKEN_SIZE:
+            logger.warning("auth token is too large to share between processes")
+            return
+        self.__token.value = encoded
+        self.__update_time.value = update_time
+
+
+class TokenManager:
+    """
+    Keeps the auth token of a Configuration fresh.
+
+    A background thread refreshes the token before its TTL runs out, so requests
+    only read it. Concurrent refreshes, for example after several requests are
+    rejected with an expired token at once, collapse into a single call to the
+    token endpoint. When the Configuration carries a SharedToken, the refreshed
+    token is published to the other processes as well.
+
+    Token sources are held weakly, so the manager never keeps an API client
+    alive, and the background thread stops once no source is left.
+    """
+
+    def __init__(
+            self,
+            configuration: Configuration,
+            fetch_token: Optional[Callable[[], Optional[str]]] = None,
+            refresh_ahead_ratio: float = 0.8
+    ):
+        self.configuration = configuration
+        self.refresh_ahead_ratio = refresh_ahead_ratio
+        self.__token_sources: List[weakref.ref] = []
+        self.__lock = threading.RLock()
+        self.__stopped = threading.Event()
+        self.__refresher = None
+        self.__pid = os.getpid()
+        if fetch_token is not None:
+            self.add_token_source(fetch_token)
+
+    @classmethod
+    def for_configuration(
+            cls,
+            configuration: Configuration,
+            fetch_token: Callable[[], Optional[str]]
+    ) -> TokenManager:
+        """
+        Returns the manager shared by every client of configuration, so that
+        they refresh its token together, and adds fetch_token to its sources.
+        """
+        with _token_managers_lock:
+            token_manager = getattr(configuration, "_token_manager", None)
+            if token_manager is None:
+                token_manager = cls(configuration)
+                configuration._token_manager = token_manager
+        token_manager.add_token_source(fetch_token)
+        return token_manager
+
+    def add_token_source(self, fetch_token: Callable[[], Optional[str]]) -> None:
+        if hasattr(fetch_token, "__self__"):
+            token_source = weakref.WeakMethod(fetch_token, self.__remove_collected_token_source)
+        else:
+            token_source = weakref.ref(fetch_token, self.__remove_collected_token_source)
+        with self.__lock:
+            self.__token_sources.append(token_source)
+
+    def remove_token_source(self, fetch_token: Callable[[], Optional[str]]) -> None:
+        with self.__lock:
+            self.__token_sources = [
+                token_source for token_source in self.__token_sources if token_source() != fetch_token
+            ]
+            if len(self.__token_sources) == 0:
+                self.stop()
+
+    def get_token(self) -> Optional[str]:
+        self.__after_fork()
+        self.__start_refresher()
+        if self.__token_age() > self.configuration.auth_token_ttl_msec:
+            # the background refresh failed or has not caught up yet
+            self.refresh()
+        return self.configuration.AUTH_TOKEN
+
+    def refresh(self, observed_update_time: Optional[int] = None) -> None:
+        """
+        Requests a new token unless the token was already replaced after
+        observed_update_time, which defaults to the current update time.
+        """
+        self.__after_fork()
+        if observed_update_time is None:
+            observed_update_time = self.configuration.token_update_time
+        with self.__lock:
+            if self.configuration.token_update_time != observed_update_time:
+                # another thread refreshed the token while this one waited
+                return
+            shared_token = self.configuration.shared_token
+            if shared_token is None:
+                self.__update_token()
+                return
+            with shared_token.lock:
+                token, update_time = shared_token.get()
+                if update_time > observed_update_time:
+                    # another process refreshed the token
+                    self.configuration.AUTH_TOKEN = token
+                    self.configuration.token_update_time = update_time
+                    return
+                if self.__update_token():
+                    shared_token.set(self.configuration.AUTH_TOKEN, self.configuration.token_update_time)
+
+    def stop(self) -> None:
+        with self.__lock:
+            self.__stopped.set()
+            # a later get_token starts a new refresher
+            self.__stopped = threading.Event()
+            self.__refresher = None
+
+    def __remove_collected_token_source(self, token_source: weakref.ref) -> None:
+        with self.__lock:
+            if token_source in self.__token_sources:
+                self.__token_sources.remove(token_source)
+            if len(self.__token_sources) == 0:
+                self.stop()
+
+    def __fetch_token(self) -> Optional[str]:
+        for token_source in list(self.__token_sources):
+            fetch_token = token_source()
+            if fetch_token is not None:
+                return fetch_token()
+        return None
+
+    def __update_token(self) -> bool:
+        token = self.__fetch_token()
+        if token is None and self.configuration.AUTH_TOKEN is not None:
+            # keep using the current token until a refresh succeeds
+            return False
+        self.configuration.update_token(token)
+        return token is not None
+
+    def __token_age(self) -> int:
+        return round(time.time() * 1000) - self.configuration.token_update_time
+
+    def __after_fork(self) -> None:
+        # locks and threads are not usable in a forked child, start over
+        if self.__pid == os.getpid():
+            return
+        self.__pid = os.getpid()
+        self.__lock = threading.RLock()
+        self.__stopped = threading.Event()
+        self.__refresher = None
+
+    def __start_refresher(self) -> None:
+        if self.__refresher is not None:
+            return
+        with self.__lock:
+            if self.__refresher is not None or len(self.__token_sources) == 0:
+                return
+            # the thread gets its own event, stop() replaces the one of the manager
+            self.__refresher = threading.Thread(
+                target=self.__refresh_periodically,
+                args=(self.__stopped,),
+                name="conductor-token-refresher",
+                daemon=True
+            )
+            self.__refresher.start()
+
+    def __refresh_periodically(self, stopped: threading.Event) -> None:
+        while not stopped.is_set():
+            refresh_after = self.configuration.auth_token_ttl_msec * self.refresh_ahead_ratio
+            wait_seconds = (refresh_after - self.__token_age()) / 1000
+            if wait_seconds > 0:
+                stopped.wait(wait_seconds)
+                continue
+            update_time = self.configuration.token_update_time
+            logger.debug("refreshing authentication token ahead of expiry")
+            self.refresh(update_time)
+            if self.configuration.token_update_time == update_time:
+                stopped.wait(REFRESH_RETRY_INTERVAL_SECONDS)
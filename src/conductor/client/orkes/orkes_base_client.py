@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api.application_resource_api import ApplicationResourceApi
@@ -19,8 +20,9 @@ from conductor.client.orkes.api.tags_api import TagsApi
 
 
 class OrkesBaseClient(object):
-    def __init__(self, configuration: Configuration):
-        self.api_client = ApiClient(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        # clients created together can share one connection pool and auth token
+        self.api_client = api_client if api_client is not None else ApiClient(configuration)
         self.logger = logging.getLogger(
             Configuration.get_logging_formatted_name(__name__)
         )
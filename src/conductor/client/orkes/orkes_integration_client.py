@@ -1,8 +1,9 @@
 from __future__ import absolute_import
 
-from typing import List
+from typing import List, Optional
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.integration import Integration
 from conductor.client.http.models.integration_api import IntegrationApi
 from conductor.client.http.models.integration_api_update import IntegrationApiUpdate
@@ -15,8 +16,8 @@ from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 
 class OrkesIntegrationClient(OrkesBaseClient, IntegrationClient):
 
-    def __init__(self, configuration: Configuration):
-        super(OrkesIntegrationClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesIntegrationClient, self).__init__(configuration, api_client)
 
     def associate_prompt_with_integration(self, ai_integration: str, model_name: str, prompt_name: str):
         self.integrationApi.associate_prompt_with_integration(ai_integration, model_name, prompt_name)
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Optional, List
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.tag_string import TagString
 from conductor.client.http.models.task_def import TaskDef
 from conductor.client.http.models.workflow_def import WorkflowDef
@@ -12,8 +13,8 @@ from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 
 
 class OrkesMetadataClient(OrkesBaseClient, MetadataClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesMetadataClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesMetadataClient, self).__init__(configuration, api_client)
 
     def register_workflow_def(self, workflow_def: WorkflowDef, overwrite: Optional[bool] = True):
         self.metadataResourceApi.create(workflow_def, overwrite=overwrite)
@@ -1,19 +1,22 @@
 from __future__ import annotations
-from typing import Optional, List
+from typing import Iterator, Optional, List
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.save_schedule_request import SaveScheduleRequest
 from conductor.client.http.models.search_result_workflow_schedule_execution_model import \
     SearchResultWorkflowScheduleExecutionModel
 from conductor.client.http.models.workflow_schedule import WorkflowSchedule
+from conductor.client.http.models.workflow_schedule_execution_model import WorkflowScheduleExecutionModel
+from conductor.client.helpers.search_iterator import DEFAULT_SEARCH_PAGE_SIZE, iterate_search_results
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.scheduler_client import SchedulerClient
 
 
 class OrkesSchedulerClient(OrkesBaseClient, SchedulerClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesSchedulerClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesSchedulerClient, self).__init__(configuration, api_client)
 
     def save_schedule(self, save_schedule_request: SaveScheduleRequest):
         self.schedulerResourceApi.save_schedule(save_schedule_request)
@@ -78,6 +81,23 @@ class OrkesSchedulerClient(OrkesBaseClient, SchedulerClient):
             kwargs.update({"query": query})
         return self.schedulerResourceApi.search_v21(**kwargs)
 
+    def iter_schedule_executions(self, free_text: Optional[str] = None, query: Optional[str] = None,
+                                 sort: Optional[str] = None, page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+                                 prefetch: bool = True) -> Iterator[WorkflowScheduleExecutionModel]:
+        """Iterates over all the schedule executions matching the search, page_size at a time"""
+        kwargs = {}
+        if sort:
+            kwargs["sort"] = sort
+        if free_text:
+            kwargs["free_text"] = free_text
+        if query:
+            kwargs["query"] = query
+
+        def fetch_page(start: int, size: int, query_id: Optional[str]) -> SearchResultWorkflowScheduleExecutionModel:
+            return self.schedulerResourceApi.search_v21(start=start, size=size, **kwargs)
+
+        return iterate_search_results(fetch_page, page_size=page_size, prefetch=prefetch)
+
     def requeue_all_execution_records(self):
         self.schedulerResourceApi.requeue_all_execution_records()
 
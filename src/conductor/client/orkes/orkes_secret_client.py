@@ -1,14 +1,15 @@
-from typing import List, Set
+from typing import List, Set, Optional
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.secret_client import SecretClient
 
 
 class OrkesSecretClient(OrkesBaseClient, SecretClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesSecretClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesSecretClient, self).__init__(configuration, api_client)
 
     def put_secret(self, key: str, value: str):
         self.secretResourceApi.put_secret(value, key)
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Optional, List
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.service_registry import ServiceRegistry
 from conductor.client.http.models.service_method import ServiceMethod
 from conductor.client.http.models.proto_registry_entry import ProtoRegistryEntry
@@ -11,8 +12,8 @@ from conductor.client.service_registry_client import ServiceRegistryClient
 
 
 class OrkesServiceRegistryClient(OrkesBaseClient, ServiceRegistryClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesServiceRegistryClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesServiceRegistryClient, self).__init__(configuration, api_client)
 
     def get_registered_services(self) -> List[ServiceRegistry]:
         return self.serviceRegistryResourceApi.get_registered_services()
@@ -1,19 +1,22 @@
 from __future__ import annotations
-from typing import Optional, List
+from typing import Callable, Iterator, Optional, List
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models import PollData
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_summary import TaskSummary
 from conductor.client.http.models.workflow import Workflow
+from conductor.client.helpers.search_iterator import DEFAULT_SEARCH_PAGE_SIZE, iterate_search_results
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.task_client import TaskClient
 
 
 class OrkesTaskClient(OrkesBaseClient, TaskClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesTaskClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None):
+        super(OrkesTaskClient, self).__init__(configuration, api_client)
 
     def poll_task(self, task_type: str, worker_id: Optional[str] = None, domain: Optional[str] = None) -> Optional[
         Task]:
@@ -94,3 +97,27 @@ class OrkesTaskClient(OrkesBaseClient, TaskClient):
 
     def get_task_poll_data(self, task_type: str) -> List[PollData]:
         return self.taskResourceApi.get_poll_data(task_type=task_type)
+
+    def iter_search_task_summaries(self, free_text: str = "*", query: Optional[str] = None, sort: Optional[str] = None,
+                                   page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+                                   prefetch: bool = True) -> Iterator[TaskSummary]:
+        """Iterates over the summaries of all the tasks matching the search, page_size at a time"""
+        return self.__iter_search(self.taskResourceApi.search1, free_text, query, sort, page_size, prefetch)
+
+    def iter_search_tasks(self, free_text: str = "*", query: Optional[str] = None, sort: Optional[str] = None,
+                          page_size: int = DEFAULT_SEARCH_PAGE_SIZE, prefetch: bool = True) -> Iterator[Task]:
+        """Iterates over all the tasks matching the search, page_size at a time"""
+        return self.__iter_search(self.taskResourceApi.search_v21, free_text, query, sort, page_size, prefetch)
+
+    def __iter_search(self, search: Callable, free_text: str, query: Optional[str], sort: Optional[str],
+                      page_size: int, prefetch: bool) -> Iterator:
+        kwargs = {"free_text": free_text}
+        if query:
+            kwargs["query"] = query
+        if sort:
+            kwargs["sort"] = sort
+
+        def fetch_page(start: int, size: int, query_id: Optional[str]):
+            return search(start=start, size=size, **kwargs)
+
+        return iterate_search_results(fetch_page, page_size=page_size, prefetch=prefetch)
@@ -1,7 +1,8 @@
 from __future__ import annotations
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models import SkipTaskRequest, WorkflowStatus, \
     ScrollableSearchResultWorkflowSummary, SignalResponse
 from conductor.client.http.models.correlation_ids_search_request import CorrelationIdsSearchRequest
@@ -11,16 +12,24 @@ from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.models.workflow_run import WorkflowRun
 from conductor.client.http.models.workflow_state_update import WorkflowStateUpdate
 from conductor.client.http.models.workflow_test_request import WorkflowTestRequest
+from conductor.client.http.models.workflow_summary import WorkflowSummary
+from conductor.client.helpers.search_iterator import DEFAULT_SEARCH_PAGE_SIZE, iterate_search_results
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.workflow_client import WorkflowClient
+from conductor.shared.workflow.bulk_start import (
+    DEFAULT_BULK_START_CONCURRENCY,
+    WorkflowStartResult,
+    start_workflows_concurrently,
+)
 
 
 class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
     def __init__(
             self,
-            configuration: Configuration
+            configuration: Configuration,
+            api_client: Optional[ApiClient] = None
     ):
-        super(OrkesWorkflowClient, self).__init__(configuration)
+        super(OrkesWorkflowClient, self).__init__(configuration, api_client)
 
     def start_workflow_by_name(
             self,
@@ -43,6 +52,20 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
     def start_workflow(self, start_workflow_request: StartWorkflowRequest) -> str:
         return self.workflowResourceApi.start_workflow(start_workflow_request)
 
+    def bulk_start_workflows(
+            self,
+            start_workflow_requests: Iterable[StartWorkflowRequest],
+            concurrency: int = DEFAULT_BULK_START_CONCURRENCY,
+            rate_limit: Optional[float] = None
+    ) -> Iterator[WorkflowStartResult]:
+        """Starts the workflows with up to concurrency requests in flight and at most rate_limit
+        starts per second, yielding a WorkflowStartResult per request in completion order.  Failed
+        starts are reported through WorkflowStartResult.error instead of being raised.
+        """
+        return start_workflows_concurrently(
+            self.start_workflow, start_workflow_requests, concurrency, rate_limit
+        )
+
     def execute_workflow(
             self,
             start_workflow_request: StartWorkflowRequest,
@@ -161,6 +184,16 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
         }
         return self.workflowResourceApi.search(**args)
 
+    def iter_search(self, free_text: str = "*", query: Optional[str] = None,
+                    page_size: int = DEFAULT_SEARCH_PAGE_SIZE, prefetch: bool = True) -> Iterator[WorkflowSummary]:
+        """Iterates over all the workflows matching the search, requesting page_size of them at a time and
+        the next page in the background while the current one is consumed"""
+
+        def fetch_page(start: int, size: int, query_id: Optional[str]) -> ScrollableSearchResultWorkflowSummary:
+            return self.search(start=start, size=size, free_text=free_text, query=query, query_id=query_id)
+
+        return iterate_search_results(fetch_page, page_size=page_size, prefetch=prefetch)
+
     def get_by_correlation_ids_in_batch(
             self,
             batch_request: CorrelationIdsSearchRequest,
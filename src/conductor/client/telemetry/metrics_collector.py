@@ -1,19 +1,23 @@
 import logging
 import os
+import threading
 import time
 from typing import Any, ClassVar, Dict, List
 
 from prometheus_client import CollectorRegistry
 from prometheus_client import Counter
 from prometheus_client import Gauge
+from prometheus_client import Histogram
 from prometheus_client import write_to_textfile
 from prometheus_client.multiprocess import MultiProcessCollector
 
 from conductor.client.configuration.configuration import Configuration
-from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.metrics_settings import DEFAULT_LATENCY_BUCKETS, MetricsSettings
 from conductor.client.telemetry.model.metric_documentation import MetricDocumentation
 from conductor.client.telemetry.model.metric_label import MetricLabel
 from conductor.client.telemetry.model.metric_name import MetricName
+from conductor.shared.telemetry.exception_labels import ExceptionLabels
+from conductor.shared.telemetry.metrics_server import serve_metrics
 
 logger = logging.getLogger(
     Configuration.get_logging_formatted_name(
@@ -25,19 +29,31 @@ logger = logging.getLogger(
 class MetricsCollector:
     counters: ClassVar[Dict[str, Counter]] = {}
     gauges: ClassVar[Dict[str, Gauge]] = {}
+    histograms: ClassVar[Dict[str, Histogram]] = {}
     registry = CollectorRegistry()
     must_collect_metrics = False
+    latency_buckets = DEFAULT_LATENCY_BUCKETS
+    # guards lazy metric creation when task runners execute on several threads
+    lock = threading.Lock()
+    exception_labels = ExceptionLabels()
 
     def __init__(self, settings: MetricsSettings):
         if settings is not None:
             os.environ["PROMETHEUS_MULTIPROC_DIR"] = settings.directory
             MultiProcessCollector(self.registry)
             self.must_collect_metrics = True
+            self.latency_buckets = settings.latency_buckets
+            self.exception_labels = ExceptionLabels(
+                settings.max_exception_labels, settings.exception_sample_interval
+            )
 
     @staticmethod
     def provide_metrics(settings: MetricsSettings) -> None:
         if settings is None:
             return
+        if settings.http_port is not None:
+            serve_metrics(settings)
+            return
         OUTPUT_FILE_PATH = os.path.join(
             settings.directory,
             settings.file_name
@@ -82,7 +98,7 @@ class MetricsCollector:
             documentation=MetricDocumentation.TASK_POLL_ERROR,
             labels={
                 MetricLabel.TASK_TYPE: task_type,
-                MetricLabel.EXCEPTION: str(exception)
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception)
             }
         )
 
@@ -101,7 +117,7 @@ class MetricsCollector:
             documentation=MetricDocumentation.TASK_EXECUTE_ERROR,
             labels={
                 MetricLabel.TASK_TYPE: task_type,
-                MetricLabel.EXCEPTION: str(exception)
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception)
             }
         )
 
@@ -120,7 +136,7 @@ class MetricsCollector:
             documentation=MetricDocumentation.TASK_ACK_ERROR,
             labels={
                 MetricLabel.TASK_TYPE: task_type,
-                MetricLabel.EXCEPTION: str(exception)
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception)
             }
         )
 
@@ -130,7 +146,7 @@ class MetricsCollector:
             documentation=MetricDocumentation.TASK_UPDATE_ERROR,
             labels={
                 MetricLabel.TASK_TYPE: task_type,
-                MetricLabel.EXCEPTION: str(exception)
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception)
             }
         )
 
@@ -151,7 +167,7 @@ class MetricsCollector:
             documentation=MetricDocumentation.WORKFLOW_START_ERROR,
             labels={
                 MetricLabel.WORKFLOW_TYPE: workflow_type,
-                MetricLabel.EXCEPTION: str(exception)
+                MetricLabel.EXCEPTION: self.exception_labels.label(exception)
             }
         )
 
@@ -185,6 +201,24 @@ class MetricsCollector:
             },
             value=time_spent
         )
+        self.__observe_histogram(
+            name=MetricName.TASK_POLL_LATENCY,
+            documentation=MetricDocumentation.TASK_POLL_LATENCY,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=time_spent
+        )
+
+    def record_task_poll_interval(self, task_type: str, interval: float) -> None:
+        self.__record_gauge(
+            name=MetricName.TASK_POLL_INTERVAL,
+            documentation=MetricDocumentation.TASK_POLL_INTERVAL,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=interval
+        )
 
     def record_task_execute_time(self, task_type: str, time_spent: float) -> None:
         self.__record_gauge(
@@ -195,6 +229,52 @@ class MetricsCollector:
             },
             value=time_spent
         )
+        self.__observe_histogram(
+            name=MetricName.TASK_EXECUTE_LATENCY,
+            documentation=MetricDocumentation.TASK_EXECUTE_LATENCY,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=time_spent
+        )
+
+    def record_task_update_time(self, task_type: str, time_spent: float) -> None:
+        self.__record_gauge(
+            name=MetricName.TASK_UPDATE_TIME,
+            documentation=MetricDocumentation.TASK_UPDATE_TIME,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=time_spent
+        )
+        self.__observe_histogram(
+            name=MetricName.TASK_UPDATE_LATENCY,
+            documentation=MetricDocumentation.TASK_UPDATE_LATENCY,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=time_spent
+        )
+
+    def record_task_end_to_end_time(self, task_type: str, time_spent: float) -> None:
+        self.__observe_histogram(
+            name=MetricName.TASK_END_TO_END_LATENCY,
+            documentation=MetricDocumentation.TASK_END_TO_END_LATENCY,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=time_spent
+        )
+
+    def record_task_update_queue_depth(self, task_type: str, depth: int) -> None:
+        self.__record_gauge(
+            name=MetricName.TASK_UPDATE_QUEUE_DEPTH,
+            documentation=MetricDocumentation.TASK_UPDATE_QUEUE_DEPTH,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=depth
+        )
 
     def __increment_counter(
             self,
@@ -227,6 +307,22 @@ class MetricsCollector:
         )
         gauge.labels(*labels.values()).set(value)
 
+    def __observe_histogram(
+            self,
+            name: MetricName,
+            documentation: MetricDocumentation,
+            labels: Dict[MetricLabel, str],
+            value: float
+    ) -> None:
+        if not self.must_collect_metrics:
+            return
+        histogram = self.__get_histogram(
+            name=name,
+            documentation=documentation,
+            labelnames=labels.keys()
+        )
+        histogram.labels(*labels.values()).observe(value)
+
     def __get_counter(
             self,
             name: MetricName,
@@ -234,9 +330,11 @@ class MetricsCollector:
             labelnames: List[MetricLabel]
     ) -> Counter:
         if name not in self.counters:
-            self.counters[name] = self.__generate_counter(
-                name, documentation, labelnames
-            )
+            with self.lock:
+                if name not in self.counters:
+                    self.counters[name] = self.__generate_counter(
+                        name, documentation, labelnames
+                    )
         return self.counters[name]
 
     def __get_gauge(
@@ -246,11 +344,27 @@ class MetricsCollector:
             labelnames: List[MetricLabel]
     ) -> Gauge:
         if name not in self.gauges:
-            self.gauges[name] = self.__generate_gauge(
-                name, documentation, labelnames
-            )
+            with self.lock:
+                if name not in self.gauges:
+                    self.gauges[name] = self.__generate_gauge(
+                        name, documentation, labelnames
+                    )
         return self.gauges[name]
 
+    def __get_histogram(
+            self,
+            name: MetricName,
+            documentation: MetricDocumentation,
+            labelnames: List[MetricLabel]
+    ) -> Histogram:
+        if name not in self.histograms:
+            with self.lock:
+                if name not in self.histograms:
+                    self.histograms[name] = self.__generate_histogram(
+                        name, documentation, labelnames
+                    )
+        return self.histograms[name]
+
     def __generate_counter(
             self,
             name: MetricName,
@@ -276,3 +390,17 @@ class MetricsCollector:
             labelnames=labelnames,
             registry=self.registry
         )
+
+    def __generate_histogram(
+            self,
+            name: MetricName,
+            documentation: MetricDocumentation,
+            labelnames: List[MetricLabel]
+    ) -> Histogram:
+        return Histogram(
+            name=name,
+            documentation=documentation,
+            labelnames=labelnames,
+            buckets=self.latency_buckets,
+            registry=self.registry
+        )
@@ -4,13 +4,13 @@ import inspect
 import logging
 import time
 import traceback
+import typing
 from copy import deepcopy
-from typing import Any, Callable, Union, Optional
+from typing import Any, Callable, List, Union, Optional
 
 from typing_extensions import Self
 
 from conductor.shared.automator import utils
-from conductor.shared.automator.utils import convert_from_dict_or_list
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models import TaskExecLog
@@ -18,7 +18,9 @@ from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_result import TaskResult
 from conductor.shared.http.enums import TaskResultStatus
 from conductor.shared.worker.exception import NonRetryableException
-from conductor.client.worker.worker_interface import WorkerInterface, DEFAULT_POLLING_INTERVAL
+from conductor.client.worker.worker_interface import WorkerInterface, DEFAULT_POLLING_INTERVAL, \
+    DEFAULT_BATCH_SIZE, DEFAULT_POLL_TIMEOUT, DEFAULT_THREAD_COUNT, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_BATCH_WAIT, \
+    THREAD_EXECUTOR, PROCESS_EXECUTOR
 
 ExecuteTaskFunction = Callable[
     [
@@ -42,11 +44,36 @@ def is_callable_input_parameter_a_task(callable: ExecuteTaskFunction, object_typ
     return parameter.annotation == object_type or parameter.annotation == parameter.empty or parameter.annotation is object  # noqa: PLR1714
 
 
+def is_callable_input_parameter_a_task_list(callable: ExecuteTaskFunction) -> bool:
+    parameters = inspect.signature(callable).parameters
+    if len(parameters) != 1:
+        return False
+    annotation = parameters[next(iter(parameters.keys()))].annotation
+    return typing.get_origin(annotation) is list and typing.get_args(annotation) == (Task,)
+
+
+def is_callable_a_batch_function(callable: ExecuteTaskFunction) -> bool:
+    # only an explicit List[...] annotation on every parameter makes a batch function,
+    # an unannotated def f(task) keeps receiving one task at a time
+    parameters = inspect.signature(callable).parameters
+    if len(parameters) == 0:
+        return False
+    return all(typing.get_origin(parameter.annotation) is list for parameter in parameters.values())
+
+
 def is_callable_return_value_of_type(callable: ExecuteTaskFunction, object_type: Any) -> bool:
     return_annotation = inspect.signature(callable).return_annotation
     return return_annotation == object_type
 
 
+def _offline_api_client() -> ApiClient:
+    # pool processes only convert models, so the client must not authenticate,
+    # which would fetch a token from every process when credentials are set
+    configuration = Configuration()
+    configuration.authentication_settings = None
+    return ApiClient(configuration)
+
+
 class Worker(WorkerInterface):
     def __init__(self,
                  task_definition_name: str,
@@ -54,6 +81,16 @@ class Worker(WorkerInterface):
                  poll_interval: Optional[float] = None,
                  domain: Optional[str] = None,
                  worker_id: Optional[str] = None,
+                 batch_size: Optional[int] = None,
+                 poll_timeout: Optional[int] = None,
+                 thread_count: Optional[int] = None,
+                 adaptive_polling: bool = False,
+                 max_poll_interval: Optional[int] = None,
+                 poll_all_task_types: bool = False,
+                 lazy_task: bool = False,
+                 max_batch_size: Optional[int] = None,
+                 max_batch_wait_ms: Optional[int] = None,
+                 executor_type: Optional[str] = None,
                  ) -> Self:
         super().__init__(task_definition_name)
         self.api_client = ApiClient()
@@ -62,6 +99,22 @@ class Worker(WorkerInterface):
         else:
             self.poll_interval = deepcopy(poll_interval)
         self.domain = deepcopy(domain)
+        self.batch_size = DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+        self.poll_timeout = DEFAULT_POLL_TIMEOUT if poll_timeout is None else poll_timeout
+        self.thread_count = DEFAULT_THREAD_COUNT if thread_count is None else thread_count
+        self.adaptive_polling = adaptive_polling
+        self.poll_all_task_types = poll_all_task_types
+        self.lazy_task = lazy_task
+        # with max_batch_size > 1 the execute function receives the inputs of a batch of tasks
+        self.max_batch_size = DEFAULT_MAX_BATCH_SIZE if max_batch_size is None else max_batch_size
+        self.max_batch_wait_ms = DEFAULT_MAX_BATCH_WAIT if max_batch_wait_ms is None else max_batch_wait_ms
+        self.executor_type = THREAD_EXECUTOR if executor_type is None else executor_type
+        if self.lazy_task and self.executor_type == PROCESS_EXECUTOR:
+            raise Exception("lazy_task cannot be used with the process executor")
+        if self.max_batch_size > 1 and self.executor_type == PROCESS_EXECUTOR:
+            raise Exception("max_batch_size cannot be greater than 1 with the process executor")
+        if max_poll_interval is not None:
+            self.max_poll_interval = max_poll_interval
         if worker_id is None:
             self.worker_id = deepcopy(super().get_identity())
         else:
@@ -69,7 +122,8 @@ class Worker(WorkerInterface):
         self.execute_function = deepcopy(execute_function)
 
     def execute(self, task: Task) -> TaskResult:
-        task_input = {}
+        if self.max_batch_size > 1 and self._is_execute_function_a_batch_function:
+            return self.execute_batch([task])[0]
         task_output = None
         task_result: TaskResult = self.get_task_result_from_task(task)
 
@@ -78,19 +132,7 @@ class Worker(WorkerInterface):
             if self._is_execute_function_input_parameter_a_task:
                 task_output = self.execute_function(task)
             else:
-                params = inspect.signature(self.execute_function).parameters
-                for input_name in params:
-                    typ = params[input_name].annotation
-                    default_value = params[input_name].default
-                    if input_name in task.input_data:
-                        if typ in utils.simple_types:
-                            task_input[input_name] = task.input_data[input_name]
-                        else:
-                            task_input[input_name] = convert_from_dict_or_list(typ, task.input_data[input_name])
-                    elif default_value is not inspect.Parameter.empty:
-                        task_input[input_name] = default_value
-                    else:
-                        task_input[input_name] = None
+                task_input = utils.bind_parameters(self._execute_function_parameter_plan, task.input_data)
                 task_output = self.execute_function(**task_input)
 
             if isinstance(task_output, TaskResult):
@@ -101,25 +143,70 @@ class Worker(WorkerInterface):
                 task_result.status = TaskResultStatus.COMPLETED
                 task_result.output_data = task_output
 
-        except NonRetryableException as ne:
+        except Exception as e:
+            self.__set_task_failure(task, task_result, e)
+
+        return self.__normalize_output_data(task_result)
+
+    def execute_batch(self, tasks: List[Task]) -> List[TaskResult]:
+        """
+        Calls the execute function once for all the tasks. It receives the list of tasks, or
+        for every parameter the list of its values in the task inputs, and returns one output per task.
+        """
+        if self.max_batch_size <= 1 or not self._is_execute_function_a_batch_function:
+            return super().execute_batch(tasks)
+        try:
+            if self._is_execute_function_input_parameter_a_task_list:
+                task_outputs = self.execute_function(tasks)
+            else:
+                task_inputs = utils.bind_batch_parameters(
+                    self._execute_function_batch_parameter_plan, [task.input_data for task in tasks]
+                )
+                task_outputs = self.execute_function(**task_inputs)
+            task_outputs = list(task_outputs)
+            if len(task_outputs) != len(tasks):
+                raise Exception(f"expected {len(tasks)} outputs from the batch, got {len(task_outputs)}")
+        except Exception as e:
+            task_results = []
+            for task in tasks:
+                task_result = self.get_task_result_from_task(task)
+                self.__set_task_failure(task, task_result, e)
+                task_results.append(task_result)
+            return task_results
+
+        task_results = []
+        for task, task_output in zip(tasks, task_outputs):
+            if isinstance(task_output, TaskResult):
+                task_output.task_id = task.task_id
+                task_output.workflow_instance_id = task.workflow_instance_id
+                task_results.append(task_output)
+                continue
+            task_result = self.get_task_result_from_task(task)
+            task_result.status = TaskResultStatus.COMPLETED
+            task_result.output_data = task_output
+            task_results.append(self.__normalize_output_data(task_result))
+        return task_results
+
+    def __set_task_failure(self, task: Task, task_result: TaskResult, exception: Exception) -> None:
+        if isinstance(exception, NonRetryableException):
             task_result.status = TaskResultStatus.FAILED_WITH_TERMINAL_ERROR
-            if len(ne.args) > 0:
-                task_result.reason_for_incompletion = ne.args[0]
-
-        except Exception as ne:
-            logger.error(
-                "Error executing task %s with id %s. error = %s",
-                task.task_def_name,
-                task.task_id,
-                traceback.format_exc()
-            )
-
-            task_result.logs = [TaskExecLog(
-                traceback.format_exc(), task_result.task_id, int(time.time()))]
-            task_result.status = TaskResultStatus.FAILED
-            if len(ne.args) > 0:
-                task_result.reason_for_incompletion = ne.args[0]
+            if len(exception.args) > 0:
+                task_result.reason_for_incompletion = exception.args[0]
+            return
+        logger.error(
+            "Error executing task %s with id %s. error = %s",
+            task.task_def_name,
+            task.task_id,
+            traceback.format_exc()
+        )
+
+        task_result.logs = [TaskExecLog(
+            traceback.format_exc(), task_result.task_id, int(time.time()))]
+        task_result.status = TaskResultStatus.FAILED
+        if len(exception.args) > 0:
+            task_result.reason_for_incompletion = exception.args[0]
 
+    def __normalize_output_data(self, task_result: TaskResult) -> TaskResult:
         if dataclasses.is_dataclass(type(task_result.output_data)):
             task_output = dataclasses.asdict(task_result.output_data)
             task_result.output_data = task_output
@@ -150,3 +237,22 @@ class Worker(WorkerInterface):
             callable=execute_function,
             object_type=TaskResult,
         )
+        self._execute_function_parameter_plan = utils.get_parameter_plan(execute_function)
+        self._is_execute_function_input_parameter_a_task_list = is_callable_input_parameter_a_task_list(
+            callable=execute_function
+        )
+        self._execute_function_batch_parameter_plan = utils.get_batch_parameter_plan(execute_function)
+        self._is_execute_function_a_batch_function = is_callable_a_batch_function(execute_function)
+
+    def __getstate__(self):
+        # the api client holds connection pools and locks, neither of which can be
+        # pickled when the worker is shipped to a process pool
+        state = self.__dict__.copy()
+        del state["api_client"]
+        state["_execute_function"] = utils.to_picklable_function(self._execute_function)
+        return state
+
+    def __setstate__(self, state):
+        state["_execute_function"] = utils.from_picklable_function(state["_execute_function"])
+        self.__dict__.update(state)
+        self.api_client = _offline_api_client()
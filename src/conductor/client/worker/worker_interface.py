@@ -1,12 +1,21 @@
 from __future__ import annotations
 import abc
 import socket
-from typing import Union
+from typing import List, Union
 
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_result import TaskResult
+from conductor.shared.automator.polling import DEFAULT_MAX_POLL_INTERVAL
 
 DEFAULT_POLLING_INTERVAL = 100  # ms
+DEFAULT_BATCH_SIZE = 1
+DEFAULT_POLL_TIMEOUT = 100  # ms
+DEFAULT_THREAD_COUNT = 1
+DEFAULT_MAX_BATCH_SIZE = 1
+DEFAULT_MAX_BATCH_WAIT = 100  # ms
+
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
 
 
 class WorkerInterface(abc.ABC):
@@ -16,6 +25,16 @@ class WorkerInterface(abc.ABC):
         self._task_definition_name_cache = None
         self._domain = None
         self._poll_interval = DEFAULT_POLLING_INTERVAL
+        self._batch_size = DEFAULT_BATCH_SIZE
+        self._poll_timeout = DEFAULT_POLL_TIMEOUT
+        self._thread_count = DEFAULT_THREAD_COUNT
+        self._adaptive_polling = False
+        self._poll_all_task_types = False
+        self._lazy_task = False
+        self._max_poll_interval = DEFAULT_MAX_POLL_INTERVAL
+        self._max_batch_size = DEFAULT_MAX_BATCH_SIZE
+        self._max_batch_wait_ms = DEFAULT_MAX_BATCH_WAIT
+        self._executor_type = THREAD_EXECUTOR
 
     @abc.abstractmethod
     def execute(self, task: Task) -> TaskResult:
@@ -28,6 +47,17 @@ class WorkerInterface(abc.ABC):
         """
         ...
 
+    def execute_batch(self, tasks: List[Task]) -> List[TaskResult]:
+        """
+        Executes several tasks of the same type at once, when max_batch_size is greater than 1.
+        Override it to process the batch together, by default the tasks are executed one by one.
+
+        :param tasks: (required)
+        :return: List[TaskResult]
+                 One result per task, in the order of the tasks.
+        """
+        return [self.execute(task) for task in tasks]
+
     def get_identity(self) -> str:
         """
         Retrieve the hostname of the instance that the worker is running.
@@ -118,3 +148,122 @@ class WorkerInterface(abc.ABC):
     @poll_interval.setter
     def poll_interval(self, value):
         self._poll_interval = value
+
+    @property
+    def batch_size(self):
+        """
+        Maximum number of tasks requested per poll. Values greater than 1
+        switch the task runner to the batch poll endpoint.
+        """
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value):
+        self._batch_size = value
+
+    @property
+    def poll_timeout(self):
+        """
+        Time in milliseconds the server holds a batch poll open while waiting for tasks.
+        """
+        return self._poll_timeout
+
+    @poll_timeout.setter
+    def poll_timeout(self, value):
+        self._poll_timeout = value
+
+    @property
+    def thread_count(self):
+        """
+        Number of tasks the task runner executes concurrently, each on its own thread.
+        """
+        return self._thread_count
+
+    @thread_count.setter
+    def thread_count(self, value):
+        self._thread_count = value
+
+    @property
+    def executor_type(self):
+        """
+        Where the task runner executes tasks, either "thread" or "process". With "process"
+        tasks run in a pool of thread_count processes while polling and updating stay in
+        the task runner, so the worker and its execute function must be picklable.
+        """
+        return self._executor_type
+
+    @executor_type.setter
+    def executor_type(self, value):
+        self._executor_type = value
+
+    @property
+    def adaptive_polling(self):
+        """
+        When enabled the task runner re-polls immediately after receiving work and
+        backs off exponentially, up to max_poll_interval, after consecutive empty polls.
+        """
+        return self._adaptive_polling
+
+    @adaptive_polling.setter
+    def adaptive_polling(self, value):
+        self._adaptive_polling = value
+
+    @property
+    def poll_all_task_types(self):
+        """
+        When enabled a worker with several task definitions polls every one of them
+        in each cycle instead of one per cycle in round robin, with thread_count
+        execution slots per task definition.
+        """
+        return self._poll_all_task_types
+
+    @poll_all_task_types.setter
+    def poll_all_task_types(self, value):
+        self._poll_all_task_types = value
+
+    @property
+    def lazy_task(self):
+        """
+        When enabled polled tasks are handed to the worker as a TaskView, which reads
+        fields from the polled json on access instead of building every nested model.
+        """
+        return self._lazy_task
+
+    @lazy_task.setter
+    def lazy_task(self, value):
+        self._lazy_task = value
+
+    @property
+    def max_poll_interval(self):
+        """
+        Upper bound in milliseconds for the adaptive polling interval.
+        """
+        return self._max_poll_interval
+
+    @max_poll_interval.setter
+    def max_poll_interval(self, value):
+        self._max_poll_interval = value
+
+    @property
+    def max_batch_size(self):
+        """
+        Maximum number of polled tasks handed to execute_batch at once. Values greater
+        than 1 make the task runner collect tasks for up to max_batch_wait_ms and
+        execute them as one batch. Not supported with the process executor.
+        """
+        return self._max_batch_size
+
+    @max_batch_size.setter
+    def max_batch_size(self, value):
+        self._max_batch_size = value
+
+    @property
+    def max_batch_wait_ms(self):
+        """
+        Time in milliseconds the task runner keeps polling to fill a batch before executing it.
+        """
+        return self._max_batch_wait_ms
+
+    @max_batch_wait_ms.setter
+    def max_batch_wait_ms(self, value):
+        self._max_batch_wait_ms = value
@@ -6,7 +6,10 @@ from conductor.client.workflow.task.simple_task import SimpleTask
 
 
 def WorkerTask(task_definition_name: str, poll_interval: int = 100, domain: Optional[str] = None, worker_id: Optional[str] = None,
-               poll_interval_seconds: int = 0):
+               poll_interval_seconds: int = 0, batch_size: int = 1, poll_timeout: int = 100,
+               thread_count: int = 1, adaptive_polling: bool = False, max_poll_interval: int = 5000,
+               max_batch_size: int = 1, max_batch_wait_ms: int = 100, executor_type: str = "thread",
+               poll_all_task_types: bool = False, lazy_task: bool = False):
     poll_interval_millis = poll_interval
     if poll_interval_seconds > 0:
         poll_interval_millis = 1000 * poll_interval_seconds
@@ -14,7 +17,11 @@ def WorkerTask(task_definition_name: str, poll_interval: int = 100, domain: Opti
     def worker_task_func(func):
 
         register_decorated_fn(name=task_definition_name, poll_interval=poll_interval_millis, domain=domain,
-                              worker_id=worker_id, func=func)
+                              worker_id=worker_id, func=func, batch_size=batch_size, poll_timeout=poll_timeout,
+                              thread_count=thread_count, adaptive_polling=adaptive_polling,
+                              max_poll_interval=max_poll_interval, max_batch_size=max_batch_size,
+                              max_batch_wait_ms=max_batch_wait_ms, executor_type=executor_type,
+                              poll_all_task_types=poll_all_task_types, lazy_task=lazy_task)
 
         @functools.wraps(func)
         def wrapper_func(*args, **kwargs):
@@ -30,10 +37,18 @@ def WorkerTask(task_definition_name: str, poll_interval: int = 100, domain: Opti
     return worker_task_func
 
 
-def worker_task(task_definition_name: str, poll_interval_millis: int = 100, domain: Optional[str] = None, worker_id: Optional[str] = None):
+def worker_task(task_definition_name: str, poll_interval_millis: int = 100, domain: Optional[str] = None, worker_id: Optional[str] = None,
+                batch_size: int = 1, poll_timeout: int = 100, thread_count: int = 1,
+                adaptive_polling: bool = False, max_poll_interval: int = 5000,
+                max_batch_size: int = 1, max_batch_wait_ms: int = 100, executor_type: str = "thread",
+                poll_all_task_types: bool = False, lazy_task: bool = False):
     def worker_task_func(func):
         register_decorated_fn(name=task_definition_name, poll_interval=poll_interval_millis, domain=domain,
-                              worker_id=worker_id, func=func)
+                              worker_id=worker_id, func=func, batch_size=batch_size, poll_timeout=poll_timeout,
+                              thread_count=thread_count, adaptive_polling=adaptive_polling,
+                              max_poll_interval=max_poll_interval, max_batch_size=max_batch_size,
+                              max_batch_wait_ms=max_batch_wait_ms, executor_type=executor_type,
+                              poll_all_task_types=poll_all_task_types, lazy_task=lazy_task)
 
         @functools.wraps(func)
         def wrapper_func(*args, **kwargs):
@@ -1,4 +1,8 @@
 from __future__ import annotations
+import hashlib
+import json
+import threading
+import weakref
 from copy import deepcopy
 from typing import Any, Dict, List, Union, Optional
 
@@ -20,9 +24,16 @@ from conductor.client.workflow.task.task import TaskInterface
 from conductor.client.workflow.task.task_type import TaskType
 from conductor.client.workflow.task.timeout_policy import TimeoutPolicy
 
+# content hashes of the definitions registered through each executor, by workflow name and version,
+# shared by every ConductorWorkflow so that variants with the same name and version do not shadow each other
+_registered_definition_hashes = weakref.WeakKeyDictionary()
+_registered_definition_hashes_lock = threading.Lock()
+
 
 class ConductorWorkflow:
     SCHEMA_VERSION = 2
+    # attributes that do not change the workflow definition
+    _DEFINITION_CACHE_ATTRIBUTES = ("_workflow_def_cache", "_workflow_def_hash")
 
     def __init__(self,
                  executor: WorkflowExecutor,
@@ -45,6 +56,17 @@ class ConductorWorkflow:
         self._restartable = True
         self._workflow_status_listener_enabled = False
         self._workflow_status_listener_sink = None
+        self._inline_definition = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # any change to the workflow invalidates the cached definition
+        if name not in ConductorWorkflow._DEFINITION_CACHE_ATTRIBUTES:
+            self.__definition_changed()
+        super().__setattr__(name, value)
+
+    def __definition_changed(self) -> None:
+        self.__dict__["_workflow_def_cache"] = None
+        self.__dict__["_workflow_def_hash"] = None
 
     @property
     def name(self) -> str:
@@ -137,6 +159,7 @@ class ConductorWorkflow:
             self._output_parameters = {}
 
         self._output_parameters[key] = value
+        self.__definition_changed()
         return self
 
     # InputTemplate template input to the workflow.  Can have combination of variables (e.g. ${workflow.input.abc}) and static values
@@ -183,6 +206,16 @@ class ConductorWorkflow:
         self.input_template(input)
         return self
 
+    # When disabled, starting the workflow registers its definition with the server the first time and after every
+    # change, and later starts only reference it by name and version instead of sending the whole definition.
+    # Registration is skipped only while the definition last registered under that name and version through the
+    # same executor has the same content, so definitions registered from other processes are not detected.
+    def inline_definition(self, inline_definition: bool) -> Self:
+        if not isinstance(inline_definition, bool):
+            raise Exception("invalid type")
+        self._inline_definition = inline_definition
+        return self
+
     # Register the workflow definition with the server. If overwrite is set, the definition on the server will be
     # overwritten. When not set, the call fails if there is any change in the workflow definition between the server
     # and what is being registered.
@@ -203,9 +236,7 @@ class ConductorWorkflow:
         -------
         Workflow Execution Id
         """
-        start_workflow_request.workflow_def = self.to_workflow_def()
-        start_workflow_request.name = self.name
-        start_workflow_request.version = self.version
+        self.__set_workflow_definition(start_workflow_request)
         return self._executor.start_workflow(start_workflow_request)
 
     def start_workflow_with_input(self, workflow_input: Optional[dict] = None, correlation_id: Optional[str] = None, task_to_domain: Optional[Dict[str, str]] = None,
@@ -215,9 +246,7 @@ class ConductorWorkflow:
         """
         workflow_input = workflow_input or {}
         start_workflow_request = StartWorkflowRequest()
-        start_workflow_request.workflow_def = self.to_workflow_def()
-        start_workflow_request.name = self.name
-        start_workflow_request.version = self.version
+        self.__set_workflow_definition(start_workflow_request)
         start_workflow_request.input = workflow_input
         start_workflow_request.correlation_id = correlation_id
         start_workflow_request.idempotency_key = idempotency_key
@@ -245,10 +274,13 @@ class ConductorWorkflow:
         """
         workflow_input = workflow_input or {}
         request = StartWorkflowRequest()
-        request.workflow_def = self.to_workflow_def()
+        if self._inline_definition:
+            request.workflow_def = self.__get_workflow_def()
+            request.name = request.workflow_def.name
+            request.version = 1
+        else:
+            self.__set_workflow_definition(request)
         request.input = workflow_input
-        request.name = request.workflow_def.name
-        request.version = 1
         if idempotency_key is not None:
             request.idempotency_key = idempotency_key
             request.idempotency_strategy = idempotency_strategy
@@ -278,6 +310,36 @@ class ConductorWorkflow:
             workflow_status_listener_sink=self._workflow_status_listener_sink
         )
 
+    def __get_workflow_def(self) -> WorkflowDef:
+        # built once and reused until the workflow changes
+        if self.__dict__.get("_workflow_def_cache") is None:
+            self._workflow_def_cache = self.to_workflow_def()
+        return self._workflow_def_cache
+
+    def __set_workflow_definition(self, start_workflow_request: StartWorkflowRequest) -> None:
+        start_workflow_request.name = self.name
+        start_workflow_request.version = self.version
+        if self._inline_definition:
+            start_workflow_request.workflow_def = self.__get_workflow_def()
+            return
+        workflow_def = self.__get_workflow_def()
+        if self.__dict__.get("_workflow_def_hash") is None:
+            # content hash, so a change that is later undone does not register again
+            sanitized = self._executor.workflow_client.api_client.sanitize_for_serialization(workflow_def)
+            self._workflow_def_hash = hashlib.sha256(
+                json.dumps(sanitized, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()
+        key = (self.name, self.version)
+        with _registered_definition_hashes_lock:
+            registered_hashes = _registered_definition_hashes.setdefault(self._executor, {})
+            if registered_hashes.get(key) == self._workflow_def_hash:
+                return
+            # cleared first, so a variant started while this one registers registers again
+            registered_hashes.pop(key, None)
+        self._executor.register_workflow(workflow_def, overwrite=True)
+        with _registered_definition_hashes_lock:
+            registered_hashes[key] = self._workflow_def_hash
+
     def to_workflow_task(self):
         sub_workflow_task = InlineSubWorkflowTask(task_ref_name=self.name + "_" + str(uuid()), workflow=self)
         sub_workflow_task.input_parameters.update(self._input_template)
@@ -334,6 +396,7 @@ class ConductorWorkflow:
                 f"invalid task -- if using @worker_task or @WorkerTask decorator ensure task_ref_name is passed as "
                 f"argument.  task is {type(task)}")
         self._tasks.append(deepcopy(task))
+        self.__definition_changed()
         return self
 
     def __add_fork_join_tasks(self, forked_tasks: List[List[TaskInterface]]) -> Self:
@@ -349,6 +412,7 @@ class ConductorWorkflow:
             forked_tasks=forked_tasks
         )
         self._tasks.append(fork_task)
+        self.__definition_changed()
         return self
 
     def __call__(self, **kwargs) -> WorkflowRun:
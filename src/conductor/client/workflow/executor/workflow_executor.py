@@ -1,6 +1,6 @@
 from __future__ import annotations
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from typing_extensions import Self
 
@@ -19,19 +19,23 @@ from conductor.client.http.models import (
     SkipTaskRequest,
     RerunWorkflowRequest,
     SignalResponse,
+    WorkflowSummary,
 )
 from conductor.client.http.models.correlation_ids_search_request import (
     CorrelationIdsSearchRequest,
 )
+from conductor.client.helpers.search_iterator import DEFAULT_SEARCH_PAGE_SIZE
 from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
+from conductor.shared.workflow.bulk_start import DEFAULT_BULK_START_CONCURRENCY, WorkflowStartResult
 
 
 class WorkflowExecutor:
-    def __init__(self, configuration: Configuration) -> Self:
-        api_client = ApiClient(configuration)
+    def __init__(self, configuration: Configuration, api_client: Optional[ApiClient] = None) -> Self:
+        if api_client is None:
+            api_client = ApiClient(configuration)
         self.metadata_client = MetadataResourceApi(api_client)
         self.task_client = TaskResourceApi(api_client)
-        self.workflow_client = OrkesWorkflowClient(configuration)
+        self.workflow_client = OrkesWorkflowClient(configuration, api_client)
 
     def register_workflow(self, workflow: WorkflowDef, overwrite: Optional[bool] = None) -> object:
         """Create a new workflow definition"""
@@ -50,7 +54,7 @@ class WorkflowExecutor:
 
     def start_workflows(self, *start_workflow_request: StartWorkflowRequest) -> List[str]:
         """Start multiple instances of workflows.  Note, there is no parallelism implemented in starting so giving a
-        very large number can impact the latencies and performance
+        very large number can impact the latencies and performance, use bulk_start_workflows for that
         """
         workflow_id_list = [""] * len(start_workflow_request)
         for i in range(len(start_workflow_request)):
@@ -59,6 +63,15 @@ class WorkflowExecutor:
             )
         return workflow_id_list
 
+    def bulk_start_workflows(self, start_workflow_requests: Iterable[StartWorkflowRequest],
+                             concurrency: int = DEFAULT_BULK_START_CONCURRENCY,
+                             rate_limit: Optional[float] = None) -> Iterator[WorkflowStartResult]:
+        """Start workflows concurrently from an iterable or generator of requests, yielding a WorkflowStartResult
+        with the workflow id or the error of each request as soon as it completes """
+        return self.workflow_client.bulk_start_workflows(
+            start_workflow_requests, concurrency=concurrency, rate_limit=rate_limit
+        )
+
     def execute_workflow(self, request: StartWorkflowRequest, wait_until_task_ref: Optional[str] = None, wait_for_seconds: int = 10,
                          request_id: Optional[str] = None) -> WorkflowRun:
         """Executes a workflow with StartWorkflowRequest and waits for the completion of the workflow or until a
@@ -156,6 +169,13 @@ class WorkflowExecutor:
         """Search for workflows based on payload and other parameters"""
         return self.workflow_client.search(start=start, size=size, free_text=free_text, query=query)
 
+    def iter_search(self, free_text: str = "*", query: Optional[str] = None,
+                    page_size: int = DEFAULT_SEARCH_PAGE_SIZE, prefetch: bool = True) -> Iterator[WorkflowSummary]:
+        """Iterates over all the workflows matching the search, fetching them page_size at a time"""
+        return self.workflow_client.iter_search(
+            free_text=free_text, query=query, page_size=page_size, prefetch=prefetch
+        )
+
     def get_by_correlation_ids(
             self,
             workflow_name: str,
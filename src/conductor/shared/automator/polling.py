@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+DEFAULT_MAX_POLL_INTERVAL = 5000  # ms
+DEFAULT_BACKOFF_MULTIPLIER = 2.0
+
+
+class AdaptivePollingInterval:
+    """
+    Computes the delay before the next poll from the outcome of the previous one.
+
+    Polls that return work are followed by an immediate re-poll. Consecutive empty
+    polls back off exponentially from the worker's polling interval until
+    max_interval is reached.
+    """
+
+    def __init__(
+        self,
+        max_interval: float,
+        backoff_multiplier: float = DEFAULT_BACKOFF_MULTIPLIER,
+    ):
+        self.max_interval = max_interval
+        self.backoff_multiplier = backoff_multiplier
+        self.consecutive_empty_polls = 0
+        self.current_interval = 0.0
+
+    def next_interval(self, base_interval: float, tasks_received: bool) -> float:
+        """
+        Record the outcome of a poll and return the delay in seconds before the next one.
+
+        :param base_interval: the worker's configured polling interval in seconds
+        :param tasks_received: whether the poll returned at least one task
+        :return: float
+        """
+        if tasks_received:
+            self.consecutive_empty_polls = 0
+            self.current_interval = 0.0
+            return self.current_interval
+
+        cap = max(self.max_interval, base_interval)
+        interval = base_interval * (self.backoff_multiplier ** self.consecutive_empty_polls)
+        if interval < cap:
+            self.consecutive_empty_polls += 1
+        self.current_interval = min(interval, cap)
+        return self.current_interval
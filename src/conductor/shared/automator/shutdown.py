@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+_shutdown_callbacks: List[Callable[[], None]] = []
+
+
+def on_shutdown_signal(callback: Callable[[], None]) -> bool:
+    """
+    Calls callback when the process receives SIGTERM, along with every other
+    callback registered in the process.
+
+    Signal handlers can only be set from the main thread, elsewhere nothing is
+    registered and False is returned.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return False
+    if not _shutdown_callbacks:
+        signal.signal(signal.SIGTERM, _handle_shutdown_signal)
+    _shutdown_callbacks.append(callback)
+    return True
+
+
+def _handle_shutdown_signal(signum, frame) -> None:
+    logger.info("Received signal %s, shutting down", signum)
+    for callback in list(_shutdown_callbacks):
+        callback()
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import functools
+import importlib
 import inspect
 import logging
+import sys
 import typing
 from typing import List
 
@@ -19,6 +22,138 @@ dict_types = {dict, typing.Dict, CaseInsensitiveDict}
 collection_types = {list, List, typing.Set}
 
 
+_SIMPLE = "simple"
+_LIST = "list"
+_DICT = "dict"
+_ORDERED_DICT = "ordered_dict"
+_EMPTY = "empty"
+_OBJECT = "object"
+
+
+class ParameterPlan(typing.NamedTuple):
+    name: str
+    annotation: typing.Any
+    default: typing.Any
+    needs_conversion: bool
+
+
+class _MemberPlan(typing.NamedTuple):
+    name: str
+    annotation: typing.Any
+    category: str
+    generic_types: tuple
+    default: typing.Any
+    kind: typing.Any
+
+
+def _classify(typ: typing.Any) -> str:
+    if typ in simple_types:
+        return _SIMPLE
+    name = str(typ)
+    if name.startswith(("typing.List[", "typing.Set[", "list[")):
+        return _LIST
+    if name.startswith(("dict[", "typing.Dict[", "requests.structures.CaseInsensitiveDict[")) or typ is dict:
+        return _DICT
+    if name.startswith("OrderedDict["):
+        return _ORDERED_DICT
+    if typ is inspect.Parameter.empty:
+        return _EMPTY
+    return _OBJECT
+
+
+_classify_cached = functools.lru_cache(maxsize=1024)(_classify)
+
+
+def _get_type_category(typ: typing.Any) -> str:
+    try:
+        return _classify_cached(typ)
+    except TypeError:
+        # unhashable annotations cannot be cached
+        return _classify(typ)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_member_plan(cls: type) -> typing.Tuple[_MemberPlan, ...]:
+    members = inspect.signature(cls.__init__).parameters
+    return tuple(
+        _MemberPlan(
+            name=name,
+            annotation=parameter.annotation,
+            category=_get_type_category(parameter.annotation),
+            generic_types=typing.get_args(parameter.annotation),
+            default=parameter.default,
+            kind=parameter.kind,
+        )
+        for name, parameter in members.items()
+        if name != "self"
+    )
+
+
+def get_parameter_plan(func: typing.Callable) -> typing.Tuple[ParameterPlan, ...]:
+    """
+    Resolve how each parameter of a worker function is bound from task input.
+    The plan is computed once, when the function is set on the worker.
+    """
+    parameters = inspect.signature(func).parameters
+    return tuple(
+        ParameterPlan(
+            name=name,
+            annotation=parameter.annotation,
+            default=None if parameter.default is inspect.Parameter.empty else parameter.default,
+            needs_conversion=_get_type_category(parameter.annotation) != _SIMPLE,
+        )
+        for name, parameter in parameters.items()
+    )
+
+
+def bind_parameters(plan: typing.Tuple[ParameterPlan, ...], input_data: dict) -> dict:
+    kwargs = {}
+    for name, annotation, default, needs_conversion in plan:
+        if name in input_data:
+            value = input_data[name]
+            kwargs[name] = convert_from_dict_or_list(annotation, value) if needs_conversion else value
+        else:
+            kwargs[name] = default
+    return kwargs
+
+
+def get_batch_parameter_plan(func: typing.Callable) -> typing.Tuple[ParameterPlan, ...]:
+    """
+    Resolve how each parameter of a batch worker function is bound from the inputs
+    of several tasks. A parameter annotated List[X] receives one X per task.
+    """
+    parameters = inspect.signature(func).parameters
+    plan = []
+    for name, parameter in parameters.items():
+        annotation = parameter.annotation
+        if _get_type_category(annotation) == _LIST and len(typing.get_args(annotation)) > 0:
+            annotation = typing.get_args(annotation)[0]
+        elif annotation is inspect.Parameter.empty or annotation in (list, List) or \
+                _get_type_category(annotation) == _LIST:
+            annotation = object
+        plan.append(ParameterPlan(
+            name=name,
+            annotation=annotation,
+            default=None if parameter.default is inspect.Parameter.empty else parameter.default,
+            needs_conversion=_get_type_category(annotation) != _SIMPLE,
+        ))
+    return tuple(plan)
+
+
+def bind_batch_parameters(plan: typing.Tuple[ParameterPlan, ...], inputs: typing.List[dict]) -> dict:
+    kwargs = {}
+    for name, annotation, default, needs_conversion in plan:
+        values = []
+        for input_data in inputs:
+            if name in input_data:
+                value = input_data[name]
+                values.append(convert_from_dict_or_list(annotation, value) if needs_conversion else value)
+            else:
+                values.append(default)
+        kwargs[name] = values
+    return kwargs
+
+
 def convert_from_dict_or_list(cls: type, data: typing.Union[dict, list]) -> object:
     is_list = type(data) in collection_types
     if is_list:
@@ -41,91 +176,58 @@ def convert_from_dict(cls: type, data: dict) -> object:
     if dataclasses.is_dataclass(cls):
         return from_dict(data_class=cls, data=data)
 
-    typ = type(data)
-    if not (
-        (
-            str(typ).startswith("dict[")
-            or str(typ).startswith("typing.Dict[")
-            or str(typ).startswith("requests.structures.CaseInsensitiveDict[")
-            or typ is dict
-            or str(typ).startswith("OrderedDict[")
-        )
-    ):
+    if _get_type_category(type(data)) not in (_DICT, _ORDERED_DICT):
         data = {}
 
-    members = inspect.signature(cls.__init__).parameters
     kwargs = {}
 
-    for member in members:
-        if "self" == member:
-            continue
-        typ = members[member].annotation
-        generic_types = typing.get_args(members[member].annotation)
+    for member in _get_member_plan(cls):
+        name = member.name
+        category = member.category
+        generic_types = member.generic_types
 
-        if typ in simple_types:
-            if member in data:
-                kwargs[member] = data[member]
+        if category == _SIMPLE:
+            if name in data:
+                kwargs[name] = data[name]
             else:
-                kwargs[member] = members[member].default
-        elif (
-            str(typ).startswith("typing.List[")
-            or str(typ).startswith("typing.Set[")
-            or str(typ).startswith("list[")
-        ):
-            values = []
-
+                kwargs[name] = member.default
+        elif category == _LIST:
             generic_type = object
             if len(generic_types) > 0:
                 generic_type = generic_types[0]
-            values = [get_value(generic_type, item) for item in data[member]]
-            kwargs[member] = values
-        elif (
-            str(typ).startswith("dict[")
-            or str(typ).startswith("typing.Dict[")
-            or str(typ).startswith("requests.structures.CaseInsensitiveDict[")
-            or typ is dict
-            or str(typ).startswith("OrderedDict[")
-        ):
-
+            kwargs[name] = [get_value(generic_type, item) for item in data[name]]
+        elif category in (_DICT, _ORDERED_DICT):
             values = {}
             generic_type = object
             if len(generic_types) > 1:
                 generic_type = generic_types[1]
-            for k in data[member]:
-                v = data[member][k]
+            for k in data[name]:
+                v = data[name][k]
                 values[k] = get_value(generic_type, v)
-            kwargs[member] = values
-        elif typ is inspect.Parameter.empty:
-            if inspect.Parameter.VAR_KEYWORD == members[member].kind:
+            kwargs[name] = values
+        elif category == _EMPTY:
+            if inspect.Parameter.VAR_KEYWORD == member.kind:
                 if type(data) in dict_types:
                     kwargs.update(data)
                 else:
-                    kwargs.update(data[member])
+                    kwargs.update(data[name])
             else:
                 # kwargs[member] = data[member]
                 kwargs.update(data)
         else:
-            kwargs[member] = convert_from_dict(typ, data[member])
+            kwargs[name] = convert_from_dict(member.annotation, data[name])
 
     return cls(**kwargs)
 
 
 def get_value(typ: type, val: object) -> object:
-    if typ in simple_types:
+    category = _get_type_category(typ)
+    if category == _SIMPLE:
         return val
-    elif (
-        str(typ).startswith("typing.List[")
-        or str(typ).startswith("typing.Set[")
-        or str(typ).startswith("list[")
-    ):
+    elif category == _LIST:
         values = [get_value(type(item), item) for item in val]
         return values
-    elif (
-        str(typ).startswith("dict[")
-        or str(typ).startswith("typing.Dict[")
-        or str(typ).startswith("requests.structures.CaseInsensitiveDict[")
-        or typ is dict
-    ):
+    elif category == _DICT:
         values = {}
         for k in val:
             v = val[k]
@@ -133,3 +235,35 @@ def get_value(typ: type, val: object) -> object:
         return values
     else:
         return convert_from_dict(typ, val)
+
+
+class DecoratedFunctionReference(typing.NamedTuple):
+    """
+    Stands in for a decorated worker function when a worker is pickled. Workers
+    hold the undecorated function, which pickle cannot look up by name since its
+    module attribute is the decorator's wrapper.
+    """
+    module: str
+    qualname: str
+
+    def resolve(self) -> typing.Callable:
+        func = importlib.import_module(self.module)
+        for name in self.qualname.split("."):
+            func = getattr(func, name)
+        return inspect.unwrap(func)
+
+
+def to_picklable_function(func: typing.Callable) -> typing.Union[typing.Callable, DecoratedFunctionReference]:
+    qualname = getattr(func, "__qualname__", "")
+    attribute = sys.modules.get(getattr(func, "__module__", None) or "")
+    for name in qualname.split("."):
+        attribute = getattr(attribute, name, None)
+    if attribute is not None and attribute is not func and inspect.unwrap(attribute) is func:
+        return DecoratedFunctionReference(func.__module__, qualname)
+    return func
+
+
+def from_picklable_function(func: typing.Union[typing.Callable, DecoratedFunctionReference]) -> typing.Callable:
+    if isinstance(func, DecoratedFunctionReference):
+        return func.resolve()
+    return func
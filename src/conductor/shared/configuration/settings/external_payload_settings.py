@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+# the default task output threshold of the server, larger outputs are rejected unless stored externally
+DEFAULT_OUTPUT_PAYLOAD_THRESHOLD = 3 * 1024 * 1024
+
+
+class ExternalPayloadSettings:
+    """
+    Settings for keeping large task payloads out of the update requests.
+
+    Task outputs larger than output_threshold bytes, once serialized to json, are
+    uploaded to the storage and the task result only carries their storage path.
+    Without a storage the locations are requested from the Conductor server.
+    """
+
+    def __init__(
+        self,
+        storage: Optional[Any] = None,
+        output_threshold: int = DEFAULT_OUTPUT_PAYLOAD_THRESHOLD,
+    ):
+        self.storage = storage
+        self.output_threshold = output_threshold
@@ -3,12 +3,21 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.shared.telemetry.exception_labels import (
+    DEFAULT_EXCEPTION_SAMPLE_INTERVAL,
+    DEFAULT_MAX_EXCEPTION_LABELS,
+)
 
 logger = logging.getLogger(Configuration.get_logging_formatted_name(__name__))
 
+# seconds; wide enough to cover both sub-millisecond polls and long running tasks
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0
+)
+
 
 def get_default_temporary_folder() -> str:
     return f"{Path.home()!s}/tmp/"
@@ -20,12 +29,30 @@ class MetricsSettings:
         directory: Optional[str] = None,
         file_name: str = "metrics.log",
         update_interval: float = 0.1,
+        latency_buckets: Optional[Sequence[float]] = None,
+        http_port: Optional[int] = None,
+        http_host: str = "0.0.0.0",
+        snapshot_ttl: float = 0.0,
+        max_exception_labels: int = DEFAULT_MAX_EXCEPTION_LABELS,
+        exception_sample_interval: float = DEFAULT_EXCEPTION_SAMPLE_INTERVAL,
     ):
         if directory is None:
             directory = get_default_temporary_folder()
         self.__set_dir(directory)
         self.file_name = file_name
         self.update_interval = update_interval
+        if latency_buckets is None:
+            latency_buckets = DEFAULT_LATENCY_BUCKETS
+        self.latency_buckets = tuple(latency_buckets)
+        # with a port set, metrics are served over HTTP when scraped instead of
+        # being rewritten to file_name every update_interval
+        self.http_port = http_port
+        self.http_host = http_host
+        self.snapshot_ttl = snapshot_ttl
+        # error metrics are labelled by exception class, up to max_exception_labels
+        # of them, and the messages are logged every exception_sample_interval
+        self.max_exception_labels = max_exception_labels
+        self.exception_sample_interval = exception_sample_interval
 
     def __set_dir(self, dir: str) -> None:
         if not os.path.isdir(dir):
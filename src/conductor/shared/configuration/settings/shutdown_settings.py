@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+
+class ShutdownSettings:
+    """
+    Settings for draining task runners instead of killing them.
+
+    Once asked to stop, by SIGTERM or TaskHandler.stop_processes, runners stop
+    polling and give the tasks in flight up to drain_timeout seconds to finish
+    and have their results sent. Tasks still running at the deadline are
+    released back to the server, so that another worker picks them up without
+    waiting for their response timeout. The task handler kills runners that
+    are still alive kill_grace_period seconds after the deadline.
+    """
+
+    def __init__(
+        self,
+        drain_timeout: float = 30.0,
+        kill_grace_period: float = 10.0,
+    ):
+        self.drain_timeout = drain_timeout
+        self.kill_grace_period = kill_grace_period
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import random
+
+
+class TaskUpdateSettings:
+    """
+    Settings for sending task results to the server from a background updater.
+
+    Results are queued (at most queue_size at a time) and sent while the task
+    runner keeps polling. Failed updates are retried up to max_attempts times with
+    jittered exponential backoff, without holding up the results behind them.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 100,
+        max_attempts: int = 4,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        backoff_multiplier: float = 2.0,
+        jitter: float = 0.5,
+        flush_timeout: float = 30.0,
+    ):
+        self.queue_size = queue_size
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.jitter = jitter
+        self.flush_timeout = flush_timeout
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay in seconds before retrying an update that has failed `attempt` times.
+        Up to `jitter` of the delay is randomly shaved off so that retries from
+        many workers do not arrive together.
+        """
+        delay = min(
+            self.max_backoff,
+            self.initial_backoff * (self.backoff_multiplier ** max(attempt - 1, 0)),
+        )
+        return random.uniform(delay * (1 - self.jitter), delay)
@@ -1,7 +1,11 @@
+from conductor.shared.http.enums.external_payload_operation import \
+    ExternalPayloadOperation
+from conductor.shared.http.enums.external_payload_type import \
+    ExternalPayloadType
 from conductor.shared.http.enums.idempotency_strategy import \
     IdempotencyStrategy
 from conductor.shared.http.enums.subject_type import SubjectType
 from conductor.shared.http.enums.target_type import TargetType
 from conductor.shared.http.enums.task_result_status import TaskResultStatus
 
-__all__ = ["IdempotencyStrategy", "SubjectType", "TargetType", "TaskResultStatus"]
+__all__ = ["ExternalPayloadOperation", "ExternalPayloadType", "IdempotencyStrategy", "SubjectType", "TargetType", "TaskResultStatus"]
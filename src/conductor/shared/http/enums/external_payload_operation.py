@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ExternalPayloadOperation(str, Enum):
+    READ = "READ"
+    WRITE = "WRITE"
+
+    def __str__(self) -> str:
+        return self.name.__str__()
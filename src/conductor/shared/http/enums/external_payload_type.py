@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class ExternalPayloadType(str, Enum):
+    WORKFLOW_INPUT = "WORKFLOW_INPUT"
+    WORKFLOW_OUTPUT = "WORKFLOW_OUTPUT"
+    TASK_INPUT = "TASK_INPUT"
+    TASK_OUTPUT = "TASK_OUTPUT"
+
+    def __str__(self) -> str:
+        return self.name.__str__()
@@ -3,10 +3,18 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
+
+from conductor.shared.telemetry.exception_labels import (
+    DEFAULT_EXCEPTION_SAMPLE_INTERVAL, DEFAULT_MAX_EXCEPTION_LABELS)
 
 logger = logging.getLogger(__name__)
 
+# seconds; wide enough to cover both sub-millisecond polls and long running tasks
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0
+)
+
 
 def get_default_temporary_folder() -> str:
     return f"{Path.home()!s}/tmp/"
@@ -25,6 +33,12 @@ class MetricsSettings:
         directory: Optional[str] = None,
         file_name: str = "metrics.log",
         update_interval: float = 0.1,
+        latency_buckets: Optional[Sequence[float]] = None,
+        http_port: Optional[int] = None,
+        http_host: str = "0.0.0.0",
+        snapshot_ttl: float = 0.0,
+        max_exception_labels: int = DEFAULT_MAX_EXCEPTION_LABELS,
+        exception_sample_interval: float = DEFAULT_EXCEPTION_SAMPLE_INTERVAL,
     ):
         """
         Initialize metrics settings.
@@ -37,12 +51,35 @@ class MetricsSettings:
             Name of the metrics file. Default is "metrics.log".
         update_interval : float
             Interval in seconds for updating metrics. Default is 0.1 seconds.
+        latency_buckets : Sequence[float], optional
+            Upper bounds in seconds of the latency histogram buckets.
+            If None, uses DEFAULT_LATENCY_BUCKETS.
+        http_port : int, optional
+            Port to serve metrics on over HTTP. When set, metrics are collected
+            when scraped instead of being written to file_name every update_interval.
+        http_host : str
+            Address the metrics HTTP server binds to. Default is "0.0.0.0".
+        snapshot_ttl : float
+            Seconds a collected snapshot is reused across scrapes. Default is 0.
+        max_exception_labels : int
+            Distinct exception classes used as error metric labels, others are
+            labelled "other". Default is DEFAULT_MAX_EXCEPTION_LABELS.
+        exception_sample_interval : float
+            Seconds between two logged error messages of the same exception label.
         """
         if directory is None:
             directory = get_default_temporary_folder()
         self.__set_dir(directory)
         self.file_name = file_name
         self.update_interval = update_interval
+        if latency_buckets is None:
+            latency_buckets = DEFAULT_LATENCY_BUCKETS
+        self.latency_buckets = tuple(latency_buckets)
+        self.http_port = http_port
+        self.http_host = http_host
+        self.snapshot_ttl = snapshot_ttl
+        self.max_exception_labels = max_exception_labels
+        self.exception_sample_interval = exception_sample_interval
 
     def __set_dir(self, dir: str) -> None:
         """Set and create the metrics directory if it doesn't exist."""
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Dict, Set, Type, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_EXCEPTION_LABELS = 20
+# seconds between two logged messages of the same exception label
+DEFAULT_EXCEPTION_SAMPLE_INTERVAL = 60.0
+OTHER_EXCEPTION_LABEL = "other"
+
+
+def get_exception_class_name(exception_class: Type[BaseException]) -> str:
+    if exception_class.__module__ == "builtins":
+        return exception_class.__qualname__
+    return f"{exception_class.__module__}.{exception_class.__qualname__}"
+
+
+class ExceptionLabels:
+    """
+    Maps exceptions to metric label values of bounded cardinality.
+
+    The label is the exception class name, never the message, and once
+    max_labels distinct classes were seen any new one is labelled "other".
+    Messages are logged instead, at most once per sample_interval for each label.
+    """
+
+    def __init__(
+        self,
+        max_labels: int = DEFAULT_MAX_EXCEPTION_LABELS,
+        sample_interval: float = DEFAULT_EXCEPTION_SAMPLE_INTERVAL,
+    ):
+        self.max_labels = max_labels
+        self.sample_interval = sample_interval
+        self.__labels: Set[str] = set()
+        self.__last_sample_times: Dict[str, float] = {}
+        self.__lock = threading.Lock()
+
+    def label(self, exception: Union[BaseException, Type[BaseException]]) -> str:
+        exception_class = exception if isinstance(exception, type) else type(exception)
+        class_name = get_exception_class_name(exception_class)
+        label = class_name
+        if label not in self.__labels:
+            with self.__lock:
+                if label not in self.__labels:
+                    if len(self.__labels) < self.max_labels:
+                        self.__labels.add(label)
+                    else:
+                        label = OTHER_EXCEPTION_LABEL
+        if not isinstance(exception, type):
+            self.__sample(label, class_name, exception)
+        return label
+
+    def __sample(self, label: str, class_name: str, exception: BaseException) -> None:
+        now = time.monotonic()
+        last_sample_time = self.__last_sample_times.get(label)
+        if last_sample_time is not None and now - last_sample_time < self.sample_interval:
+            return
+        self.__last_sample_times[label] = now
+        logger.info("Sampled error for exception label %s, %s: %s", label, class_name, exception)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+from prometheus_client.multiprocess import MultiProcessCollector
+
+logger = logging.getLogger(__name__)
+
+METRICS_PATHS = ("/", "/metrics")
+
+
+class MetricsSnapshot:
+    """
+    Aggregates the multiprocess metric files into the Prometheus text format.
+
+    The files are only read when a snapshot is requested, and the result is
+    reused for `ttl` seconds, so the cost follows the scrape rate.
+    """
+
+    def __init__(self, directory: str, ttl: float = 0.0):
+        self.registry = CollectorRegistry()
+        MultiProcessCollector(self.registry, path=directory)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._payload: Optional[bytes] = None
+        self._expires_at = 0.0
+
+    def get(self) -> bytes:
+        with self._lock:
+            now = time.monotonic()
+            if self._payload is None or now >= self._expires_at:
+                self._payload = generate_latest(self.registry)
+                self._expires_at = now + self.ttl
+            return self._payload
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.split("?", 1)[0] not in METRICS_PATHS:
+            self.send_error(404)
+            return
+        try:
+            payload = self.server.snapshot.get()
+        except Exception as e:
+            logger.error("Failed to collect metrics, reason: %s", e)
+            self.send_error(500)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE_LATEST)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format, *args)
+
+
+class MetricsServer:
+    """
+    Serves a MetricsSnapshot over HTTP for Prometheus to scrape.
+    """
+
+    def __init__(self, snapshot: MetricsSnapshot, host: str = "0.0.0.0", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+        self._server.daemon_threads = True
+        self._server.snapshot = snapshot
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def serve_forever(self) -> None:
+        logger.info("Serving metrics on port %s", self.port)
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="conductor-metrics-server", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def serve_metrics(settings) -> None:
+    """
+    Block serving the metrics described by settings over HTTP.
+    """
+    snapshot = MetricsSnapshot(settings.directory, settings.snapshot_ttl)
+    server = MetricsServer(snapshot, settings.http_host, settings.http_port)
+    server.serve_forever()
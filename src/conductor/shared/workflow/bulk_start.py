@@ -0,0 +1,130 @@
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+DEFAULT_BULK_START_CONCURRENCY = 10
+
+
+class WorkflowStartResult(NamedTuple):
+    """Outcome of starting one workflow of a bulk start."""
+
+    index: int
+    """Position of the request in the input."""
+    request: Any
+    workflow_id: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class RateLimiter:
+    """Spaces calls evenly so that at most rate of them start per second."""
+
+    def __init__(self, rate: Optional[float] = None):
+        self.__interval = 1 / rate if rate else 0.0
+        self.__next_time = 0.0
+        self.__lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserves the next slot and returns the seconds to wait for it."""
+        if self.__interval == 0:
+            return 0.0
+        with self.__lock:
+            now = time.monotonic()
+            start_time = max(now, self.__next_time)
+            self.__next_time = start_time + self.__interval
+            return start_time - now
+
+
+def start_workflows_concurrently(
+        start_workflow: Callable[[Any], str],
+        requests: Iterable[Any],
+        concurrency: int = DEFAULT_BULK_START_CONCURRENCY,
+        rate_limit: Optional[float] = None
+) -> Iterator[WorkflowStartResult]:
+    """
+    Calls start_workflow for every request from a pool of concurrency threads and
+    yields the results as they complete. Requests are read from the iterable only
+    when a slot frees up, so at most concurrency of them are held at a time.
+    """
+    rate_limiter = RateLimiter(rate_limit)
+
+    def start(index: int, request: Any) -> WorkflowStartResult:
+        delay = rate_limiter.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            return WorkflowStartResult(index, request, workflow_id=start_workflow(request))
+        except Exception as e:
+            return WorkflowStartResult(index, request, error=e)
+
+    executor = ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="conductor-bulk-start")
+    pending = set()
+    try:
+        for index, request in enumerate(requests):
+            if len(pending) >= concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(start, index, request))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # the caller may stop consuming early, drop what has not started yet
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def async_start_workflows_concurrently(
+        start_workflow: Callable[[Any], Awaitable[str]],
+        requests: Union[Iterable[Any], AsyncIterable[Any]],
+        concurrency: int = DEFAULT_BULK_START_CONCURRENCY,
+        rate_limit: Optional[float] = None
+) -> AsyncIterator[WorkflowStartResult]:
+    """
+    Awaits start_workflow for every request, at most concurrency at a time, and
+    yields the results as they complete. Requests may come from an async iterable.
+    """
+    rate_limiter = RateLimiter(rate_limit)
+
+    async def start(index: int, request: Any) -> WorkflowStartResult:
+        delay = rate_limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            return WorkflowStartResult(index, request, workflow_id=await start_workflow(request))
+        except Exception as e:
+            return WorkflowStartResult(index, request, error=e)
+
+    pending = set()
+    index = 0
+    try:
+        async for request in _aiter(requests):
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.create_task(start(index, request)))
+            index += 1
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _aiter(requests: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if hasattr(requests, "__aiter__"):
+        async for request in requests:
+            yield request
+    else:
+        for request in requests:
+            yield request
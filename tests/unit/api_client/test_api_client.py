@@ -1,5 +1,9 @@
 import uuid
 
+import pytest
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.api_client import ApiClient
 
 
@@ -8,3 +12,94 @@ def test_sanitize_for_serialization_with_uuid():
     obj = uuid.uuid4()
     sanitized = api_client.sanitize_for_serialization(obj)
     assert str(obj) == sanitized
+
+
+def test_connection_pool_size_follows_configuration():
+    configuration = Configuration()
+    configuration.pool_connections = 4
+    configuration.pool_maxsize = 32
+    api_client = ApiClient(configuration)
+    for prefix in ("http://", "https://"):
+        adapter = api_client.rest_client.connection.adapters[prefix]
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+
+
+def test_connection_pool_blocks_when_configured():
+    configuration = Configuration()
+    configuration.pool_block = True
+    api_client = ApiClient(configuration)
+    assert api_client.rest_client.connection.adapters["https://"]._pool_block is True
+
+
+def test_default_timeout_follows_configuration(mocker):
+    configuration = Configuration()
+    configuration.connect_timeout = 3
+    configuration.read_timeout = 30
+    api_client = ApiClient(configuration)
+    request = mocker.patch.object(api_client.rest_client.connection, "request")
+    request.return_value.status_code = 200
+    api_client.call_api("/metadata/workflow", "GET")
+    assert request.call_args.kwargs["timeout"] == (3, 30)
+
+
+def test_request_timeout_per_endpoint(mocker):
+    configuration = Configuration()
+    configuration.request_timeouts = {"/tasks/poll/batch/{tasktype}": (1, 5)}
+    api_client = ApiClient(configuration)
+    request = mocker.patch.object(api_client.rest_client.connection, "request")
+    request.return_value.status_code = 200
+    api_client.call_api(
+        "/tasks/poll/batch/{tasktype}", "GET", path_params={"tasktype": "task"}
+    )
+    assert request.call_args.kwargs["timeout"] == (1, 5)
+    api_client.call_api("/metadata/workflow", "GET")
+    assert request.call_args.kwargs["timeout"] == (120, 120)
+
+
+def test_http2_requires_httpx(mocker):
+    mocker.patch("conductor.client.http.httpx_rest.httpx", None)
+    configuration = Configuration()
+    configuration.http2 = True
+    with pytest.raises(ImportError, match="httpx"):
+        ApiClient(configuration)
+
+
+def test_deserialize_class_builds_models_from_plan():
+    api_client = ApiClient()
+    data = [
+        {
+            "taskId": f"task{i}",
+            "taskType": "simple",
+            "inputData": {"key": i},
+            "workflowTask": {"name": "simple", "taskReferenceName": "ref", "type": "SIMPLE"},
+            "unknownField": "ignored",
+        }
+        for i in range(3)
+    ] + [None]
+    tasks = api_client.deserialize_class(data, "list[Task]")
+    assert [task.task_id for task in tasks[:3]] == ["task0", "task1", "task2"]
+    assert tasks[1].input_data == {"key": 1}
+    assert tasks[0].workflow_task.task_reference_name == "ref"
+    assert tasks[3] is None
+    assert api_client.deserialize_class({"a": 1, "b": 2}, "dict(str, int)") == {"a": 1, "b": 2}
+
+
+def test_deserializers_are_built_once_per_type(mocker):
+    api_client = ApiClient()
+    get_deserializer = mocker.spy(api_client, "_ApiClient__get_deserializer")
+    api_client.deserialize_class([{"taskId": "task"}], "list[Task]")
+    built = get_deserializer.call_count
+    for _ in range(3):
+        api_client.deserialize_class([{"taskId": "task"}], "list[Task]")
+    assert get_deserializer.call_count == built
+
+
+def test_raw_response_returns_decoded_json(mocker):
+    api_client = ApiClient()
+    request = mocker.patch.object(api_client.rest_client.connection, "request")
+    request.return_value.status_code = 200
+    request.return_value.json.return_value = [{"taskId": "task"}]
+    task_api = TaskResourceApi(api_client)
+    assert task_api.batch_poll("task", _raw_response=True) == [{"taskId": "task"}]
+    assert task_api.batch_poll("task")[0].task_id == "task"
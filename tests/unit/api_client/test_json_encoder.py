@@ -0,0 +1,102 @@
+import datetime
+import json
+import uuid
+
+import pytest
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http import json_encoder
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models import StartWorkflowRequest, TaskResult, WorkflowDef, WorkflowTask
+from conductor.client.http.models.terminate_workflow import TerminateWorkflow
+from conductor.client.http.models.task_result_status import TaskResultStatus
+
+
+def sample_bodies():
+    task_result = TaskResult(
+        workflow_instance_id="workflow_id",
+        task_id="task_id",
+        status=TaskResultStatus.COMPLETED,
+        output_data={
+            "items": [{"id": i, "tags": ("a", "b")} for i in range(3)],
+            "at": datetime.datetime(2024, 1, 2, 3, 4, 5, 6000),
+            "day": datetime.date(2024, 1, 2),
+            "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            1: "non string key",
+        },
+    )
+    workflow_def = WorkflowDef(
+        name="workflow",
+        version=1,
+        tasks=[WorkflowTask(name="task", task_reference_name="task_ref", type="SIMPLE")],
+    )
+    return [
+        task_result,
+        workflow_def,
+        [StartWorkflowRequest(name="workflow", input={"key": "value"})],
+        TerminateWorkflow(workflow_id="workflow_id", termination_reason="reason"),
+        {"nested": task_result},
+    ]
+
+
+@pytest.mark.parametrize("body", sample_bodies())
+def test_dumps_matches_sanitize_for_serialization(body):
+    sanitize = ApiClient().sanitize_for_serialization
+    assert json.loads(json_encoder.dumps(body, sanitize, use_orjson=True)) == json.loads(json.dumps(sanitize(body)))
+
+
+def test_dumps_without_orjson(mocker):
+    mocker.patch.object(json_encoder, "orjson", None)
+    sanitize = ApiClient().sanitize_for_serialization
+    body = sample_bodies()[0]
+    assert json.loads(json_encoder.dumps(body, sanitize, use_orjson=True)) == json.loads(json.dumps(sanitize(body)))
+
+
+def test_dumps_falls_back_for_values_orjson_rejects():
+    sanitize = ApiClient().sanitize_for_serialization
+    assert json.loads(json_encoder.dumps({"big": 2 ** 70}, sanitize, use_orjson=True)) == {"big": 2 ** 70}
+
+
+def test_bodies_are_sanitized_without_fast_json(mocker):
+    api_client = ApiClient()
+    dumps = mocker.spy(json_encoder, "dumps")
+    request = mocker.patch.object(api_client.rest_client.connection, "request")
+    request.return_value.status_code = 200
+    body = sample_bodies()[1]
+    api_client.call_api("/metadata/workflow", "POST", body=body)
+    dumps.assert_not_called()
+    assert json.loads(request.call_args.kwargs["data"]) == api_client.sanitize_for_serialization(body)
+
+
+def test_bodies_are_encoded_with_orjson_with_fast_json(mocker):
+    configuration = Configuration()
+    configuration.fast_json = True
+    api_client = ApiClient(configuration=configuration)
+    dumps = mocker.spy(json_encoder, "dumps")
+    request = mocker.patch.object(api_client.rest_client.connection, "request")
+    request.return_value.status_code = 200
+    body = sample_bodies()[1]
+    api_client.call_api("/metadata/workflow", "POST", body=body)
+    dumps.assert_called_once()
+    assert json.loads(request.call_args.kwargs["data"]) == api_client.sanitize_for_serialization(body)
+
+
+def test_fast_json_requires_orjson(mocker):
+    mocker.patch.object(json_encoder, "orjson", None)
+    configuration = Configuration()
+    configuration.fast_json = True
+    with pytest.raises(ImportError, match="orjson"):
+        ApiClient(configuration=configuration)
+
+
+def test_model_fields_are_resolved_once_per_class():
+    assert json_encoder.get_model_fields(TaskResult) is json_encoder.get_model_fields(TaskResult)
+    assert ("workflow_instance_id", "workflowInstanceId") in json_encoder.get_model_fields(TaskResult)
+
+
+def test_encoded_body_is_sent_as_is(mocker):
+    api_client = ApiClient()
+    request = mocker.patch.object(api_client.rest_client.connection, "request")
+    request.return_value.status_code = 200
+    api_client.call_api("/tasks", "POST", body={"taskId": "task_id"})
+    assert json.loads(request.call_args.kwargs["data"]) == {"taskId": "task_id"}
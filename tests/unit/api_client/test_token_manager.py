@@ -0,0 +1,137 @@
+import gc
+import pickle
+import threading
+import time
+import weakref
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.token_manager import SharedToken, TokenManager
+from conductor.shared.configuration.settings.authentication_settings import AuthenticationSettings
+
+
+class TokenSource:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            return None
+        return f"token-{self.calls}"
+
+
+def test_concurrent_refreshes_collapse_into_one_request():
+    configuration = Configuration()
+    configuration.update_token("token-0")
+    token_source = TokenSource(delay=0.05)
+    token_manager = TokenManager(configuration, token_source)
+    observed_update_time = configuration.token_update_time
+    threads = [
+        threading.Thread(target=token_manager.refresh, args=(observed_update_time,))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert token_source.calls == 1
+    assert configuration.AUTH_TOKEN == "token-1"
+
+
+def test_get_token_does_not_request_a_fresh_token():
+    configuration = Configuration()
+    configuration.update_token("token-0")
+    token_source = TokenSource()
+    token_manager = TokenManager(configuration, token_source)
+    assert token_manager.get_token() == "token-0"
+    assert token_source.calls == 0
+    token_manager.stop()
+
+
+def test_token_is_refreshed_in_background_before_expiry():
+    configuration = Configuration()
+    configuration.auth_token_ttl_msec = 200
+    configuration.update_token("token-0")
+    token_source = TokenSource()
+    token_manager = TokenManager(configuration, token_source, refresh_ahead_ratio=0.25)
+    token_manager.get_token()
+    time.sleep(0.15)
+    token_manager.stop()
+    assert token_source.calls >= 1
+    assert configuration.AUTH_TOKEN != "token-0"
+
+
+def test_failed_refresh_keeps_current_token():
+    configuration = Configuration()
+    configuration.update_token("token-0")
+    token_manager = TokenManager(configuration, TokenSource(fail=True))
+    token_manager.refresh()
+    assert configuration.AUTH_TOKEN == "token-0"
+
+
+def test_shared_token_is_reused_by_other_processes():
+    shared_token = SharedToken()
+    first, second = Configuration(), Configuration()
+    first.shared_token = second.shared_token = shared_token
+    first_source, second_source = TokenSource(), TokenSource()
+    TokenManager(first, first_source).refresh()
+    TokenManager(second, second_source).refresh()
+    assert first_source.calls == 1
+    assert second_source.calls == 0
+    assert second.AUTH_TOKEN == first.AUTH_TOKEN == "token-1"
+    assert second.token_update_time == first.token_update_time
+
+
+def get_authenticated_configuration():
+    configuration = Configuration(
+        authentication_settings=AuthenticationSettings(key_id="key", key_secret="secret")
+    )
+    configuration.update_token("token-0")
+    return configuration
+
+
+def wait_for_refresher_threads(count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        threads = [t for t in threading.enumerate() if t.name == "conductor-token-refresher"]
+        if len(threads) <= count:
+            return len(threads)
+        time.sleep(0.01)
+    return len(threads)
+
+
+def test_dropped_clients_are_collected_with_their_refresher():
+    clients = []
+    for _ in range(5):
+        api_client = ApiClient(configuration=get_authenticated_configuration())
+        api_client.token_manager.get_token()
+        clients.append(weakref.ref(api_client))
+        del api_client
+    gc.collect()
+    assert [client() for client in clients] == [None] * 5
+    assert wait_for_refresher_threads(0) == 0
+
+
+def test_clients_of_one_configuration_share_a_token_manager():
+    configuration = get_authenticated_configuration()
+    api_clients = [ApiClient(configuration=configuration) for _ in range(3)]
+    assert len({id(api_client.token_manager) for api_client in api_clients}) == 1
+    for api_client in api_clients:
+        api_client.token_manager.get_token()
+    assert wait_for_refresher_threads(1) == 1
+    for api_client in api_clients:
+        api_client.close()
+    assert wait_for_refresher_threads(0) == 0
+
+
+def test_unpickled_clients_share_a_new_token_manager():
+    configuration = Configuration()
+    api_client = ApiClient(configuration=configuration)
+    restored_configuration, restored_client = pickle.loads(pickle.dumps((configuration, api_client)))
+    assert restored_client.configuration is restored_configuration
+    assert restored_client.token_manager is not api_client.token_manager
+    assert restored_client.token_manager is ApiClient(configuration=restored_configuration).token_manager
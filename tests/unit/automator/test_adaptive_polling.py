@@ -0,0 +1,30 @@
+import pytest
+
+from conductor.shared.automator.polling import AdaptivePollingInterval
+
+
+def test_backs_off_exponentially_on_empty_polls():
+    polling_interval = AdaptivePollingInterval(max_interval=1.0)
+    intervals = [polling_interval.next_interval(0.1, False) for _ in range(6)]
+    assert intervals == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+
+def test_resets_after_tasks_received():
+    polling_interval = AdaptivePollingInterval(max_interval=1.0)
+    for _ in range(3):
+        polling_interval.next_interval(0.1, False)
+    assert polling_interval.next_interval(0.1, True) == 0
+    assert polling_interval.current_interval == 0
+    assert polling_interval.next_interval(0.1, False) == pytest.approx(0.1)
+
+
+def test_never_goes_below_polling_interval():
+    polling_interval = AdaptivePollingInterval(max_interval=0.05)
+    assert polling_interval.next_interval(0.1, False) == pytest.approx(0.1)
+    assert polling_interval.next_interval(0.1, False) == pytest.approx(0.1)
+
+
+def test_custom_backoff_multiplier():
+    polling_interval = AdaptivePollingInterval(max_interval=10.0, backoff_multiplier=3.0)
+    intervals = [polling_interval.next_interval(0.1, False) for _ in range(3)]
+    assert intervals == pytest.approx([0.1, 0.3, 0.9])
@@ -1,10 +1,14 @@
 import multiprocessing
+import time
 
 import pytest
 
-from conductor.asyncio_client.automator.task_handler import TaskHandler
+from conductor.asyncio_client.adapters.api.task_resource_api import TaskResourceApiAdapter
+from conductor.asyncio_client.automator.task_handler import LOOP_MODE, TaskHandler
 from conductor.asyncio_client.automator.task_runner import AsyncTaskRunner
+from conductor.asyncio_client.automator.task_runner_group import AsyncTaskRunnerGroup
 from conductor.asyncio_client.configuration.configuration import Configuration
+from conductor.shared.configuration.settings.shutdown_settings import ShutdownSettings
 from tests.unit.resources.workers import ClassWorker2
 
 
@@ -32,3 +36,72 @@ def test_start_processes(mocker, valid_task_handler):
 @pytest.fixture
 def valid_task_handler():
     return TaskHandler(configuration=Configuration(), workers=[ClassWorker2("task")])
+
+
+def test_initialization_with_invalid_worker_mode(mocker):
+    mocker.patch(
+        "conductor.asyncio_client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    with pytest.raises(Exception, match="Invalid worker mode"):
+        TaskHandler(
+            configuration=Configuration(),
+            workers=[ClassWorker2("task")],
+            worker_mode="invalid",
+        )
+
+
+def test_loop_mode_shards_workers_across_processes(mocker):
+    mocker.patch(
+        "conductor.asyncio_client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    workers = [ClassWorker2(f"task{i}") for i in range(5)]
+    task_handler = TaskHandler(
+        configuration=Configuration(),
+        workers=workers,
+        scan_for_annotated_workers=False,
+        worker_mode=LOOP_MODE,
+        process_count=2,
+    )
+    assert len(task_handler.task_runner_processes) == 2
+    groups = [process._args[0].__self__ for process in task_handler.task_runner_processes]
+    assert all(isinstance(group, AsyncTaskRunnerGroup) for group in groups)
+    assert [w.get_task_definition_name() for w in groups[0].workers] == ["task0", "task2", "task4"]
+    assert [w.get_task_definition_name() for w in groups[1].workers] == ["task1", "task3"]
+
+
+@pytest.mark.asyncio
+async def test_task_runner_group_runs_workers_on_one_loop_with_shared_api_client(mocker):
+    runners = []
+
+    async def run(self):
+        runners.append(self)
+
+    mocker.patch.object(AsyncTaskRunner, "run", run)
+    group = AsyncTaskRunnerGroup([ClassWorker2("task1"), ClassWorker2("task2")], Configuration())
+    await group.run()
+    assert len(runners) == 2
+    assert runners[0].task_client.api_client is runners[1].task_client.api_client
+
+
+def test_task_runner_group_with_invalid_worker():
+    with pytest.raises(Exception, match="Invalid worker"):
+        AsyncTaskRunnerGroup(["invalid-worker"])
+
+
+def test_stop_processes_drains_task_runners(mocker):
+    mocker.patch.object(TaskResourceApiAdapter, "poll", return_value=None)
+    task_handler = TaskHandler(
+        configuration=Configuration(),
+        workers=[ClassWorker2("task")],
+        scan_for_annotated_workers=False,
+        shutdown_settings=ShutdownSettings(drain_timeout=1, kill_grace_period=5),
+    )
+    task_handler.start_processes()
+    # give the runner time to set its SIGTERM handler
+    time.sleep(0.5)
+    task_handler.stop_processes()
+    for process in task_handler.task_runner_processes:
+        # drained runners exit by themselves instead of being terminated by the signal
+        assert process.exitcode == 0
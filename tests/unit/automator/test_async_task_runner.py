@@ -1,4 +1,8 @@
+import asyncio
+import importlib
 import logging
+import os
+import signal
 from datetime import datetime
 import time
 
@@ -6,12 +10,16 @@ import pytest
 from requests.structures import CaseInsensitiveDict
 
 from conductor.asyncio_client.adapters.models.task_exec_log_adapter import TaskExecLogAdapter
+from conductor.asyncio_client.automator import task_handler
 from conductor.asyncio_client.automator.task_runner import AsyncTaskRunner
 from conductor.asyncio_client.configuration.configuration import Configuration
 from conductor.asyncio_client.adapters.api.task_resource_api import TaskResourceApiAdapter
 from conductor.asyncio_client.adapters.models.task_adapter import TaskAdapter
 from conductor.asyncio_client.adapters.models.task_result_adapter import TaskResultAdapter
+from conductor.shared.configuration.settings.shutdown_settings import ShutdownSettings
+from conductor.shared.configuration.settings.task_update_settings import TaskUpdateSettings
 from conductor.shared.http.enums import TaskResultStatus
+from conductor.asyncio_client.worker.worker import Worker
 from conductor.asyncio_client.worker.worker_interface import DEFAULT_POLLING_INTERVAL
 from tests.unit.resources.workers import ClassWorker2, FaultyExecutionWorker
 
@@ -210,6 +218,23 @@ async def test_run_once_roundrobin(mocker):
         )
 
 
+@pytest.mark.asyncio
+async def test_run_once_with_adaptive_polling(mocker):
+    mocker.patch.object(
+        TaskResourceApiAdapter, "poll", side_effect=[get_valid_task(), None, None]
+    )
+    mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    mock_sleep = mocker.patch("asyncio.sleep")
+    worker = get_valid_worker(poll_interval=100)
+    worker.adaptive_polling = True
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    for _ in range(3):
+        await task_runner.run_once()
+    assert [c.args[0] for c in mock_sleep.call_args_list] == pytest.approx([0.1, 0.2])
+
+
 @pytest.mark.asyncio
 async def test_poll_task(mocker):
     expected_task = get_valid_task()
@@ -269,6 +294,81 @@ async def test_execute_task():
     assert task_result == expected_task_result
 
 
+@pytest.mark.asyncio
+async def test_execute_task_with_async_execute_function():
+    async def execute(value: int):
+        await asyncio.sleep(0)
+        return value * 2
+
+    worker = Worker(task_definition_name="task", execute_function=execute)
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    task = get_valid_task()
+    task.input_data = {"value": 21}
+    task_result = await task_runner._AsyncTaskRunner__execute_task(task)
+    assert task_result.status == TaskResultStatus.COMPLETED
+    assert task_result.output_data == {"result": 42}
+
+
+@pytest.mark.asyncio
+async def test_execute_task_with_blocking_function_does_not_block_loop():
+    def execute() -> str:
+        time.sleep(0.2)
+        return "done"
+
+    worker = Worker(task_definition_name="task", execute_function=execute)
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    task_result = await task_runner._AsyncTaskRunner__execute_task(get_valid_task())
+    ticker_task.cancel()
+    assert task_result.output_data == {"result": "done"}
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_run_once_with_concurrency(mocker):
+    tasks = [
+        TaskAdapter(task_id=f"VALID_TASK_ID_{i}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+        for i in range(3)
+    ]
+    mocker.patch.object(TaskResourceApiAdapter, "poll", side_effect=tasks)
+    mock_update_task = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    worker = get_valid_worker()
+    worker.concurrency = 2
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    await task_runner.run_once()
+    await task_runner.run_once()
+    assert len(task_runner._running_tasks) == 2
+    await asyncio.gather(*task_runner._running_tasks)
+    assert mock_update_task.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_once_with_concurrency_when_saturated(mocker):
+    mock_poll = mocker.patch.object(TaskResourceApiAdapter, "poll")
+    worker = get_valid_worker(poll_interval=1)
+    worker.concurrency = 2
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    blocker = asyncio.Event()
+    task_runner._running_tasks = {
+        asyncio.create_task(blocker.wait()),
+        asyncio.create_task(blocker.wait()),
+    }
+    await task_runner.run_once()
+    mock_poll.assert_not_called()
+    blocker.set()
+    await asyncio.gather(*task_runner._running_tasks)
+
+
 @pytest.mark.asyncio
 async def test_update_task_with_invalid_task_result():
     expected_response = None
@@ -287,6 +387,23 @@ async def test_update_task_with_faulty_task_api(mocker):
     assert response is None
 
 
+@pytest.mark.asyncio
+async def test_update_task_retries_with_jittered_backoff(mocker):
+    mock_sleep = mocker.patch("asyncio.sleep")
+    mock_update_task = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", side_effect=[Exception(), Exception(), "VALID_UPDATE_TASK_RESPONSE"]
+    )
+    task_runner = AsyncTaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        task_update_settings=TaskUpdateSettings(max_attempts=3, initial_backoff=2.0, jitter=0.0),
+    )
+    response = await task_runner._AsyncTaskRunner__update_task(get_valid_task_result())
+    assert response == "VALID_UPDATE_TASK_RESPONSE"
+    assert mock_update_task.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 4.0]
+
+
 @pytest.mark.asyncio
 async def test_update_task(mocker):
     mocker.patch.object(
@@ -318,3 +435,144 @@ async def test_wait_for_polling_interval():
     finish_time = time.time()
     spent_time = finish_time - start_time
     assert spent_time > expected_time
+
+
+@pytest.mark.asyncio
+async def test_run_once_polls_all_task_types(mocker):
+    def poll(tasktype, **kwargs):
+        return TaskAdapter(task_id=f"{tasktype}_ID", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+
+    mock_poll = mocker.patch.object(TaskResourceApiAdapter, "poll", side_effect=poll)
+    mock_update_task = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    worker = get_valid_multi_task_worker()
+    worker.poll_all_task_types = True
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    mock_wait = mocker.patch.object(task_runner, "_AsyncTaskRunner__wait_for_polling_interval")
+    await task_runner.run_once()
+    assert sorted(c.kwargs["tasktype"] for c in mock_poll.call_args_list) == [
+        "task1", "task2", "task3", "task4", "task5", "task6"
+    ]
+    mock_wait.assert_not_called()
+    running_tasks = set().union(*task_runner._running_tasks_by_name.values())
+    assert len(running_tasks) == 6
+    await asyncio.gather(*running_tasks)
+    assert mock_update_task.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_run_once_polls_all_task_types_skips_saturated_types(mocker):
+    mock_poll = mocker.patch.object(TaskResourceApiAdapter, "poll", return_value=None)
+    worker = ClassWorker2(["task1", "task2"])
+    worker.poll_all_task_types = True
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    mocker.patch.object(task_runner, "_AsyncTaskRunner__wait_for_polling_interval")
+    blocker = asyncio.Event()
+    task_runner._running_tasks_by_name["task1"] = {asyncio.create_task(blocker.wait())}
+    await task_runner.run_once()
+    assert [c.kwargs["tasktype"] for c in mock_poll.call_args_list] == ["task2"]
+    blocker.set()
+    await asyncio.gather(*task_runner._running_tasks_by_name["task1"])
+
+
+@pytest.mark.asyncio
+async def test_run_after_stop_drains_tasks_in_flight(mocker):
+    mocker.patch.object(TaskResourceApiAdapter, "poll", return_value=get_valid_task())
+    mock_update_task = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+
+    async def execute() -> str:
+        await asyncio.sleep(0.2)
+        return "done"
+
+    worker = Worker(task_definition_name="task", execute_function=execute, concurrency=2)
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    await task_runner.run_once()
+    task_runner.stop()
+    await task_runner.run()
+    mock_update_task.assert_called_once()
+    task_result = mock_update_task.call_args.kwargs["task_result"]
+    assert task_result.status == TaskResultStatus.COMPLETED
+    assert task_result.output_data == {"result": "done"}
+
+
+@pytest.mark.asyncio
+async def test_run_after_stop_releases_tasks_running_at_deadline(mocker):
+    mocker.patch("conductor.asyncio_client.automator.task_runner.on_shutdown_signal")
+    mocker.patch.object(TaskResourceApiAdapter, "poll", return_value=get_valid_task())
+    mock_update_task = mocker.patch.object(
+        TaskResourceApiAdapter, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    finish = asyncio.Event()
+
+    async def execute() -> str:
+        await finish.wait()
+        return "done"
+
+    worker = Worker(task_definition_name="task", execute_function=execute, concurrency=2)
+    task_runner = AsyncTaskRunner(
+        configuration=Configuration(),
+        worker=worker,
+        shutdown_settings=ShutdownSettings(drain_timeout=0.1),
+    )
+    await task_runner.run_once()
+    task_runner.stop()
+    await task_runner.run()
+    finish.set()
+    await asyncio.gather(*task_runner._running_tasks)
+    # the result of a released task is dropped, the task now belongs to the server again
+    mock_update_task.assert_called_once()
+    task_result = mock_update_task.call_args.kwargs["task_result"]
+    assert task_result.task_id == "VALID_TASK_ID"
+    assert task_result.status == "IN_PROGRESS"
+    assert task_result.callback_after_seconds == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_task_of_decorated_function_in_process_pool(monkeypatch):
+    monkeypatch.setattr(task_handler, "_decorated_functions", {})
+    from tests.unit.resources import process_workers
+    importlib.reload(process_workers)
+    record = task_handler._decorated_functions[("process_task", None)]
+    worker = Worker(
+        task_definition_name="process_task",
+        execute_function=record["func"],
+        concurrency=1,
+        executor_type=record["executor_type"],
+    )
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    task = get_valid_task()
+    task.input_data = {"value": 21}
+    try:
+        task_result = await task_runner._AsyncTaskRunner__execute_task(task)
+    finally:
+        task_runner._executor.shutdown(wait=True)
+    assert task_result.status == TaskResultStatus.COMPLETED
+    assert task_result.output_data["result"]["value"] == 42
+    assert task_result.output_data["result"]["pid"] != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_does_not_inherit_the_drain_handler(monkeypatch):
+    monkeypatch.setattr(task_handler, "_decorated_functions", {})
+    from tests.unit.resources import process_workers
+    importlib.reload(process_workers)
+    record = task_handler._decorated_functions[("sigterm_task", None)]
+    worker = Worker(
+        task_definition_name="sigterm_task",
+        execute_function=record["func"],
+        concurrency=1,
+        executor_type=record["executor_type"],
+    )
+    task_runner = AsyncTaskRunner(configuration=Configuration(), worker=worker)
+    # as registered by run() with shutdown settings
+    previous_handler = signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    try:
+        task_result = await task_runner._AsyncTaskRunner__execute_task(get_valid_task())
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        task_runner._executor.shutdown(wait=True)
+    assert task_result.status == TaskResultStatus.COMPLETED
+    assert task_result.output_data["result"]["default"] is True
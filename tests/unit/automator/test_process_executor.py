@@ -0,0 +1,127 @@
+import importlib
+import os
+import pickle
+import subprocess
+import sys
+import textwrap
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+import pytest
+
+from conductor.client.automator.process_executor import (
+    SHARED_MEMORY_THRESHOLD,
+    ProcessTaskExecutor,
+    SharedPayload,
+    put_payload,
+    release_payload,
+    take_payload,
+)
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task import Task
+from conductor.client.worker.worker import Worker
+from conductor.shared.http.enums import TaskResultStatus
+
+
+def measure(data: str) -> dict:
+    return {"pid": os.getpid(), "length": len(data), "tail": data[-3:]}
+
+
+def crash(exit_code: int) -> dict:
+    if exit_code:
+        os._exit(exit_code)
+    return {"pid": os.getpid()}
+
+
+def test_small_payload_is_inline():
+    assert put_payload(b"{}") == b"{}"
+    assert take_payload(b"{}") == b"{}"
+
+
+def test_large_payload_is_taken_once_from_shared_memory():
+    data = b"x" * SHARED_MEMORY_THRESHOLD
+    payload = put_payload(data)
+    assert isinstance(payload, SharedPayload)
+    assert take_payload(payload) == data
+    with pytest.raises(FileNotFoundError):
+        take_payload(payload)
+    release_payload(payload)
+
+
+def test_execute_in_process_pool():
+    worker = Worker("task", measure, executor_type="process")
+    executor = ProcessTaskExecutor(worker, 1, ApiClient())
+    data = "y" * (2 * SHARED_MEMORY_THRESHOLD) + "end"
+    task = Task(task_id="task_id", workflow_instance_id="workflow_id", input_data={"data": data})
+    try:
+        task_result = executor.execute(task)
+    finally:
+        executor.shutdown()
+    assert task_result.task_id == "task_id"
+    assert task_result.workflow_instance_id == "workflow_id"
+    assert task_result.status == TaskResultStatus.COMPLETED
+    assert task_result.output_data["pid"] != os.getpid()
+    assert task_result.output_data["length"] == len(data)
+    assert task_result.output_data["tail"] == "end"
+
+
+def test_shared_memory_is_not_reported_as_leaked():
+    # the pool is started by a small task, before the runner registers any block,
+    # so each side of the pool may run a resource tracker of its own
+    script = textwrap.dedent("""
+        from conductor.client.automator.process_executor import SHARED_MEMORY_THRESHOLD, ProcessTaskExecutor
+        from conductor.client.http.api_client import ApiClient
+        from conductor.client.http.models.task import Task
+        from conductor.client.worker.worker import Worker
+        from tests.unit.automator.test_process_executor import measure
+
+        executor = ProcessTaskExecutor(Worker("task", measure, executor_type="process"), 1, ApiClient())
+        try:
+            for data in ["small", "z" * 2 * SHARED_MEMORY_THRESHOLD]:
+                task = Task(task_id="task_id", workflow_instance_id="workflow_id", input_data={"data": data})
+                assert executor.execute(task).output_data["length"] == len(data)
+        finally:
+            executor.shutdown()
+    """)
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(root, "src"), root]))
+    completed = subprocess.run([sys.executable, "-c", script], cwd=root, env=env, capture_output=True, text=True, timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    assert "leaked" not in completed.stderr
+    assert "No such file or directory" not in completed.stderr
+
+
+def test_pool_is_replaced_after_a_process_dies():
+    worker = Worker("task", crash, executor_type="process")
+    executor = ProcessTaskExecutor(worker, 1, ApiClient())
+    try:
+        with pytest.raises(BrokenProcessPool):
+            executor.execute(Task(task_id="crashed", workflow_instance_id="workflow_id", input_data={"exit_code": 3}))
+        task_result = executor.execute(Task(task_id="next", workflow_instance_id="workflow_id", input_data={"exit_code": 0}))
+    finally:
+        executor.shutdown()
+    assert task_result.task_id == "next"
+    assert task_result.status == TaskResultStatus.COMPLETED
+    assert task_result.output_data["pid"] != os.getpid()
+
+
+def test_worker_in_pool_process_does_not_authenticate(monkeypatch):
+    worker = Worker("task", measure, executor_type="process")
+    # pool processes inherit the credentials of the runner
+    monkeypatch.setenv("CONDUCTOR_AUTH_KEY", "key")
+    monkeypatch.setenv("CONDUCTOR_AUTH_SECRET", "secret")
+    with patch.object(ApiClient, "call_api") as call_api:
+        restored = pickle.loads(pickle.dumps(worker))
+    call_api.assert_not_called()
+    assert restored.api_client.configuration.authentication_settings is None
+
+
+def test_worker_with_decorated_function_is_picklable(monkeypatch):
+    from conductor.client.automator import task_handler
+    monkeypatch.setattr(task_handler, "_decorated_functions", {})
+    from tests.unit.resources import sync_process_workers
+    importlib.reload(sync_process_workers)
+    func = task_handler._decorated_functions[("process_task", None)]["func"]
+    worker = Worker(task_definition_name="process_task", execute_function=func)
+    restored = pickle.loads(pickle.dumps(worker))
+    assert restored.execute_function is func
@@ -0,0 +1,33 @@
+import os
+import signal
+import threading
+
+import pytest
+
+from conductor.shared.automator import shutdown
+from conductor.shared.automator.shutdown import on_shutdown_signal
+
+
+@pytest.fixture(autouse=True)
+def restore_signal_handler(monkeypatch):
+    monkeypatch.setattr(shutdown, "_shutdown_callbacks", [])
+    handler = signal.getsignal(signal.SIGTERM)
+    yield
+    signal.signal(signal.SIGTERM, handler)
+
+
+def test_sigterm_calls_every_callback():
+    calls = []
+    assert on_shutdown_signal(lambda: calls.append("first"))
+    assert on_shutdown_signal(lambda: calls.append("second"))
+    os.kill(os.getpid(), signal.SIGTERM)
+    assert calls == ["first", "second"]
+
+
+def test_callbacks_are_not_registered_outside_main_thread():
+    registered = []
+    thread = threading.Thread(target=lambda: registered.append(on_shutdown_signal(lambda: None)))
+    thread.start()
+    thread.join()
+    assert registered == [False]
+    assert signal.getsignal(signal.SIGTERM) is not shutdown._handle_shutdown_signal
@@ -1,10 +1,16 @@
 import multiprocessing
+import time
 
 import pytest
 
-from conductor.client.automator.task_handler import TaskHandler
+from conductor.client.automator.task_handler import THREAD_MODE, TaskHandler
 from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.automator.task_runner_group import TaskRunnerGroup
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.token_manager import SharedToken
+from conductor.client.worker.worker_task import worker_task
+from conductor.shared.configuration.settings.shutdown_settings import ShutdownSettings
 from tests.unit.resources.workers import ClassWorker
 
 
@@ -32,3 +38,133 @@ def test_start_processes(mocker, valid_task_handler):
 @pytest.fixture
 def valid_task_handler():
     return TaskHandler(configuration=Configuration(), workers=[ClassWorker("task")])
+
+
+def test_initialization_with_invalid_worker_mode(mocker):
+    mocker.patch(
+        "conductor.client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    with pytest.raises(Exception, match="Invalid worker mode"):
+        TaskHandler(
+            configuration=Configuration(),
+            workers=[ClassWorker("task")],
+            worker_mode="invalid",
+        )
+
+
+def test_thread_mode_shards_workers_across_processes(mocker):
+    mocker.patch(
+        "conductor.client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    workers = [ClassWorker(f"task{i}") for i in range(5)]
+    task_handler = TaskHandler(
+        configuration=Configuration(),
+        workers=workers,
+        scan_for_annotated_workers=False,
+        worker_mode=THREAD_MODE,
+        process_count=2,
+    )
+    assert len(task_handler.task_runner_processes) == 2
+    groups = [process._target.__self__ for process in task_handler.task_runner_processes]
+    assert all(isinstance(group, TaskRunnerGroup) for group in groups)
+    assert [w.get_task_definition_name() for w in groups[0].workers] == ["task0", "task2", "task4"]
+    assert [w.get_task_definition_name() for w in groups[1].workers] == ["task1", "task3"]
+
+
+def test_thread_mode_never_creates_more_processes_than_workers(mocker):
+    mocker.patch(
+        "conductor.client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    task_handler = TaskHandler(
+        configuration=Configuration(),
+        workers=[ClassWorker("task")],
+        scan_for_annotated_workers=False,
+        worker_mode=THREAD_MODE,
+        process_count=4,
+    )
+    assert len(task_handler.task_runner_processes) == 1
+
+
+def test_task_runner_group_shares_api_client_and_executor(mocker):
+    workers = [ClassWorker("task1"), ClassWorker("task2")]
+    workers[0].thread_count = 3
+    workers[1].thread_count = 2
+    runners = []
+    mocker.patch.object(TaskRunner, "run", lambda self: runners.append(self))
+    TaskRunnerGroup(workers, Configuration()).run()
+    assert len(runners) == 2
+    assert runners[0].task_client.api_client is runners[1].task_client.api_client
+    assert runners[0].executor is runners[1].executor
+    assert runners[0].executor._max_workers == 5
+    runners[0].executor.shutdown()
+
+
+def test_task_runner_group_with_invalid_worker():
+    with pytest.raises(Exception, match="Invalid worker"):
+        TaskRunnerGroup(["invalid-worker"])
+
+
+def test_share_auth_token_sets_shared_token(mocker):
+    mocker.patch(
+        "conductor.client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    configuration = Configuration()
+    TaskHandler(
+        configuration=configuration,
+        workers=[ClassWorker("task")],
+        scan_for_annotated_workers=False,
+        share_auth_token=True,
+    )
+    assert isinstance(configuration.shared_token, SharedToken)
+
+
+def test_stop_processes_drains_task_runners(mocker):
+    mocker.patch.object(TaskResourceApi, "poll", return_value=None)
+    task_handler = TaskHandler(
+        configuration=Configuration(),
+        workers=[ClassWorker("task")],
+        scan_for_annotated_workers=False,
+        shutdown_settings=ShutdownSettings(drain_timeout=1, kill_grace_period=5),
+    )
+    task_handler.start_processes()
+    # give the runner time to set its SIGTERM handler
+    time.sleep(0.5)
+    task_handler.stop_processes()
+    for process in task_handler.task_runner_processes:
+        # drained runners exit by themselves instead of being terminated by the signal
+        assert process.exitcode == 0
+
+
+def get_decorated_workers(mocker, decorator):
+    mocker.patch(
+        "conductor.client.automator.task_handler._setup_logging_queue",
+        return_value=(None, None),
+    )
+    mocker.patch("conductor.client.automator.task_handler._decorated_functions", {})
+
+    @decorator
+    def decorated(value: int) -> int:
+        return value
+
+    task_handler = TaskHandler(configuration=Configuration(), worker_mode=THREAD_MODE)
+    return [worker for process in task_handler.task_runner_processes for worker in process._target.__self__.workers]
+
+
+def test_decorated_worker_polls_all_task_types(mocker):
+    workers = get_decorated_workers(mocker, worker_task("decorated_task", poll_all_task_types=True))
+    assert [worker.get_task_definition_name() for worker in workers] == ["decorated_task"]
+    assert workers[0].poll_all_task_types is True
+
+
+def test_decorated_worker_reads_lazy_tasks(mocker):
+    workers = get_decorated_workers(mocker, worker_task("decorated_task", lazy_task=True))
+    assert workers[0].lazy_task is True
+
+
+def test_decorated_worker_rejects_lazy_tasks_in_process_pool(mocker):
+    with pytest.raises(Exception, match="lazy_task cannot be used with the process executor"):
+        get_decorated_workers(mocker, worker_task("decorated_task", lazy_task=True, executor_type="process"))
@@ -1,16 +1,30 @@
+import dataclasses
+import json
 import logging
+import pickle
+import threading
 import time
+from concurrent.futures import Future
+from typing import List
 
 import pytest
 from requests.structures import CaseInsensitiveDict
 
+from conductor.client.automator.external_payload_storage import LocalExternalPayloadStorage
 from conductor.client.automator.task_runner import TaskRunner
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.external_storage_location import ExternalStorageLocation
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_view import TaskView
 from conductor.client.http.models.task_result_status import TaskResultStatus
+from conductor.client.worker.worker import Worker
 from conductor.client.worker.worker_interface import DEFAULT_POLLING_INTERVAL
+from conductor.shared.configuration.settings.external_payload_settings import ExternalPayloadSettings
+from conductor.shared.configuration.settings.shutdown_settings import ShutdownSettings
+from conductor.shared.configuration.settings.task_update_settings import TaskUpdateSettings
+from conductor.shared.http.enums import ExternalPayloadOperation, ExternalPayloadType
 from tests.unit.resources.workers import ClassWorker, OldFaultyExecutionWorker
 
 
@@ -83,6 +97,15 @@ def get_valid_worker(domain=None, poll_interval=None):
     return cw
 
 
+def test_task_runner_is_picklable():
+    # TaskHandler pickles its runners when processes are spawned
+    task_runner = get_valid_task_runner()
+    restored = pickle.loads(pickle.dumps(task_runner))
+    assert restored.worker.get_task_definition_name() == "task"
+    assert restored.task_client.api_client.configuration is restored.configuration
+    assert not restored._stop_requested.is_set()
+
+
 def test_initialization_with_invalid_worker():
     with pytest.raises(Exception, match="Invalid worker"):
         TaskRunner(
@@ -206,6 +229,256 @@ def test_run_once_roundrobin(mocker):
         )
 
 
+def test_run_once_batch_poll(mocker):
+    tasks = [
+        Task(task_id=f"VALID_TASK_ID_{i}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+        for i in range(3)
+    ]
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll", return_value=tasks)
+    mock_poll = mocker.patch.object(TaskResourceApi, "poll")
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    worker = get_valid_worker()
+    worker.batch_size = 5
+    worker.poll_timeout = 200
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    mock_wait = mocker.patch.object(task_runner, "_TaskRunner__wait_for_polling_interval")
+    task_runner.run_once()
+    mock_poll.assert_not_called()
+    assert mock_batch_poll.call_args.kwargs["count"] == 5
+    assert mock_batch_poll.call_args.kwargs["timeout"] == 200
+    assert [c.kwargs["body"].task_id for c in mock_update_task.call_args_list] == [
+        "VALID_TASK_ID_0",
+        "VALID_TASK_ID_1",
+        "VALID_TASK_ID_2",
+    ]
+    mock_wait.assert_not_called()
+
+
+def test_run_once_batch_poll_empty_waits(mocker):
+    mocker.patch.object(TaskResourceApi, "batch_poll", return_value=[])
+    mock_update_task = mocker.patch.object(TaskResourceApi, "update_task")
+    worker = get_valid_worker()
+    worker.batch_size = 5
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    mock_wait = mocker.patch.object(task_runner, "_TaskRunner__wait_for_polling_interval")
+    task_runner.run_once()
+    mock_update_task.assert_not_called()
+    mock_wait.assert_called_once()
+
+
+def test_batch_poll_task_with_faulty_task_api(mocker):
+    mocker.patch.object(TaskResourceApi, "batch_poll", side_effect=Exception())
+    task_runner = get_valid_task_runner()
+    tasks = task_runner._TaskRunner__batch_poll_tasks()
+    assert tasks == []
+
+
+def get_batch_worker(execute_function, max_batch_size=3, max_batch_wait_ms=1000):
+    return Worker(
+        task_definition_name="task",
+        execute_function=execute_function,
+        max_batch_size=max_batch_size,
+        max_batch_wait_ms=max_batch_wait_ms,
+    )
+
+
+def get_tasks_with_values(*values):
+    return [
+        Task(task_id=f"VALID_TASK_ID_{value}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID",
+             input_data={"value": value})
+        for value in values
+    ]
+
+
+def test_run_once_executes_batch(mocker):
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll")
+    mock_batch_poll.side_effect = [get_tasks_with_values(1, 2), get_tasks_with_values(3)]
+    mock_update_task = mocker.patch.object(TaskResourceApi, "update_task")
+    batches = []
+
+    def double(value: List[int]) -> list:
+        batches.append(value)
+        return [{"doubled": v * 2} for v in value]
+
+    task_runner = TaskRunner(configuration=Configuration(), worker=get_batch_worker(double))
+    task_runner.run_once()
+    assert [c.kwargs["count"] for c in mock_batch_poll.call_args_list] == [3, 1]
+    assert batches == [[1, 2, 3]]
+    assert [
+        (c.kwargs["body"].task_id, c.kwargs["body"].output_data) for c in mock_update_task.call_args_list
+    ] == [
+        ("VALID_TASK_ID_1", {"doubled": 2}),
+        ("VALID_TASK_ID_2", {"doubled": 4}),
+        ("VALID_TASK_ID_3", {"doubled": 6}),
+    ]
+
+
+def test_run_once_executes_partial_batch_after_wait(mocker):
+    mocker.patch.object(TaskResourceApi, "batch_poll", side_effect=[get_tasks_with_values(1)] + [[]] * 100)
+    mock_update_task = mocker.patch.object(TaskResourceApi, "update_task")
+    batches = []
+
+    def execute(tasks: List[Task]) -> list:
+        batches.append([task.task_id for task in tasks])
+        return [{"done": True} for _ in tasks]
+
+    worker = get_batch_worker(execute, max_batch_wait_ms=50)
+    worker.poll_interval = 10
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    task_runner.run_once()
+    assert batches == [["VALID_TASK_ID_1"]]
+    assert mock_update_task.call_args.kwargs["body"].status == TaskResultStatus.COMPLETED
+
+
+def test_run_once_in_batches_waits_only_after_empty_poll(mocker):
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll")
+    mocker.patch.object(TaskResourceApi, "update_task")
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_batch_worker(lambda value: [{} for _ in value], max_batch_size=2, max_batch_wait_ms=0)
+    )
+    mock_wait = mocker.patch.object(task_runner, "_TaskRunner__wait_for_polling_interval")
+    mock_batch_poll.return_value = get_tasks_with_values(1, 2)
+    task_runner.run_once()
+    mock_wait.assert_not_called()
+    mock_batch_poll.return_value = []
+    task_runner.run_once()
+    mock_wait.assert_called_once()
+
+
+def test_run_once_executes_unannotated_function_one_task_at_a_time(mocker):
+    mocker.patch.object(TaskResourceApi, "batch_poll", return_value=get_tasks_with_values(1, 2))
+    mock_update_task = mocker.patch.object(TaskResourceApi, "update_task")
+    received = []
+
+    def execute(task):
+        received.append(task)
+        return {"value": task.input_data["value"]}
+
+    task_runner = TaskRunner(configuration=Configuration(), worker=get_batch_worker(execute, max_batch_size=2))
+    task_runner.run_once()
+    assert all(isinstance(task, Task) for task in received)
+    assert [c.kwargs["body"].output_data for c in mock_update_task.call_args_list] == [{"value": 1}, {"value": 2}]
+
+
+def test_batch_worker_rejects_process_executor(monkeypatch):
+    with pytest.raises(Exception, match="max_batch_size cannot be greater than 1 with the process executor"):
+        Worker("task", lambda tasks: tasks, max_batch_size=2, executor_type="process")
+    monkeypatch.setenv("conductor_worker_task_executor_type", "process")
+    with pytest.raises(Exception, match="max_batch_size cannot be greater than 1 with the process executor"):
+        TaskRunner(configuration=Configuration(), worker=get_batch_worker(lambda tasks: tasks))
+
+
+def test_run_once_fails_every_task_of_failed_batch(mocker):
+    mocker.patch.object(TaskResourceApi, "batch_poll", return_value=get_tasks_with_values(1, 2, 3))
+    mock_update_task = mocker.patch.object(TaskResourceApi, "update_task")
+
+    def execute(value: List[int]) -> list:
+        raise Exception("model unavailable")
+
+    task_runner = TaskRunner(configuration=Configuration(), worker=get_batch_worker(execute))
+    task_runner.run_once()
+    task_results = [c.kwargs["body"] for c in mock_update_task.call_args_list]
+    assert len(task_results) == 3
+    assert all(task_result.status == TaskResultStatus.FAILED for task_result in task_results)
+    assert all(task_result.reason_for_incompletion == "model unavailable" for task_result in task_results)
+
+
+def test_initialization_with_max_batch_size_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_max_batch_size", "16")
+    monkeypatch.setenv("CONDUCTOR_WORKER_MAX_BATCH_WAIT_MS", "250")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.max_batch_size == 16
+    assert task_runner.worker.max_batch_wait_ms == 250
+
+
+def test_initialization_with_batch_size_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_batch_size", "10")
+    monkeypatch.setenv("CONDUCTOR_WORKER_POLL_TIMEOUT", "500")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.batch_size == 10
+    assert task_runner.worker.poll_timeout == 500
+
+
+def test_run_once_with_thread_pool(mocker):
+    tasks = [
+        Task(task_id=f"VALID_TASK_ID_{i}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+        for i in range(3)
+    ]
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll", return_value=tasks)
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    worker = get_valid_worker()
+    worker.thread_count = 4
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    task_runner.run_once()
+    task_runner.executor.shutdown(wait=True)
+    assert mock_batch_poll.call_args.kwargs["count"] == 4
+    assert sorted(c.kwargs["body"].task_id for c in mock_update_task.call_args_list) == [
+        "VALID_TASK_ID_0",
+        "VALID_TASK_ID_1",
+        "VALID_TASK_ID_2",
+    ]
+
+
+def test_run_once_with_thread_pool_polls_free_slots_only(mocker):
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll", return_value=[])
+    mock_poll = mocker.patch.object(TaskResourceApi, "poll", return_value=None)
+    worker = get_valid_worker()
+    worker.thread_count = 3
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    busy = Future()
+    task_runner._running_tasks = {busy, Future()}
+    mocker.patch.object(task_runner, "_TaskRunner__wait_for_polling_interval")
+    task_runner.run_once()
+    mock_batch_poll.assert_not_called()
+    mock_poll.assert_called_once()
+
+
+def test_run_once_with_thread_pool_when_saturated(mocker):
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll")
+    mock_poll = mocker.patch.object(TaskResourceApi, "poll")
+    worker = get_valid_worker(poll_interval=1)
+    worker.thread_count = 2
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    task_runner._running_tasks = {Future(), Future()}
+    task_runner.run_once()
+    mock_batch_poll.assert_not_called()
+    mock_poll.assert_not_called()
+
+
+def test_initialization_with_thread_count_in_env_var(monkeypatch):
+    monkeypatch.setenv("CONDUCTOR_WORKER_task_THREAD_COUNT", "8")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.thread_count == 8
+
+
+def test_run_once_with_adaptive_polling(mocker):
+    mocker.patch.object(TaskResourceApi, "poll", side_effect=[get_valid_task(), None, None])
+    mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    mock_sleep = mocker.patch("time.sleep")
+    worker = get_valid_worker(poll_interval=100)
+    worker.adaptive_polling = True
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    for _ in range(3):
+        task_runner.run_once()
+    assert [c.args[0] for c in mock_sleep.call_args_list] == pytest.approx([0.1, 0.2])
+    assert task_runner._adaptive_polling_interval.current_interval == pytest.approx(0.2)
+
+
+def test_initialization_with_adaptive_polling_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_adaptive_polling", "true")
+    monkeypatch.setenv("conductor_worker_task_max_poll_interval", "2000")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.adaptive_polling is True
+    assert task_runner._adaptive_polling_interval.max_interval == 2.0
+
+
 def test_poll_task(mocker):
     expected_task = get_valid_task()
     mocker.patch.object(TaskResourceApi, "poll", return_value=get_valid_task())
@@ -254,6 +527,98 @@ def test_execute_task():
     assert task_result == expected_task_result
 
 
+def test_execute_task_downloads_external_input(tmp_path):
+    storage = LocalExternalPayloadStorage(str(tmp_path))
+    location = storage.get_location(ExternalPayloadOperation.WRITE, ExternalPayloadType.TASK_INPUT)
+    storage.upload(location.uri, b'{"key": "value"}')
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        external_payload_settings=ExternalPayloadSettings(storage=storage),
+    )
+    task = get_valid_task()
+    task.external_input_payload_storage_path = location.path
+    task_runner._TaskRunner__execute_task(task)
+    assert task.input_data == {"key": "value"}
+
+
+def test_execute_task_downloads_external_input_from_server_location(mocker):
+    get_location = mocker.patch.object(TaskResourceApi, "get_external_storage_location1")
+    get_location.return_value = ExternalStorageLocation(uri="https://storage/input.json", path="input.json")
+    download = mocker.patch("requests.Session.get")
+    download.return_value.content = b'{"key": "value"}'
+    task_runner = get_valid_task_runner()
+    task = get_valid_task()
+    task.external_input_payload_storage_path = "input.json"
+    task_runner._TaskRunner__execute_task(task)
+    get_location.assert_called_once_with("input.json", "READ", "TASK_INPUT")
+    download.assert_called_once_with("https://storage/input.json")
+    assert task.input_data == {"key": "value"}
+
+
+def test_execute_task_uploads_large_output(tmp_path):
+    storage = LocalExternalPayloadStorage(str(tmp_path))
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        external_payload_settings=ExternalPayloadSettings(storage=storage, output_threshold=10),
+    )
+    task_result = task_runner._TaskRunner__execute_task(get_valid_task())
+    assert task_result.output_data is None
+    assert task_result.external_output_payload_storage_path.startswith("task_output/")
+    location = storage.get_location(
+        ExternalPayloadOperation.READ, ExternalPayloadType.TASK_OUTPUT, task_result.external_output_payload_storage_path
+    )
+    output = json.loads(storage.download(location.uri))
+    assert output["worker_style"] == "class"
+    assert output["secret_number"] == 1234
+
+
+def test_execute_task_keeps_output_inline_when_upload_fails(mocker, tmp_path):
+    storage = LocalExternalPayloadStorage(str(tmp_path))
+    mocker.patch.object(storage, "upload", side_effect=OSError("storage unavailable"))
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        external_payload_settings=ExternalPayloadSettings(storage=storage, output_threshold=10),
+    )
+    task_result = task_runner._TaskRunner__execute_task(get_valid_task())
+    assert task_result == get_valid_task_result()
+    assert task_result.external_output_payload_storage_path is None
+
+
+def test_execute_task_batch_uploads_output_of_each_task_independently(mocker, tmp_path):
+    storage = LocalExternalPayloadStorage(str(tmp_path))
+    upload = mocker.patch.object(storage, "upload", side_effect=[OSError("storage unavailable"), None])
+
+    def execute(value: List[int]) -> list:
+        return [{"value": "x" * 20} for _ in value]
+
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_batch_worker(execute),
+        external_payload_settings=ExternalPayloadSettings(storage=storage, output_threshold=10),
+    )
+    tasks = get_tasks_with_values(1, 2)
+    task_results = task_runner._TaskRunner__execute_task_batch(tasks, "task")
+    assert upload.call_count == 2
+    assert [task_result.status for task_result in task_results] == [TaskResultStatus.COMPLETED] * 2
+    assert task_results[0].output_data == {"value": "x" * 20}
+    assert task_results[1].output_data is None
+    assert task_results[1].external_output_payload_storage_path is not None
+
+
+def test_execute_task_keeps_small_output_inline(tmp_path):
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        external_payload_settings=ExternalPayloadSettings(storage=LocalExternalPayloadStorage(str(tmp_path))),
+    )
+    task_result = task_runner._TaskRunner__execute_task(get_valid_task())
+    assert task_result == get_valid_task_result()
+    assert task_result.external_output_payload_storage_path is None
+
+
 def test_update_task_with_invalid_task_result():
     expected_response = None
     task_runner = get_valid_task_runner()
@@ -270,6 +635,21 @@ def test_update_task_with_faulty_task_api(mocker):
     assert response is None
 
 
+def test_update_task_retries_with_jittered_backoff(mocker):
+    mock_sleep = mocker.patch("time.sleep")
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", side_effect=[Exception(), Exception(), Exception(), "VALID_UPDATE_TASK_RESPONSE"]
+    )
+    task_runner = get_valid_task_runner()
+    response = task_runner._TaskRunner__update_task(get_valid_task_result())
+    assert response == "VALID_UPDATE_TASK_RESPONSE"
+    assert mock_update_task.call_count == 4
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert len(delays) == 3
+    for delay, (low, high) in zip(delays, [(0.5, 1.0), (1.0, 2.0), (2.0, 4.0)]):
+        assert low <= delay <= high
+
+
 def test_update_task(mocker):
     mocker.patch.object(
         TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
@@ -298,3 +678,216 @@ def test_wait_for_polling_interval():
     finish_time = time.time()
     spent_time = finish_time - start_time
     assert spent_time > expected_time
+
+
+def test_run_once_with_task_updater(mocker):
+    mocker.patch.object(TaskResourceApi, "poll", return_value=get_valid_task())
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=get_valid_worker(),
+        task_update_settings=TaskUpdateSettings(),
+    )
+    mocker.patch.object(task_runner, "_TaskRunner__wait_for_polling_interval")
+    mock_submit = mocker.spy(task_runner.task_updater, "submit")
+    task_runner.run_once()
+    mock_submit.assert_called_once()
+    assert mock_submit.call_args.args[1] == "task"
+    assert task_runner.task_updater.stop(timeout=5)
+    mock_update_task.assert_called_once()
+    assert mock_update_task.call_args.kwargs["body"].task_id == "VALID_TASK_ID"
+
+
+def test_task_updater_is_disabled_by_default():
+    task_runner = get_valid_task_runner()
+    assert task_runner.task_updater is None
+
+
+def test_run_once_polls_all_task_types(mocker):
+    def batch_poll(tasktype, count, **kwargs):
+        return [
+            Task(task_id=f"{tasktype}_ID_{i}", workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID")
+            for i in range(count)
+        ]
+
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll", side_effect=batch_poll)
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    worker = ClassWorker(["task1", "task2", "task3"])
+    worker.poll_all_task_types = True
+    worker.thread_count = 2
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    mock_wait = mocker.patch.object(task_runner, "_TaskRunner__wait_for_polling_interval")
+    task_runner.run_once()
+    assert sorted(c.kwargs["tasktype"] for c in mock_batch_poll.call_args_list) == ["task1", "task2", "task3"]
+    assert all(c.kwargs["count"] == 2 for c in mock_batch_poll.call_args_list)
+    mock_wait.assert_not_called()
+    task_runner.executor.shutdown(wait=True)
+    updated = sorted(c.kwargs["body"].task_id for c in mock_update_task.call_args_list)
+    assert updated == [f"task{t}_ID_{i}" for t in range(1, 4) for i in range(2)]
+
+
+def test_run_once_polls_all_task_types_skips_saturated_types(mocker):
+    mock_poll = mocker.patch.object(TaskResourceApi, "poll", return_value=None)
+    worker = ClassWorker(["task1", "task2"])
+    worker.poll_all_task_types = True
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    mocker.patch.object(task_runner, "_TaskRunner__wait_for_polling_interval")
+    task_runner._running_tasks_by_name["task1"] = {Future()}
+    task_runner.run_once()
+    assert [c.kwargs["tasktype"] for c in mock_poll.call_args_list] == ["task2"]
+
+
+def test_run_once_lazy_task_receives_task_view(mocker):
+    tasks = [
+        {
+            "taskId": f"VALID_TASK_ID_{i}",
+            "workflowInstanceId": "VALID_WORKFLOW_INSTANCE_ID",
+            "inputData": {"value": i},
+            "workflowTask": {"name": "task", "taskReferenceName": "task_ref"},
+        }
+        for i in range(2)
+    ]
+    mock_batch_poll = mocker.patch.object(TaskResourceApi, "batch_poll", return_value=tasks)
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    worker = get_valid_worker()
+    worker.batch_size = 2
+    worker.lazy_task = True
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    task_runner.run_once()
+    assert mock_batch_poll.call_args.kwargs["_raw_response"] is True
+    results = [c.kwargs["body"] for c in mock_update_task.call_args_list]
+    assert [r.task_id for r in results] == ["VALID_TASK_ID_0", "VALID_TASK_ID_1"]
+    assert [r.workflow_instance_id for r in results] == ["VALID_WORKFLOW_INSTANCE_ID"] * 2
+
+
+def test_task_view_reads_fields_from_json():
+    api_client = TaskResourceApi().api_client
+    task = TaskView(
+        {
+            "taskId": "VALID_TASK_ID",
+            "inputData": {"value": 1},
+            "workflowTask": {"name": "task", "taskReferenceName": "task_ref"},
+        },
+        api_client,
+    )
+    assert isinstance(task, Task)
+    assert task.task_id == "VALID_TASK_ID"
+    assert task.input_data == {"value": 1}
+    assert task.status is None
+    assert "workflow_task" not in task._values
+    assert task.workflow_task.task_reference_name == "task_ref"
+    assert task.workflow_task is task.workflow_task
+    task.output_data = {"result": 1}
+    assert task.output_data == {"result": 1}
+    assert task.to_task_result().task_id == "VALID_TASK_ID"
+    assert task == Task(
+        task_id="VALID_TASK_ID",
+        input_data={"value": 1},
+        output_data={"result": 1},
+        workflow_task=task.workflow_task,
+    )
+
+
+def test_task_view_asdict_and_repr_match_task():
+    api_client = TaskResourceApi().api_client
+    data = {
+        "taskId": "VALID_TASK_ID",
+        "status": "IN_PROGRESS",
+        "inputData": {"value": 1},
+        "workflowTask": {"name": "task", "taskReferenceName": "task_ref"},
+    }
+    task = TaskView(data, api_client)
+    expected = api_client.deserialize_class(data, "Task")
+    assert dataclasses.asdict(task)["_task_id"] == "VALID_TASK_ID"
+    assert dataclasses.asdict(task)["_workflow_task"]["_task_reference_name"] == "task_ref"
+    assert dataclasses.asdict(task) == dataclasses.asdict(expected)
+    assert repr(task) == repr(expected)
+    assert "'task_id': 'VALID_TASK_ID'" in repr(task)
+
+
+def test_task_view_setters_validate_like_task():
+    task = TaskView({"taskId": "VALID_TASK_ID"}, TaskResourceApi().api_client)
+    with pytest.raises(ValueError):
+        task.status = "UNKNOWN"
+    task.status = "COMPLETED"
+    assert dataclasses.asdict(task)["_status"] == "COMPLETED"
+
+
+def test_poll_lazy_task_with_empty_queue(mocker):
+    mocker.patch.object(TaskResourceApi, "poll", return_value="")
+    worker = get_valid_worker()
+    worker.lazy_task = True
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    assert task_runner._TaskRunner__poll_task() is None
+
+
+def test_initialization_rejects_lazy_task_with_process_executor_from_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_executor_type", "process")
+    worker = get_valid_worker()
+    worker.lazy_task = True
+    with pytest.raises(Exception, match="lazy_task cannot be used with the process executor"):
+        TaskRunner(configuration=Configuration(), worker=worker)
+
+
+def test_initialization_with_executor_type_in_env_var(monkeypatch):
+    monkeypatch.setenv("conductor_worker_task_executor_type", "PROCESS")
+    task_runner = get_valid_task_runner()
+    assert task_runner.worker.executor_type == "process"
+
+
+def test_run_after_stop_drains_tasks_in_flight(mocker):
+    mocker.patch.object(TaskResourceApi, "batch_poll", return_value=[get_valid_task()])
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+
+    def execute() -> str:
+        time.sleep(0.2)
+        return "done"
+
+    worker = Worker("task", execute, thread_count=2)
+    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+    task_runner.run_once()
+    task_runner.stop()
+    task_runner.run()
+    mock_update_task.assert_called_once()
+    task_result = mock_update_task.call_args.kwargs["body"]
+    assert task_result.status == TaskResultStatus.COMPLETED
+    assert task_result.output_data == {"result": "done"}
+
+
+def test_run_after_stop_releases_tasks_running_at_deadline(mocker):
+    mocker.patch("conductor.client.automator.task_runner.on_shutdown_signal")
+    mocker.patch.object(TaskResourceApi, "batch_poll", return_value=[get_valid_task()])
+    mock_update_task = mocker.patch.object(
+        TaskResourceApi, "update_task", return_value="VALID_UPDATE_TASK_RESPONSE"
+    )
+    finish = threading.Event()
+
+    def execute() -> str:
+        finish.wait(5)
+        return "done"
+
+    worker = Worker("task", execute, thread_count=2)
+    task_runner = TaskRunner(
+        configuration=Configuration(),
+        worker=worker,
+        shutdown_settings=ShutdownSettings(drain_timeout=0.1),
+    )
+    task_runner.run_once()
+    task_runner.stop()
+    task_runner.run()
+    finish.set()
+    task_runner.executor.shutdown(wait=True)
+    # the result of a released task is dropped, the task now belongs to the server again
+    mock_update_task.assert_called_once()
+    task_result = mock_update_task.call_args.kwargs["body"]
+    assert task_result.task_id == "VALID_TASK_ID"
+    assert task_result.status == "IN_PROGRESS"
+    assert task_result.callback_after_seconds == 0
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from conductor.client.automator.task_updater import TaskUpdater
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_result_status import TaskResultStatus
+from conductor.shared.configuration.settings.task_update_settings import TaskUpdateSettings
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def get_task_result(task_id):
+    return TaskResult(
+        task_id=task_id,
+        workflow_instance_id="VALID_WORKFLOW_INSTANCE_ID",
+        worker_id="worker",
+        status=TaskResultStatus.COMPLETED,
+    )
+
+
+def get_fast_settings(**kwargs):
+    settings = dict(initial_backoff=0.01, max_backoff=0.05, jitter=0.0, flush_timeout=5)
+    settings.update(kwargs)
+    return TaskUpdateSettings(**settings)
+
+
+def test_backoff_grows_exponentially_up_to_max():
+    settings = TaskUpdateSettings(initial_backoff=1, max_backoff=5, backoff_multiplier=2, jitter=0)
+    assert [settings.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_backoff_jitter_stays_within_bounds():
+    settings = TaskUpdateSettings(initial_backoff=4, jitter=0.5)
+    for _ in range(100):
+        assert 2 <= settings.backoff(1) <= 4
+
+
+def test_submit_delivers_results(mocker):
+    task_client = mocker.Mock()
+    updater = TaskUpdater(task_client, get_fast_settings())
+    for i in range(5):
+        updater.submit(get_task_result(f"task_{i}"), "task")
+    assert updater.flush(timeout=5)
+    assert updater.pending() == 0
+    assert [c.kwargs["body"].task_id for c in task_client.update_task.call_args_list] == [
+        f"task_{i}" for i in range(5)
+    ]
+    assert updater.stop()
+
+
+def test_failed_update_is_retried_without_blocking_others(mocker):
+    task_client = mocker.Mock()
+    delivered = []
+    failed_once = threading.Event()
+
+    def update_task(body):
+        if body.task_id == "flaky" and not failed_once.is_set():
+            failed_once.set()
+            raise Exception("server unavailable")
+        delivered.append(body.task_id)
+
+    task_client.update_task.side_effect = update_task
+    metrics_collector = mocker.Mock()
+    updater = TaskUpdater(task_client, get_fast_settings(initial_backoff=0.2), metrics_collector)
+    updater.submit(get_task_result("flaky"), "task")
+    updater.submit(get_task_result("healthy"), "task")
+    assert updater.flush(timeout=5)
+    assert delivered == ["healthy", "flaky"]
+    metrics_collector.increment_task_update_error.assert_called_once()
+    task_type, exception = metrics_collector.increment_task_update_error.call_args.args
+    assert task_type == "task"
+    assert str(exception) == "server unavailable"
+    assert metrics_collector.record_task_update_time.call_count == 2
+    updater.stop()
+
+
+def test_update_gives_up_after_max_attempts(mocker):
+    task_client = mocker.Mock()
+    task_client.update_task.side_effect = Exception("server unavailable")
+    updater = TaskUpdater(task_client, get_fast_settings(max_attempts=3))
+    updater.submit(get_task_result("task_0"), "task")
+    assert updater.flush(timeout=5)
+    assert task_client.update_task.call_count == 3
+    assert updater.pending() == 0
+    updater.stop()
+
+
+def test_stop_reports_undelivered_results(mocker):
+    task_client = mocker.Mock()
+    task_client.update_task.side_effect = Exception("server unavailable")
+    updater = TaskUpdater(task_client, get_fast_settings(initial_backoff=10, max_backoff=10))
+    updater.submit(get_task_result("task_0"), "task")
+    assert not updater.stop(timeout=0.2)
+    assert updater.pending() == 1
+
+
+def test_concurrent_submits_start_a_single_thread(mocker):
+    task_client = mocker.Mock()
+    updater = TaskUpdater(task_client, get_fast_settings())
+    barrier = threading.Barrier(8)
+
+    def submit(i):
+        barrier.wait()
+        updater.submit(get_task_result(f"task_{i}"), "task")
+
+    submitters = [threading.Thread(target=submit, args=(i,)) for i in range(8)]
+    updater_threads = []
+    create_thread = threading.Thread
+
+    def create_updater_thread(*args, **kwargs):
+        # widens the window between the liveness check and the start
+        time.sleep(0.01)
+        thread = create_thread(*args, **kwargs)
+        updater_threads.append(thread)
+        return thread
+
+    mocker.patch.object(threading, "Thread", side_effect=create_updater_thread)
+    for submitter in submitters:
+        submitter.start()
+    for submitter in submitters:
+        submitter.join()
+    assert updater.stop(timeout=5)
+    assert len(updater_threads) == 1
+    assert task_client.update_task.call_count == 8
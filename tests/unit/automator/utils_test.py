@@ -1,3 +1,4 @@
+import inspect
 import logging
 from dataclasses import dataclass
 from typing import List
@@ -5,7 +6,7 @@ from typing import List
 import pytest
 from requests.structures import CaseInsensitiveDict
 
-from conductor.shared.automator.utils import convert_from_dict
+from conductor.shared.automator.utils import bind_parameters, convert_from_dict, get_parameter_plan
 from tests.unit.resources.workers import UserInfo
 
 
@@ -83,3 +84,25 @@ def test_convert_dataclass():
     }
     value = convert_from_dict(UserDetails, dictionary)
     assert type(value) is UserDetails, f"expected UserInfo, found {type(value)}"
+
+
+def test_convert_non_dataclass_reuses_member_plan(mocker):
+    dictionary = {"a": 1, "b": [{"ba": 2}], "d": [], "g": {}}
+    convert_from_dict(Test, dictionary)
+    signature = mocker.spy(inspect, "signature")
+    value = convert_from_dict(Test, dictionary)
+    assert value.b[0].ba == 2
+    signature.assert_not_called()
+
+
+def test_bind_parameters_from_plan():
+    def execute(user: UserInfo, count: int, label: str = "default", extra=None):
+        pass
+
+    plan = get_parameter_plan(execute)
+    kwargs = bind_parameters(plan, {"user": {"name": "conductor", "id": 1}, "count": 3})
+    assert type(kwargs["user"]) is UserInfo
+    assert kwargs["user"].name == "conductor"
+    assert kwargs["count"] == 3
+    assert kwargs["label"] == "default"
+    assert kwargs["extra"] is None
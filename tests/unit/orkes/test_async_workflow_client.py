@@ -308,3 +308,24 @@ async def test_test_workflow(mocker, workflow_client):
     wf = await workflow_client.test_workflow(test_request)
     mock.assert_called_with(workflow_test_request=test_request)
     assert wf == expected_wf
+
+
+@pytest.mark.asyncio
+async def test_bulk_start_workflows(mocker, workflow_client):
+    async def start_workflow(request):
+        if request.name == "fail":
+            raise ApiException(status=500)
+        return f"{request.name}_id"
+
+    mocker.patch.object(WorkflowResourceApiAdapter, "start_workflow", side_effect=start_workflow)
+
+    async def requests():
+        for name in ["wf0", "fail", "wf2"]:
+            yield StartWorkflowRequestAdapter(name=name)
+
+    results = [
+        result async for result in workflow_client.bulk_start_workflows(requests(), concurrency=2)
+    ]
+    results.sort(key=lambda r: r.index)
+    assert [r.workflow_id for r in results] == ["wf0_id", None, "wf2_id"]
+    assert isinstance(results[1].error, ApiException)
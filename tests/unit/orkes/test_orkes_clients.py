@@ -0,0 +1,24 @@
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.client.orkes_clients import OrkesClients
+
+
+def test_clients_share_one_api_client(mocker):
+    api_client_init = mocker.spy(ApiClient, "__init__")
+    orkes_clients = OrkesClients(Configuration())
+    workflow_client = orkes_clients.get_workflow_client()
+    task_client = orkes_clients.get_task_client()
+    metadata_client = orkes_clients.get_metadata_client()
+    workflow_executor = orkes_clients.get_workflow_executor()
+    assert workflow_client.api_client is orkes_clients.api_client
+    assert task_client.api_client is orkes_clients.api_client
+    assert metadata_client.api_client is orkes_clients.api_client
+    assert workflow_executor.workflow_client.api_client is orkes_clients.api_client
+    assert workflow_executor.task_client.api_client is orkes_clients.api_client
+    assert api_client_init.call_count == 1
+
+
+def test_api_client_is_created_on_first_use(mocker):
+    api_client_init = mocker.spy(ApiClient, "__init__")
+    OrkesClients(Configuration())
+    api_client_init.assert_not_called()
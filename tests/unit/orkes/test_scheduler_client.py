@@ -10,6 +10,7 @@ from conductor.client.http.models.search_result_workflow_schedule_execution_mode
     SearchResultWorkflowScheduleExecutionModel,
 )
 from conductor.client.http.models.workflow_schedule import WorkflowSchedule
+from conductor.client.http.models.workflow_schedule_execution_model import WorkflowScheduleExecutionModel
 from conductor.client.http.rest import ApiException
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.orkes_scheduler_client import OrkesSchedulerClient
@@ -179,6 +180,19 @@ def test_search_schedule_executions(mocker, scheduler_client):
     assert search_result == srw
 
 
+def test_iter_schedule_executions(mocker, scheduler_client):
+    mock = mocker.patch.object(SchedulerResourceApi, "search_v21")
+    executions = [WorkflowScheduleExecutionModel(execution_id=str(i)) for i in range(3)]
+    mock.side_effect = [
+        SearchResultWorkflowScheduleExecutionModel(total_hits=3, results=executions[:2]),
+        SearchResultWorkflowScheduleExecutionModel(total_hits=3, results=executions[2:]),
+    ]
+    query = "scheduleName=" + SCHEDULE_NAME
+    assert list(scheduler_client.iter_schedule_executions(query=query, page_size=2)) == executions
+    mock.assert_any_call(start=0, size=2, query=query)
+    mock.assert_called_with(start=2, size=2, query=query)
+
+
 def test_set_scheduler_tags(mocker, scheduler_client):
     mock = mocker.patch.object(SchedulerResourceApi, "put_tag_for_schedule")
     tag1 = MetadataTag("tag1", "val1")
@@ -5,9 +5,12 @@ import pytest
 
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.search_result_task import SearchResultTask
+from conductor.client.http.models.search_result_task_summary import SearchResultTaskSummary
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_summary import TaskSummary
 from conductor.shared.http.enums import TaskResultStatus
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.rest import ApiException
@@ -213,3 +216,47 @@ def test_get_task_logs(mocker, task_client):
     logs = task_client.get_task_logs(TASK_ID)
     mock.assert_called_with(TASK_ID)
     assert len(logs) == expected_log_len
+
+
+def test_iter_search_task_summaries(mocker, task_client):
+    mock = mocker.patch.object(TaskResourceApi, "search1")
+    mock.side_effect = [
+        SearchResultTaskSummary(total_hits=3, results=[TaskSummary(task_id=TASK_ID), TaskSummary(task_id="task_id_2")]),
+        SearchResultTaskSummary(total_hits=3, results=[TaskSummary(task_id="task_id_3")]),
+    ]
+    task_ids = [
+        summary.task_id for summary in task_client.iter_search_task_summaries(query="status=FAILED", page_size=2)
+    ]
+    assert task_ids == [TASK_ID, "task_id_2", "task_id_3"]
+    mock.assert_any_call(start=0, size=2, free_text="*", query="status=FAILED")
+    mock.assert_called_with(start=2, size=2, free_text="*", query="status=FAILED")
+
+
+def test_iter_search_task_summaries_continues_after_pages_capped_by_server(mocker, task_client):
+    mock = mocker.patch.object(TaskResourceApi, "search1")
+    mock.side_effect = [
+        SearchResultTaskSummary(total_hits=5, results=[TaskSummary(task_id="task_id_1"), TaskSummary(task_id="task_id_2")]),
+        SearchResultTaskSummary(total_hits=5, results=[TaskSummary(task_id="task_id_3"), TaskSummary(task_id="task_id_4")]),
+        SearchResultTaskSummary(total_hits=5, results=[TaskSummary(task_id="task_id_5")]),
+    ]
+    task_ids = [summary.task_id for summary in task_client.iter_search_task_summaries(page_size=10, prefetch=False)]
+    assert task_ids == ["task_id_1", "task_id_2", "task_id_3", "task_id_4", "task_id_5"]
+    assert [c.kwargs["start"] for c in mock.call_args_list] == [0, 2, 4]
+
+
+def test_iter_search_task_summaries_stops_on_empty_page_before_total_hits(mocker, task_client):
+    mock = mocker.patch.object(TaskResourceApi, "search1")
+    mock.side_effect = [
+        SearchResultTaskSummary(total_hits=5, results=[TaskSummary(task_id="task_id_1")]),
+        SearchResultTaskSummary(total_hits=5, results=[]),
+    ]
+    task_ids = [summary.task_id for summary in task_client.iter_search_task_summaries(page_size=10, prefetch=False)]
+    assert task_ids == ["task_id_1"]
+    assert mock.call_count == 2
+
+
+def test_iter_search_tasks_stops_at_total_hits(mocker, task_client, tasks):
+    mock = mocker.patch.object(TaskResourceApi, "search_v21")
+    mock.return_value = SearchResultTask(total_hits=3, results=tasks)
+    assert list(task_client.iter_search_tasks(sort="updateTime:DESC", page_size=3)) == tasks
+    mock.assert_called_once_with(start=0, size=3, free_text="*", sort="updateTime:DESC")
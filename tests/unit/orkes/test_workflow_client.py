@@ -1,5 +1,7 @@
 import json
 import logging
+import threading
+import time
 
 import pytest
 
@@ -7,10 +9,14 @@ from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api.workflow_resource_api import WorkflowResourceApi
 from conductor.client.http.models import SkipTaskRequest
 from conductor.client.http.models.rerun_workflow_request import RerunWorkflowRequest
+from conductor.client.http.models.scrollable_search_result_workflow_summary import (
+    ScrollableSearchResultWorkflowSummary,
+)
 from conductor.client.http.models.start_workflow_request import StartWorkflowRequest
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.models.workflow_def import WorkflowDef
 from conductor.client.http.models.workflow_run import WorkflowRun
+from conductor.client.http.models.workflow_summary import WorkflowSummary
 from conductor.client.http.models.workflow_test_request import WorkflowTestRequest
 from conductor.client.http.rest import ApiException
 from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
@@ -97,6 +103,61 @@ def test_start_workflow(mocker, workflow_client):
     assert wf_id == WORKFLOW_UUID
 
 
+def test_bulk_start_workflows(mocker, workflow_client):
+    def start_workflow(request):
+        if request.name == "fail":
+            raise ApiException(status=500)
+        return f"{request.name}_id"
+
+    mocker.patch.object(WorkflowResourceApi, "start_workflow", side_effect=start_workflow)
+    requests = (StartWorkflowRequest(name=name) for name in ["wf0", "fail", "wf2", "wf3"])
+    results = sorted(
+        workflow_client.bulk_start_workflows(requests, concurrency=2), key=lambda r: r.index
+    )
+    assert [r.workflow_id for r in results] == ["wf0_id", None, "wf2_id", "wf3_id"]
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert isinstance(results[1].error, ApiException)
+    assert results[1].request.name == "fail"
+
+
+def test_bulk_start_workflows_bounds_requests_in_flight(mocker, workflow_client):
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def start_workflow(request):
+        with lock:
+            in_flight.append(request)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(request)
+        return WORKFLOW_UUID
+
+    mocker.patch.object(WorkflowResourceApi, "start_workflow", side_effect=start_workflow)
+    consumed = []
+
+    def requests():
+        for i in range(20):
+            consumed.append(i)
+            yield StartWorkflowRequest(name=WORKFLOW_NAME)
+
+    results = workflow_client.bulk_start_workflows(requests(), concurrency=4)
+    next(results)
+    assert len(consumed) <= 5
+    assert len(list(results)) == 19
+    assert max(max_in_flight) <= 4
+
+
+def test_bulk_start_workflows_rate_limit(mocker, workflow_client):
+    mocker.patch.object(WorkflowResourceApi, "start_workflow", return_value=WORKFLOW_UUID)
+    start_time = time.monotonic()
+    requests = [StartWorkflowRequest(name=WORKFLOW_NAME) for _ in range(5)]
+    results = list(workflow_client.bulk_start_workflows(requests, concurrency=5, rate_limit=50))
+    assert len(results) == 5
+    assert time.monotonic() - start_time >= 0.08
+
+
 def test_execute_workflow(mocker, workflow_client):
     mock = mocker.patch.object(WorkflowResourceApi, "execute_workflow")
     expected_wf_run = WorkflowRun()
@@ -229,3 +290,48 @@ def test_test_workflow(mocker, workflow_client):
     workflow = workflow_client.test_workflow(test_request)
     mock.assert_called_with(test_request)
     assert workflow.workflow_id == WORKFLOW_UUID
+
+
+def test_iter_search(mocker, workflow_client):
+    mock = mocker.patch.object(WorkflowResourceApi, "search")
+    mock.side_effect = [
+        ScrollableSearchResultWorkflowSummary(
+            results=[WorkflowSummary(workflow_id="wf_1"), WorkflowSummary(workflow_id="wf_2")], query_id="q1"
+        ),
+        ScrollableSearchResultWorkflowSummary(results=[WorkflowSummary(workflow_id="wf_3")], query_id="q1"),
+    ]
+    workflow_ids = [
+        summary.workflow_id for summary in workflow_client.iter_search(query="status=RUNNING", page_size=2)
+    ]
+    assert workflow_ids == ["wf_1", "wf_2", "wf_3"]
+    assert mock.call_count == 2
+    mock.assert_any_call(start=0, size=2, free_text="*", query="status=RUNNING", query_id=None)
+    mock.assert_called_with(start=2, size=2, free_text="*", query="status=RUNNING", query_id="q1")
+
+
+def test_iter_search_stops_on_empty_page(mocker, workflow_client):
+    mock = mocker.patch.object(WorkflowResourceApi, "search")
+    mock.side_effect = [
+        ScrollableSearchResultWorkflowSummary(results=[WorkflowSummary(workflow_id="wf_1")]),
+        ScrollableSearchResultWorkflowSummary(results=[]),
+    ]
+    workflow_ids = [summary.workflow_id for summary in workflow_client.iter_search(page_size=1, prefetch=False)]
+    assert workflow_ids == ["wf_1"]
+    assert mock.call_count == 2
+
+
+def test_iter_search_prefetches_next_page(mocker, workflow_client):
+    next_page_requested = threading.Event()
+
+    def search(start, **kwargs):
+        if start > 0:
+            next_page_requested.set()
+            return ScrollableSearchResultWorkflowSummary(results=[])
+        return ScrollableSearchResultWorkflowSummary(results=[WorkflowSummary(workflow_id="wf_1")])
+
+    mocker.patch.object(WorkflowResourceApi, "search", side_effect=search)
+    iterator = workflow_client.iter_search(page_size=1)
+    assert next(iterator).workflow_id == "wf_1"
+    # requested while the first page is still being consumed
+    assert next_page_requested.wait(5)
+    assert list(iterator) == []
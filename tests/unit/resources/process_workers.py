@@ -0,0 +1,14 @@
+import os
+import signal
+
+from conductor.asyncio_client.worker.worker_task import worker_task
+
+
+@worker_task(task_definition_name="process_task", executor_type="process")
+def get_process_id(value: int) -> dict:
+    return {"pid": os.getpid(), "value": value * 2}
+
+
+@worker_task(task_definition_name="sigterm_task", executor_type="process")
+def has_default_sigterm_handler() -> dict:
+    return {"default": signal.getsignal(signal.SIGTERM) == signal.SIG_DFL}
@@ -0,0 +1,8 @@
+import os
+
+from conductor.client.worker.worker_task import worker_task
+
+
+@worker_task(task_definition_name="process_task", executor_type="process")
+def get_process_id(value: int) -> dict:
+    return {"pid": os.getpid(), "value": value * 2}
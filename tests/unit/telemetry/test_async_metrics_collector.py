@@ -4,7 +4,7 @@ import os
 from unittest.mock import MagicMock, patch
 
 import pytest
-from prometheus_client import Counter, Gauge
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
 
 from conductor.asyncio_client.telemetry.metrics_collector import AsyncMetricsCollector
 from conductor.shared.telemetry.configuration.metrics import MetricsSettings
@@ -142,7 +142,7 @@ async def test_increment_task_poll_error(metrics_collector, mock_counter):
         assert call_args[1]['name'] == MetricName.TASK_POLL_ERROR
         assert call_args[1]['documentation'] == MetricDocumentation.TASK_POLL_ERROR
         assert list(call_args[1]['labelnames']) == [MetricLabel.TASK_TYPE, MetricLabel.EXCEPTION]
-        mock_counter.labels.assert_called_once_with("test_task", "Test error")
+        mock_counter.labels.assert_called_once_with("test_task", "Exception")
 
 
 @pytest.mark.asyncio
@@ -167,7 +167,7 @@ async def test_increment_task_execution_error(metrics_collector, mock_counter):
         assert call_args[1]['name'] == MetricName.TASK_EXECUTE_ERROR
         assert call_args[1]['documentation'] == MetricDocumentation.TASK_EXECUTE_ERROR
         assert list(call_args[1]['labelnames']) == [MetricLabel.TASK_TYPE, MetricLabel.EXCEPTION]
-        mock_counter.labels.assert_called_once_with("test_task", "Execution error")
+        mock_counter.labels.assert_called_once_with("test_task", "Exception")
 
 
 @pytest.mark.asyncio
@@ -192,7 +192,7 @@ async def test_increment_task_ack_error(metrics_collector, mock_counter):
         assert call_args[1]['name'] == MetricName.TASK_ACK_ERROR
         assert call_args[1]['documentation'] == MetricDocumentation.TASK_ACK_ERROR
         assert list(call_args[1]['labelnames']) == [MetricLabel.TASK_TYPE, MetricLabel.EXCEPTION]
-        mock_counter.labels.assert_called_once_with("test_task", "ACK error")
+        mock_counter.labels.assert_called_once_with("test_task", "Exception")
 
 
 @pytest.mark.asyncio
@@ -205,7 +205,7 @@ async def test_increment_task_update_error(metrics_collector, mock_counter):
         assert call_args[1]['name'] == MetricName.TASK_UPDATE_ERROR
         assert call_args[1]['documentation'] == MetricDocumentation.TASK_UPDATE_ERROR
         assert list(call_args[1]['labelnames']) == [MetricLabel.TASK_TYPE, MetricLabel.EXCEPTION]
-        mock_counter.labels.assert_called_once_with("test_task", "Update error")
+        mock_counter.labels.assert_called_once_with("test_task", "Exception")
 
 
 @pytest.mark.asyncio
@@ -230,7 +230,7 @@ async def test_increment_workflow_start_error(metrics_collector, mock_counter):
         assert call_args[1]['name'] == MetricName.WORKFLOW_START_ERROR
         assert call_args[1]['documentation'] == MetricDocumentation.WORKFLOW_START_ERROR
         assert list(call_args[1]['labelnames']) == [MetricLabel.WORKFLOW_TYPE, MetricLabel.EXCEPTION]
-        mock_counter.labels.assert_called_once_with("workflow_type", "Workflow error")
+        mock_counter.labels.assert_called_once_with("workflow_type", "Exception")
 
 
 @pytest.mark.asyncio
@@ -272,6 +272,19 @@ async def test_record_task_poll_time(metrics_collector, mock_gauge):
         mock_gauge.labels.return_value.set.assert_called_once_with(1.5)
 
 
+@pytest.mark.asyncio
+async def test_record_task_poll_interval(metrics_collector, mock_gauge):
+    with patch.object(metrics_collector, '_AsyncMetricsCollector__get_gauge', return_value=mock_gauge):
+        await metrics_collector.record_task_poll_interval("test_task", 0.4)
+
+        call_args = metrics_collector._AsyncMetricsCollector__get_gauge.call_args
+        assert call_args[1]['name'] == MetricName.TASK_POLL_INTERVAL
+        assert call_args[1]['documentation'] == MetricDocumentation.TASK_POLL_INTERVAL
+        assert list(call_args[1]['labelnames']) == [MetricLabel.TASK_TYPE]
+        mock_gauge.labels.assert_called_once_with("test_task")
+        mock_gauge.labels.return_value.set.assert_called_once_with(0.4)
+
+
 @pytest.mark.asyncio
 async def test_record_task_execute_time(metrics_collector, mock_gauge):
     with patch.object(metrics_collector, '_AsyncMetricsCollector__get_gauge', return_value=mock_gauge):
@@ -353,7 +366,7 @@ async def test_increment_counter_with_complex_exception(metrics_collector, mock_
     with patch.object(metrics_collector, '_AsyncMetricsCollector__get_counter', return_value=mock_counter):
         await metrics_collector.increment_task_poll_error("test_task", exception)
         
-        mock_counter.labels.assert_called_once_with("test_task", "Complex error with special chars: !@#$%^&*()")
+        mock_counter.labels.assert_called_once_with("test_task", "ValueError")
 
 
 @pytest.mark.asyncio
@@ -385,4 +398,82 @@ async def test_record_gauge_with_large_payload_size(metrics_collector, mock_gaug
     with patch.object(metrics_collector, '_AsyncMetricsCollector__get_gauge', return_value=mock_gauge):
         await metrics_collector.record_task_result_payload_size("test_task", 999999999)
         
-        mock_gauge.labels.return_value.set.assert_called_once_with(999999999) 
\ No newline at end of file
+        mock_gauge.labels.return_value.set.assert_called_once_with(999999999) 
+
+@pytest.fixture
+def mock_histogram():
+    histogram = MagicMock(spec=Histogram)
+    histogram.labels.return_value.observe = MagicMock()
+    return histogram
+
+
+@pytest.mark.asyncio
+async def test_record_task_execute_time_observes_histogram(metrics_collector, mock_gauge, mock_histogram):
+    with patch.object(metrics_collector, '_AsyncMetricsCollector__get_gauge', return_value=mock_gauge), \
+         patch.object(metrics_collector, '_AsyncMetricsCollector__get_histogram', return_value=mock_histogram):
+        await metrics_collector.record_task_execute_time("test_task", 2.3)
+
+        call_args = metrics_collector._AsyncMetricsCollector__get_histogram.call_args
+        assert call_args[1]['name'] == MetricName.TASK_EXECUTE_LATENCY
+        assert call_args[1]['documentation'] == MetricDocumentation.TASK_EXECUTE_LATENCY
+        assert list(call_args[1]['labelnames']) == [MetricLabel.TASK_TYPE]
+        mock_histogram.labels.assert_called_once_with("test_task")
+        mock_histogram.labels.return_value.observe.assert_called_once_with(2.3)
+
+
+@pytest.mark.asyncio
+async def test_record_task_update_time(metrics_collector, mock_gauge, mock_histogram):
+    with patch.object(metrics_collector, '_AsyncMetricsCollector__get_gauge', return_value=mock_gauge), \
+         patch.object(metrics_collector, '_AsyncMetricsCollector__get_histogram', return_value=mock_histogram):
+        await metrics_collector.record_task_update_time("test_task", 0.2)
+
+        assert metrics_collector._AsyncMetricsCollector__get_gauge.call_args[1]['name'] == MetricName.TASK_UPDATE_TIME
+        assert metrics_collector._AsyncMetricsCollector__get_histogram.call_args[1]['name'] == MetricName.TASK_UPDATE_LATENCY
+        mock_gauge.labels.return_value.set.assert_called_once_with(0.2)
+        mock_histogram.labels.return_value.observe.assert_called_once_with(0.2)
+
+
+@pytest.mark.asyncio
+async def test_record_task_end_to_end_time(metrics_collector, mock_histogram):
+    with patch.object(metrics_collector, '_AsyncMetricsCollector__get_histogram', return_value=mock_histogram):
+        await metrics_collector.record_task_end_to_end_time("test_task", 4.5)
+
+        call_args = metrics_collector._AsyncMetricsCollector__get_histogram.call_args
+        assert call_args[1]['name'] == MetricName.TASK_END_TO_END_LATENCY
+        mock_histogram.labels.return_value.observe.assert_called_once_with(4.5)
+
+
+@pytest.mark.asyncio
+async def test_generate_histogram_uses_configured_buckets(tmp_path):
+    settings = MetricsSettings(directory=str(tmp_path), latency_buckets=[0.1, 1.0])
+    collector = AsyncMetricsCollector(settings)
+    collector.registry = CollectorRegistry()
+    histogram = await collector._AsyncMetricsCollector__generate_histogram(
+        MetricName.TASK_POLL_LATENCY, MetricDocumentation.TASK_POLL_LATENCY, [MetricLabel.TASK_TYPE]
+    )
+    histogram.labels("test_task").observe(0.5)
+    samples = {
+        sample.labels["le"]: sample.value
+        for metric in collector.registry.collect()
+        for sample in metric.samples
+        if sample.name.endswith("_bucket")
+    }
+    assert samples == {"0.1": 0.0, "1.0": 1.0, "+Inf": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_observe_histogram_disabled_metrics():
+    collector = AsyncMetricsCollector(None)
+    with patch.object(collector, '_AsyncMetricsCollector__get_histogram') as mock_get_histogram:
+        await collector.record_task_end_to_end_time("test_task", 1.0)
+        mock_get_histogram.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_provide_metrics_serves_http_when_port_is_set(tmp_path):
+    settings = MetricsSettings(directory=str(tmp_path), http_port=9991)
+    with patch('conductor.asyncio_client.telemetry.metrics_collector.serve_metrics') as mock_serve, \
+         patch('conductor.asyncio_client.telemetry.metrics_collector.write_to_textfile') as mock_write:
+        await AsyncMetricsCollector.provide_metrics(settings)
+    mock_serve.assert_called_once_with(settings)
+    mock_write.assert_not_called()
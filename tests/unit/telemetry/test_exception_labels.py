@@ -0,0 +1,32 @@
+import logging
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from conductor.shared.telemetry.exception_labels import OTHER_EXCEPTION_LABEL, ExceptionLabels
+
+
+def test_label_uses_exception_class():
+    exception_labels = ExceptionLabels()
+    assert exception_labels.label(ValueError("task_id_1 failed")) == "ValueError"
+    assert exception_labels.label(ValueError("task_id_2 failed")) == "ValueError"
+    assert exception_labels.label(RequestsConnectionError) == "requests.exceptions.ConnectionError"
+
+
+def test_label_over_max_labels_is_other():
+    exception_labels = ExceptionLabels(max_labels=2)
+    assert exception_labels.label(ValueError()) == "ValueError"
+    assert exception_labels.label(KeyError()) == "KeyError"
+    assert exception_labels.label(TypeError()) == OTHER_EXCEPTION_LABEL
+    assert exception_labels.label(ValueError()) == "ValueError"
+
+
+def test_label_samples_messages(caplog):
+    exception_labels = ExceptionLabels(sample_interval=60)
+    with caplog.at_level(logging.INFO, logger="conductor.shared.telemetry.exception_labels"):
+        exception_labels.label(ValueError("first message"))
+        exception_labels.label(ValueError("second message"))
+        exception_labels.label(KeyError("other message"))
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    assert "first message" in messages[0]
+    assert "other message" in messages[1]
@@ -2,7 +2,7 @@ import logging
 
 import pytest
 
-from conductor.shared.configuration.settings.metrics_settings import MetricsSettings
+from conductor.shared.configuration.settings.metrics_settings import DEFAULT_LATENCY_BUCKETS, MetricsSettings
 
 
 @pytest.fixture(autouse=True)
@@ -30,3 +30,25 @@ def test_default_initialization_with_parameters():
     )
     assert metrics_settings.file_name == expected_file_name
     assert metrics_settings.update_interval == expected_update_interval
+
+
+def test_default_latency_buckets():
+    metrics_settings = MetricsSettings()
+    assert metrics_settings.latency_buckets == DEFAULT_LATENCY_BUCKETS
+
+
+def test_initialization_with_latency_buckets():
+    metrics_settings = MetricsSettings(latency_buckets=[0.1, 0.5, 1])
+    assert metrics_settings.latency_buckets == (0.1, 0.5, 1)
+
+
+def test_default_initialization_writes_to_file():
+    metrics_settings = MetricsSettings()
+    assert metrics_settings.http_port is None
+    assert metrics_settings.snapshot_ttl == 0
+
+
+def test_initialization_with_exception_label_settings():
+    metrics_settings = MetricsSettings(max_exception_labels=5, exception_sample_interval=10.0)
+    assert metrics_settings.max_exception_labels == 5
+    assert metrics_settings.exception_sample_interval == 10.0
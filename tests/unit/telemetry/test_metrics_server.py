@@ -0,0 +1,71 @@
+import logging
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from conductor.shared.telemetry.metrics_server import MetricsServer, MetricsSnapshot
+
+
+@pytest.fixture(autouse=True)
+def disable_logging():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def metrics_server(tmp_path):
+    server = MetricsServer(MetricsSnapshot(str(tmp_path)), host="127.0.0.1", port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_snapshot_is_collected_on_every_request_without_ttl(tmp_path):
+    snapshot = MetricsSnapshot(str(tmp_path))
+    with patch("conductor.shared.telemetry.metrics_server.generate_latest", return_value=b"") as generate:
+        snapshot.get()
+        snapshot.get()
+    assert generate.call_count == 2
+
+
+def test_snapshot_is_reused_within_ttl(tmp_path):
+    snapshot = MetricsSnapshot(str(tmp_path), ttl=60)
+    with patch("conductor.shared.telemetry.metrics_server.generate_latest", return_value=b"metrics") as generate:
+        assert snapshot.get() == b"metrics"
+        assert snapshot.get() == b"metrics"
+    generate.assert_called_once()
+
+
+def test_snapshot_is_refreshed_after_ttl(tmp_path):
+    snapshot = MetricsSnapshot(str(tmp_path), ttl=60)
+    with patch("conductor.shared.telemetry.metrics_server.generate_latest", side_effect=[b"old", b"new"]), \
+         patch("conductor.shared.telemetry.metrics_server.time.monotonic", side_effect=[0, 61]):
+        assert snapshot.get() == b"old"
+        assert snapshot.get() == b"new"
+
+
+def test_server_serves_snapshot(metrics_server):
+    with patch.object(metrics_server._server.snapshot, "get", return_value=b"task_poll_total 1.0\n"):
+        url = f"http://127.0.0.1:{metrics_server.port}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.status == 200
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert response.read() == b"task_poll_total 1.0\n"
+
+
+def test_server_rejects_unknown_path(metrics_server):
+    url = f"http://127.0.0.1:{metrics_server.port}/unknown"
+    with pytest.raises(urllib.error.HTTPError) as e:
+        urllib.request.urlopen(url, timeout=5)
+    assert e.value.code == 404
+
+
+def test_server_reports_collection_failure(metrics_server):
+    with patch.object(metrics_server._server.snapshot, "get", side_effect=Exception("corrupted file")):
+        url = f"http://127.0.0.1:{metrics_server.port}/metrics"
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(url, timeout=5)
+    assert e.value.code == 500
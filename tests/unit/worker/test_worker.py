@@ -1,4 +1,7 @@
+import asyncio
+import importlib
 import logging
+import pickle
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -332,3 +335,62 @@ def test_execute_with_task_result_returning_function(mock_task):
     assert result.workflow_instance_id == "test_workflow_id"
     assert result.status == TaskResultStatus.IN_PROGRESS
     assert result.output_data == {"custom_result": "value1_42"}
+
+
+def test_execute_with_async_function(mock_task):
+    async def func(param1: str, param2: int = 10):
+        return f"{param1}_{param2}"
+
+    worker = Worker(task_definition_name="test_task", execute_function=func)
+    assert worker.is_async() is True
+    result = asyncio.run(worker.execute(mock_task))
+    assert result.status == TaskResultStatus.COMPLETED
+    assert result.output_data == {"result": "value1_42"}
+
+
+def test_execute_with_async_function_failure(mock_task):
+    async def func(param1: str):
+        raise NonRetryableException("terminal")
+
+    worker = Worker(task_definition_name="test_task", execute_function=func)
+    result = asyncio.run(worker.execute_async(mock_task))
+    assert result.status == TaskResultStatus.FAILED_WITH_TERMINAL_ERROR
+    assert result.reason_for_incompletion == "terminal"
+
+
+def test_is_async_with_sync_function(worker):
+    assert worker.is_async() is False
+
+
+def module_level_execute_function(param1: str):
+    return param1
+
+
+def test_worker_is_picklable():
+    worker = Worker(
+        task_definition_name="test_task",
+        execute_function=module_level_execute_function,
+        worker_id="test_worker_id",
+    )
+    restored = pickle.loads(pickle.dumps(worker))
+    assert restored.worker_id == worker.worker_id
+    assert restored.api_client is not None
+
+
+def test_worker_with_decorated_function_is_picklable(monkeypatch):
+    from conductor.asyncio_client.automator import task_handler
+    monkeypatch.setattr(task_handler, "_decorated_functions", {})
+    from tests.unit.resources import process_workers
+    importlib.reload(process_workers)
+    func = task_handler._decorated_functions[("process_task", None)]["func"]
+    worker = Worker(task_definition_name="process_task", execute_function=func)
+    restored = pickle.loads(pickle.dumps(worker))
+    assert restored.execute_function is func
+
+
+def test_execute_does_not_introspect_function_per_task(worker, mock_task):
+    with patch("inspect.signature") as signature:
+        result = worker.execute(mock_task)
+    signature.assert_not_called()
+    assert result.status == TaskResultStatus.COMPLETED
+    assert result.output_data == {"result": {"result": "value1_42"}}
@@ -640,4 +640,50 @@ def test_inline_sub_workflow_task_to_workflow_task():
             call_args = mock_params_class.call_args
             assert call_args[1]["name"] == "test_workflow"
             assert call_args[1]["version"] == 1
-            assert result is not None 
\ No newline at end of file
+            assert result is not None 
+
+
+@pytest.mark.asyncio
+async def test_inline_definition_is_built_once(conductor_workflow, mock_executor):
+    mock_executor.start_workflow.return_value = "workflow_id"
+    with patch.object(
+        conductor_workflow, "to_workflow_def", wraps=conductor_workflow.to_workflow_def
+    ) as to_workflow_def:
+        await conductor_workflow.start_workflow_with_input({"a": 1})
+        await conductor_workflow.start_workflow_with_input({"a": 2})
+        assert to_workflow_def.call_count == 1
+        conductor_workflow.timeout_seconds(10)
+        await conductor_workflow.start_workflow_with_input({"a": 3})
+        assert to_workflow_def.call_count == 2
+    request = mock_executor.start_workflow.call_args[0][0]
+    assert request.workflow_def.timeout_seconds == 10
+
+
+@pytest.mark.asyncio
+async def test_registered_definition_is_referenced(conductor_workflow, mock_executor):
+    mock_executor.start_workflow.return_value = "workflow_id"
+    conductor_workflow.inline_definition(False)
+    await conductor_workflow.start_workflow_with_input({"a": 1})
+    await conductor_workflow.start_workflow_with_input({"a": 2})
+    assert mock_executor.register_workflow.call_count == 1
+    request = mock_executor.start_workflow.call_args[0][0]
+    assert request.workflow_def is None
+    assert request.name == "test_workflow"
+    assert request.version == 1
+    conductor_workflow.output_parameter("key", "value")
+    await conductor_workflow.start_workflow_with_input({"a": 3})
+    assert mock_executor.register_workflow.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_variants_with_the_same_name_and_version_register_again(conductor_workflow, mock_executor):
+    mock_executor.start_workflow.return_value = "workflow_id"
+    variant = AsyncConductorWorkflow(mock_executor, "test_workflow", 1, "Test workflow")
+    variant.output_parameter("key", "value")
+    conductor_workflow.inline_definition(False)
+    variant.inline_definition(False)
+    await conductor_workflow.start_workflow_with_input()
+    await variant.start_workflow_with_input()
+    await conductor_workflow.start_workflow_with_input()
+    assert mock_executor.register_workflow.call_count == 3
+    assert not mock_executor.register_workflow.call_args[0][0].output_parameters
@@ -0,0 +1,112 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from conductor.client.http.api_client import ApiClient
+from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+from conductor.client.workflow.executor.workflow_executor import WorkflowExecutor
+from conductor.client.workflow.task.simple_task import SimpleTask
+
+
+@pytest.fixture
+def mock_executor():
+    executor = MagicMock(spec=WorkflowExecutor)
+    executor.workflow_client = MagicMock()
+    executor.workflow_client.api_client = ApiClient()
+    executor.start_workflow.return_value = "workflow_id"
+    return executor
+
+
+@pytest.fixture
+def conductor_workflow(mock_executor):
+    workflow = ConductorWorkflow(mock_executor, "test_workflow", 1)
+    workflow >> SimpleTask("simple", "simple_ref")
+    return workflow
+
+
+def test_inline_definition_is_built_once(conductor_workflow, mock_executor):
+    with patch.object(
+        conductor_workflow, "to_workflow_def", wraps=conductor_workflow.to_workflow_def
+    ) as to_workflow_def:
+        conductor_workflow.start_workflow_with_input({"a": 1})
+        conductor_workflow.start_workflow_with_input({"a": 2})
+        assert to_workflow_def.call_count == 1
+        conductor_workflow >> SimpleTask("simple", "simple_ref_2")
+        conductor_workflow.start_workflow_with_input({"a": 3})
+        assert to_workflow_def.call_count == 2
+    request = mock_executor.start_workflow.call_args[0][0]
+    assert len(request.workflow_def.tasks) == 2
+    mock_executor.register_workflow.assert_not_called()
+
+
+def test_registered_definition_is_referenced(conductor_workflow, mock_executor):
+    conductor_workflow.inline_definition(False)
+    conductor_workflow.start_workflow_with_input({"a": 1})
+    conductor_workflow.start_workflow_with_input({"a": 2})
+    assert mock_executor.register_workflow.call_count == 1
+    request = mock_executor.start_workflow.call_args[0][0]
+    assert request.workflow_def is None
+    assert (request.name, request.version) == ("test_workflow", 1)
+
+
+def test_registered_definition_is_registered_again_after_a_change(conductor_workflow, mock_executor):
+    conductor_workflow.inline_definition(False)
+    conductor_workflow.start_workflow_with_input()
+    conductor_workflow.timeout_seconds(60)
+    conductor_workflow.start_workflow_with_input()
+    # the same content hashes the same
+    assert mock_executor.register_workflow.call_count == 1
+    conductor_workflow.output_parameter("key", "value")
+    conductor_workflow.start_workflow_with_input()
+    assert mock_executor.register_workflow.call_count == 2
+    assert mock_executor.register_workflow.call_args[0][0].output_parameters == {"key": "value"}
+
+
+def test_variants_with_the_same_name_and_version_register_again(conductor_workflow, mock_executor):
+    variant = ConductorWorkflow(mock_executor, "test_workflow", 1)
+    variant >> SimpleTask("other", "other_ref")
+    conductor_workflow.inline_definition(False)
+    variant.inline_definition(False)
+    conductor_workflow.start_workflow_with_input()
+    variant.start_workflow_with_input()
+    conductor_workflow.start_workflow_with_input()
+    assert mock_executor.register_workflow.call_count == 3
+    assert mock_executor.register_workflow.call_args[0][0].tasks[0].name == "simple"
+    # an identical copy finds its definition already registered
+    copy = ConductorWorkflow(mock_executor, "test_workflow", 1)
+    copy >> SimpleTask("simple", "simple_ref")
+    copy.inline_definition(False)
+    copy.start_workflow_with_input()
+    assert mock_executor.register_workflow.call_count == 3
+
+
+def test_registration_does_not_block_other_workflows(conductor_workflow, mock_executor):
+    registering = threading.Event()
+    release = threading.Event()
+
+    def register_workflow(workflow_def, overwrite):
+        registering.set()
+        release.wait(5)
+
+    mock_executor.register_workflow.side_effect = register_workflow
+    conductor_workflow.inline_definition(False)
+    thread = threading.Thread(target=conductor_workflow.start_workflow_with_input)
+    thread.start()
+    try:
+        assert registering.wait(5)
+        other_executor = MagicMock(spec=WorkflowExecutor)
+        other_executor.workflow_client = MagicMock()
+        other_executor.workflow_client.api_client = ApiClient()
+        other = ConductorWorkflow(other_executor, "other_workflow", 1).inline_definition(False)
+        finished = threading.Event()
+        threading.Thread(target=lambda: (other.start_workflow_with_input(), finished.set())).start()
+        assert finished.wait(5)
+    finally:
+        release.set()
+        thread.join()
+
+
+def test_inline_definition_invalid_type(conductor_workflow):
+    with pytest.raises(Exception, match="invalid type"):
+        conductor_workflow.inline_definition("false")